@@ -0,0 +1,175 @@
+"""
+Gas benchmark harness.
+
+Run with `ape test benchmarks`. Each benchmark records the gas used by a call
+through the `gas_recorder` fixture. At the end of the session, the recorded values
+are compared against `benchmarks/gas_snapshot.json`, a diff table is printed, and
+the session fails if any call regresses by more than `--gas-threshold` percent.
+
+Pass `--gas-snapshot-update` to write the recorded values to the snapshot file.
+Entries that were not recorded in the session are kept as they are, so a subset of
+the benchmarks can be run and updated on its own.
+
+Measurements that are not deterministic, such as wall-clock timings, can be reported
+with `gas_recorder.note`. They are printed after the diff table and never compared.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+SNAPSHOT_PATH = Path(__file__).parent / "gas_snapshot.json"
+
+DEFAULT_THRESHOLD = 1.0
+
+
+class GasRecorder:
+    """
+    Collects the gas used per call, keyed by `<contract>.<label>`.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.rows = []
+        self.notes = []
+
+    def record(self, contract, label, receipt):
+        return self.record_gas(contract, label, receipt.gas_used)
+
+    def record_gas(self, contract, label, gas_used):
+        self.results[f"{contract}.{label}"] = gas_used
+        return gas_used
+
+    def note(self, contract, label, text):
+        self.notes.append(f"{contract}.{label}: {text}")
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    if not path.exists():
+        return {}
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_snapshot(snapshot, path=SNAPSHOT_PATH):
+    with open(path, "w") as f:
+        json.dump(dict(sorted(snapshot.items())), f, indent=4)
+        f.write("\n")
+
+
+def compare(snapshot, results, threshold):
+    """
+    Compare recorded gas against a snapshot.
+
+    Returns a list of `(key, previous, current, is_regression)` tuples for every
+    recorded key whose gas differs from the snapshot, including keys that are not in
+    the snapshot yet (`previous` is None).
+    """
+    rows = []
+    for key, current in sorted(results.items()):
+        previous = snapshot.get(key)
+        if previous == current:
+            continue
+
+        is_regression = previous is not None and current > previous * (
+            1 + threshold / 100
+        )
+        rows.append((key, previous, current, is_regression))
+
+    return rows
+
+
+def format_rows(rows):
+    lines = [f"{'call':<48}{'snapshot':>12}{'current':>12}{'diff':>12}{'%':>10}"]
+    for key, previous, current, is_regression in rows:
+        if previous is None:
+            lines.append(f"{key:<48}{'-':>12}{current:>12}{'new':>12}{'':>10}")
+            continue
+
+        diff = current - previous
+        pct = diff / previous * 100
+        marker = "  <-- regression" if is_regression else ""
+        lines.append(
+            f"{key:<48}{previous:>12}{current:>12}{diff:>+12}{pct:>+9.2f}%{marker}"
+        )
+
+    return lines
+
+
+_recorder = GasRecorder()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("gas snapshot")
+    group.addoption(
+        "--gas-threshold",
+        action="store",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Maximum allowed gas increase per call in percent (default: %(default)s).",
+    )
+    group.addoption(
+        "--gas-snapshot-update",
+        action="store_true",
+        help="Write the recorded gas values to the snapshot file.",
+    )
+
+
+def pytest_configure(config):
+    # Each worker would record and write the snapshot on its own
+    if getattr(config.option, "numprocesses", None):
+        raise pytest.UsageError("Gas benchmarks must be run without -n")
+
+
+@pytest.fixture(scope="session")
+def gas_recorder():
+    yield _recorder
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    snapshot = load_snapshot()
+    _recorder.rows = compare(
+        snapshot, _recorder.results, config.getoption("--gas-threshold")
+    )
+
+    if config.getoption("--gas-snapshot-update"):
+        snapshot.update(_recorder.results)
+        write_snapshot(snapshot)
+
+    elif any(row[3] for row in _recorder.rows):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if _recorder.results:
+        write_diff(terminalreporter, config)
+
+    if _recorder.notes:
+        terminalreporter.section("benchmark notes")
+        for line in _recorder.notes:
+            terminalreporter.write_line(line)
+
+
+def write_diff(terminalreporter, config):
+    terminalreporter.section(
+        f"gas snapshot diff (threshold {config.getoption('--gas-threshold')}%)"
+    )
+    is_update = config.getoption("--gas-snapshot-update")
+    if is_update:
+        terminalreporter.write_line(f"Snapshot updated: {SNAPSHOT_PATH}")
+
+    if not _recorder.rows:
+        terminalreporter.write_line("No changes against snapshot.")
+    else:
+        for line in format_rows(_recorder.rows):
+            terminalreporter.write_line(line)
+
+    regressions = [row[0] for row in _recorder.rows if row[3]]
+    if regressions and not is_update:
+        terminalreporter.write_line(
+            f"{len(regressions)} call(s) regressed past the threshold: "
+            + ", ".join(regressions)
+        )
@@ -0,0 +1,217 @@
+import time
+
+import pytest
+from eth_account import Account
+from eth_utils import to_checksum_address
+
+from benchmarks.transactions import send_signed
+from utils.starknet_messaging import L2Bridge
+
+L2_CONTRACT_ADDRESS = 0x1234
+L2_USER_ADDRESS = 0x5678
+
+# Number of deposit and withdrawal cycles, and number of cycles per state update
+BRIDGE_CYCLE_COUNT = 2000
+BRIDGE_ROUND_SIZE = 100
+
+DEPOSIT_BATCH_SIZES = [1, 10, 50, 100]
+
+WITHDRAW_BATCH_SIZES = [1, 10, 50, 100]
+
+
+@pytest.fixture(scope="module")
+def token(accounts, project):
+    yield project.ERC20.deploy("Starknet Token", "STNT", 18, 1000, sender=accounts[0])
+
+
+@pytest.fixture(scope="module")
+def core(accounts, project):
+    yield project.MockStarknetCore.deploy(sender=accounts[0])
+
+
+@pytest.fixture(scope="module")
+def bridge(accounts, project, token, core):
+    c = project.Bridge.deploy(token.address, core.address, sender=accounts[0])
+    token.approve(c.address, 1000 * 10**18, sender=accounts[0])
+    yield c
+
+
+def test_bridge(accounts, core, bridge, gas_recorder):
+    l2 = L2Bridge(core, L2_CONTRACT_ADDRESS, bridge)
+
+    tx = bridge.deposit(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 100, sender=accounts[0])
+    gas_recorder.record("Bridge", "deposit", tx)
+
+    l2.poll()
+    l2.withdraw(L2_USER_ADDRESS, accounts[0].address, 40)
+    l2.update_state(sender=accounts[0])
+
+    tx = bridge.withdraw(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 40, sender=accounts[0])
+    gas_recorder.record("Bridge", "withdraw", tx)
+
+
+def test_bridge_deposit_batch(accounts, bridge, gas_recorder):
+    """
+    Deposit with `depositBatch` in batches of `DEPOSIT_BATCH_SIZES`, and with `deposit`,
+    to new L2 users. A deposit is made first, so that no batch sets the nonce of the
+    core from zero.
+    """
+    bridge.deposit(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 100, sender=accounts[0])
+    user = L2_USER_ADDRESS + 1
+
+    tx = bridge.deposit(L2_CONTRACT_ADDRESS, user, 100, sender=accounts[0])
+    per_user = [f"deposit {tx.gas_used}"]
+    user += 1
+
+    for size in DEPOSIT_BATCH_SIZES:
+        users = list(range(user, user + size))
+        tx = bridge.depositBatch(
+            L2_CONTRACT_ADDRESS, users, [100] * size, sender=accounts[0]
+        )
+        gas_recorder.record("Bridge", f"deposit_batch_{size}", tx)
+        per_user.append(f"batch of {size} {tx.gas_used // size}")
+        user += size
+
+    gas_recorder.note("Bridge", "deposit_batch", "gas per user: " + ", ".join(per_user))
+
+
+def test_bridge_withdraw_batch(accounts, core, bridge, gas_recorder):
+    """
+    Withdraw with `withdraw`, and with `withdrawBatch` in batches of
+    `WITHDRAW_BATCH_SIZES`, to L1 recipients that hold no tokens.
+    """
+    l2 = L2Bridge(core, L2_CONTRACT_ADDRESS, bridge)
+    count = 1 + sum(WITHDRAW_BATCH_SIZES)
+    users = [L2_USER_ADDRESS + i for i in range(count)]
+    recipients = [accounts[1].address] + [
+        to_checksum_address((0x1000 + i).to_bytes(20, "big")) for i in range(count - 1)
+    ]
+
+    for start in range(0, count, BRIDGE_ROUND_SIZE):
+        stop = start + BRIDGE_ROUND_SIZE
+        batch = users[start:stop]
+        bridge.depositBatch(
+            L2_CONTRACT_ADDRESS, batch, [100] * len(batch), sender=accounts[0]
+        )
+
+    l2.poll()
+    for user, recipient in zip(users, recipients):
+        l2.withdraw(user, recipient, 100)
+    l2.update_state(sender=accounts[0])
+
+    tx = bridge.withdraw(L2_CONTRACT_ADDRESS, users[0], 100, sender=accounts[1])
+    per_withdrawal = [f"withdraw {tx.gas_used}"]
+
+    start = 1
+    for size in WITHDRAW_BATCH_SIZES:
+        stop = start + size
+        tx = bridge.withdrawBatch(
+            L2_CONTRACT_ADDRESS,
+            users[start:stop],
+            recipients[start:stop],
+            [100] * size,
+            sender=accounts[0],
+        )
+        assert not list(tx.decode_logs(bridge.WithdrawalFailed))
+
+        gas_recorder.record("Bridge", f"withdraw_batch_{size}", tx)
+        per_withdrawal.append(f"batch of {size} {tx.gas_used // size}")
+        start = stop
+
+    gas_recorder.note(
+        "Bridge", "withdraw_batch", "gas per withdrawal: " + ", ".join(per_withdrawal)
+    )
+
+
+def test_bridge_throughput(accounts, chain, token, core, bridge, gas_recorder):
+    """
+    Deposit and withdraw `BRIDGE_CYCLE_COUNT` times, with a state update of the
+    simulated Starknet after every `BRIDGE_ROUND_SIZE` deposits, which consumes them and
+    sends their withdrawals to L1. Each cycle deposits to, and withdraws from, a
+    different L2 user.
+    """
+    web3 = chain.provider.web3
+    chain_id = chain.chain_id
+    max_fee = 10 * web3.eth.get_block("latest")["baseFeePerGas"]
+    sender = Account.from_key(accounts[0].private_key)
+    l2 = L2Bridge(core, L2_CONTRACT_ADDRESS, bridge)
+
+    def sign(nonce, data):
+        return sender.sign_transaction(
+            {
+                "chainId": chain_id,
+                "nonce": nonce,
+                "to": bridge.address,
+                "data": data,
+                "gas": 200000,
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": 0,
+            }
+        )
+
+    deposit_gas = []
+    withdraw_gas = []
+    update_gas = []
+    deposit_time = withdraw_time = 0
+    start = time.perf_counter()
+    for round_start in range(0, BRIDGE_CYCLE_COUNT, BRIDGE_ROUND_SIZE):
+        users = [L2_USER_ADDRESS + round_start + i for i in range(BRIDGE_ROUND_SIZE)]
+
+        round_time = time.perf_counter()
+        nonce = accounts[0].nonce
+        deposit_gas.extend(
+            send_signed(
+                web3,
+                [
+                    sign(
+                        nonce + i,
+                        bridge.deposit.encode_input(L2_CONTRACT_ADDRESS, user, 100),
+                    )
+                    for i, user in enumerate(users)
+                ],
+            )
+        )
+        deposit_time += time.perf_counter() - round_time
+
+        assert l2.poll() == BRIDGE_ROUND_SIZE
+        for user in users:
+            l2.withdraw(user, sender.address, 100)
+        update_gas.extend(tx.gas_used for tx in l2.update_state(sender=accounts[0]))
+
+        round_time = time.perf_counter()
+        nonce = accounts[0].nonce
+        withdraw_gas.extend(
+            send_signed(
+                web3,
+                [
+                    sign(
+                        nonce + i,
+                        bridge.withdraw.encode_input(L2_CONTRACT_ADDRESS, user, 100),
+                    )
+                    for i, user in enumerate(users)
+                ],
+            )
+        )
+        withdraw_time += time.perf_counter() - round_time
+
+    elapsed = time.perf_counter() - start
+
+    assert token.balanceOf(bridge) == 0
+    assert not any(l2.balances.values())
+
+    # The first deposit also sets the nonce of the core from zero
+    gas_recorder.record_gas("Bridge", "deposit_cycle", deposit_gas[-1])
+    gas_recorder.record_gas("Bridge", "withdraw_cycle", withdraw_gas[-1])
+    gas_recorder.record_gas(
+        "MockStarknetCore", f"update_state_{BRIDGE_ROUND_SIZE}", update_gas[-1]
+    )
+
+    gas_recorder.note(
+        "Bridge",
+        f"{BRIDGE_CYCLE_COUNT}_cycles",
+        f"deposit {min(deposit_gas)}-{max(deposit_gas)} gas, "
+        f"{BRIDGE_CYCLE_COUNT / deposit_time:.1f} ops/s; "
+        f"withdraw {min(withdraw_gas)}-{max(withdraw_gas)} gas, "
+        f"{BRIDGE_CYCLE_COUNT / withdraw_time:.1f} ops/s; "
+        f"{BRIDGE_CYCLE_COUNT / elapsed:.1f} cycles/s",
+    )
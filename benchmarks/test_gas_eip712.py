@@ -0,0 +1,161 @@
+import pytest
+from eip712.messages import EIP712Message
+
+from utils.signing import to_compact
+
+PERMIT_BATCH_SIZES = [10, 100]
+
+
+def encode_rsv(signature):
+    """
+    Encode a signature as r, s and v. Test accounts strip the leading zero bytes of r
+    and s, so they are padded back to 32 bytes.
+    """
+    return (
+        signature.r.rjust(32, b"\0")
+        + signature.s.rjust(32, b"\0")
+        + signature.v.to_bytes(1, "big")
+    )
+
+
+@pytest.fixture(scope="module")
+def eip4494(accounts, project):
+    c = project.EIP4494.deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    c.mint(accounts[1], "1.json", sender=accounts[0])
+    c.mint(accounts[1], "2.json", sender=accounts[0])
+    yield c
+
+
+@pytest.fixture(scope="module")
+def plain_eip712(accounts, project):
+    yield project.plain_EIP712.deploy(sender=accounts[0])
+
+
+def test_permit(accounts, chain, eip4494, gas_recorder):
+    class Permit(EIP712Message):
+
+        # EIP-712 fields
+        _name_: "string" = "Vyper EIP4494"
+        _version_: "string" = "1.0.0"
+        _chainId_: "uint256" = chain.chain_id
+        _verifyingContract_: "address" = eip4494.address
+
+        # EIP-4494 fields
+        spender: "address"
+        tokenId: "uint256"
+        nonce: "uint256"
+        deadline: "uint256"
+
+    permit = Permit(
+        spender=accounts[2].address,
+        tokenId=1,
+        nonce=eip4494.nonces(1),
+        deadline=chain.pending_timestamp + 10000,
+    )
+    signed = accounts[1].sign_message(permit.signable_message)
+
+    tx = eip4494.permit(
+        permit.spender,
+        permit.tokenId,
+        permit.deadline,
+        encode_rsv(signed),
+        sender=accounts[2],
+    )
+    gas_recorder.record("EIP4494", "permit", tx)
+
+    # Permit of another token with an EIP-2098 compact signature
+    permit = Permit(
+        spender=accounts[2].address,
+        tokenId=2,
+        nonce=eip4494.nonces(2),
+        deadline=permit.deadline,
+    )
+    signature = to_compact(
+        encode_rsv(accounts[1].sign_message(permit.signable_message))
+    )
+    tx = eip4494.permitCompact(
+        permit.spender,
+        permit.tokenId,
+        permit.deadline,
+        signature[:32],
+        signature[32:],
+        sender=accounts[2],
+    )
+    gas_recorder.record("EIP4494", "permitCompact", tx)
+
+
+@pytest.mark.parametrize("n", PERMIT_BATCH_SIZES)
+def test_permitBatch(accounts, chain, eip4494, gas_recorder, n):
+    class Permit(EIP712Message):
+
+        # EIP-712 fields
+        _name_: "string" = "Vyper EIP4494"
+        _version_: "string" = "1.0.0"
+        _chainId_: "uint256" = chain.chain_id
+        _verifyingContract_: "address" = eip4494.address
+
+        # EIP-4494 fields
+        spender: "address"
+        tokenId: "uint256"
+        nonce: "uint256"
+        deadline: "uint256"
+
+    first_token_id = eip4494.totalSupply() + 1
+    eip4494.mintBatch([accounts[1]] * n, ["1.json"] * n, sender=accounts[0])
+
+    token_ids = list(range(first_token_id, first_token_id + n))
+    deadline = chain.pending_timestamp + 10000
+    signatures = [
+        encode_rsv(
+            accounts[1].sign_message(
+                Permit(
+                    spender=accounts[2].address,
+                    tokenId=token_id,
+                    nonce=0,
+                    deadline=deadline,
+                ).signable_message
+            )
+        )
+        for token_id in token_ids
+    ]
+
+    tx = eip4494.permitBatch(
+        [accounts[2].address] * n,
+        token_ids,
+        [deadline] * n,
+        signatures,
+        sender=accounts[2],
+    )
+    assert not list(tx.decode_logs(eip4494.PermitFailed))
+    gas_recorder.record("EIP4494", f"permitBatch_x{n}", tx)
+
+
+def test_message(accounts, chain, plain_eip712, gas_recorder):
+    class Message(EIP712Message):
+
+        # EIP-712 fields
+        _name_: "string" = "Plain"
+        _version_: "string" = "1.0.0"
+        _chainId_: "uint256" = chain.chain_id
+        _verifyingContract_: "address" = plain_eip712.address
+
+        sms: "uint256"
+
+    signed = accounts[1].sign_message(Message(sms=12).signable_message)
+
+    tx = plain_eip712.message(12, encode_rsv(signed), sender=accounts[1])
+    gas_recorder.record("plain_EIP712", "message", tx)
+
+    signature = to_compact(encode_rsv(signed))
+    tx = plain_eip712.messageCompact(
+        12, signature[:32], signature[32:], sender=accounts[1]
+    )
+    gas_recorder.record("plain_EIP712", "messageCompact", tx)
@@ -0,0 +1,68 @@
+import pytest
+
+# ERC-721 variants sharing the same constructor and transfer, mint and burn functions
+ERC721_CONTRACTS = ["ERC721", "ERC721A", "EIP4494", "timed_ERC721", "timer"]
+
+
+@pytest.fixture(scope="module", params=ERC721_CONTRACTS)
+def erc721(request, accounts, project):
+    c = getattr(project, request.param).deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+
+    # Mint 3 tokens so that transfers and burns swap within the enumeration lists
+    for i in range(1, 4):
+        c.mint(accounts[0], f"{i}.json", sender=accounts[0])
+
+    yield c
+
+
+def test_mint(accounts, erc721, gas_recorder):
+    name = erc721.contract_type.name
+
+    tx = erc721.mint(accounts[1], "4.json", sender=accounts[0])
+    gas_recorder.record(name, "mint", tx)
+
+    tx = erc721.mint(accounts[1], "5.json", sender=accounts[0])
+    gas_recorder.record(name, "mint_existing_owner", tx)
+
+
+def test_transferFrom(accounts, erc721, gas_recorder):
+    name = erc721.contract_type.name
+
+    tx = erc721.transferFrom(accounts[0], accounts[1], 1, sender=accounts[0])
+    gas_recorder.record(name, "transferFrom", tx)
+
+    erc721.approve(accounts[2], 2, sender=accounts[0])
+    tx = erc721.transferFrom(accounts[0], accounts[1], 2, sender=accounts[2])
+    gas_recorder.record(name, "transferFrom_approved", tx)
+
+
+def test_safeTransferFrom(accounts, erc721, gas_recorder):
+    name = erc721.contract_type.name
+
+    tx = erc721.safeTransferFrom(accounts[0], accounts[1], 1, sender=accounts[0])
+    gas_recorder.record(name, "safeTransferFrom", tx)
+
+
+def test_approve(accounts, erc721, gas_recorder):
+    name = erc721.contract_type.name
+
+    tx = erc721.approve(accounts[1], 1, sender=accounts[0])
+    gas_recorder.record(name, "approve", tx)
+
+    tx = erc721.setApprovalForAll(accounts[1], True, sender=accounts[0])
+    gas_recorder.record(name, "setApprovalForAll", tx)
+
+
+def test_burn(accounts, erc721, gas_recorder):
+    name = erc721.contract_type.name
+
+    tx = erc721.burn(1, sender=accounts[0])
+    gas_recorder.record(name, "burn", tx)
@@ -0,0 +1,40 @@
+import pytest
+
+# Number of tokens held by the owner queried
+BALANCES = [1, 10, 50]
+
+
+@pytest.fixture(scope="module", params=["NTT", "NTT_delegate"])
+def ntt(request, accounts, project):
+    yield getattr(project, request.param).deploy(
+        "Non-Tradable Token", "NTT", "https://ntt.com", 100, sender=accounts[0]
+    )
+
+
+def mint(ntt, recipient, sender):
+    if ntt.contract_type.name == "NTT":
+        return ntt.mint(recipient, "/1.json", sender=sender)
+
+    return ntt.mint(recipient, sender=sender)
+
+
+@pytest.mark.parametrize("n", BALANCES)
+def test_hasValidToken(accounts, ntt, gas_recorder, n):
+    name = ntt.contract_type.name
+    owner = accounts[BALANCES.index(n) + 1]
+
+    # Only the last token of the owner is valid
+    token_ids = []
+    for _ in range(n):
+        mint(ntt, owner, accounts[0])
+        token_ids.append(ntt.total())
+
+    for token_id in token_ids[:-1]:
+        ntt.invalidate(token_id, sender=accounts[0])
+
+    tx = ntt.hasValidToken.transact(owner, sender=accounts[0])
+    gas_recorder.record(name, f"hasValidToken_last_of_x{n}", tx)
+
+    ntt.invalidate(token_ids[-1], sender=accounts[0])
+    tx = ntt.hasValidToken.transact(owner, sender=accounts[0])
+    gas_recorder.record(name, f"hasValidToken_none_of_x{n}", tx)
@@ -0,0 +1,48 @@
+import pytest
+
+from utils.indexer import EventIndexer
+
+# Number of tokens minted per transaction, and number of transactions
+MINT_BATCH_SIZE = 100
+MINT_BATCHES = 50
+
+BATCH_SIZES = [10, 100, 1000]
+
+
+@pytest.fixture(scope="module")
+def erc721(accounts, chain, project):
+    c = project.ERC721.deploy(
+        "Test Token",
+        "TST",
+        "",
+        MINT_BATCH_SIZE * MINT_BATCHES,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    # Spread the tokens of each batch over 4 recipients, grouped together
+    holders = [accounts[i].address for i in range(1, 5)]
+    recipients = [holders[i * 4 // MINT_BATCH_SIZE] for i in range(MINT_BATCH_SIZE)]
+    for _ in range(MINT_BATCHES):
+        c.mintBatch(recipients, [""] * MINT_BATCH_SIZE, sender=accounts[0])
+        # Let the base fee settle between large transactions
+        chain.mine()
+
+    yield c
+
+
+def test_ingest(erc721, gas_recorder, tmp_path):
+    # Every batch size indexes the same chain, as the chain is reverted between tests
+    for batch_size in BATCH_SIZES:
+        indexer = EventIndexer(
+            tmp_path / f"events_{batch_size}.db", [erc721], batch_size=batch_size
+        )
+        count, elapsed = indexer.run()
+
+        assert count == MINT_BATCH_SIZE * MINT_BATCHES
+        assert indexer.owner_of(erc721, count) == erc721.ownerOf(count)
+        gas_recorder.note(
+            "indexer",
+            f"ingest_batch{batch_size}",
+            f"{count} events in {elapsed:.2f} s ({count / elapsed:.0f} events/s)",
+        )
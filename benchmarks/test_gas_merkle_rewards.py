@@ -0,0 +1,88 @@
+import random
+import time
+
+import pytest
+from eth_utils import to_checksum_address
+
+from utils.merkle_rewards import ZERO_ADDRESS, MerkleTree, RewardLedger
+
+EVENT_COUNT = 1_000_000
+
+HOLDER_COUNTS = [1024, 10_000]
+
+TOKEN_COUNT = 20_000
+
+
+def address(i):
+    return to_checksum_address((0x1000 + i).to_bytes(20, "big"))
+
+
+def iter_synthetic_transfers(holder_count, event_count, seed=0):
+    """
+    Yield `(timestamp, sender, receiver)` for a mint of every token, then random transfers
+    of the tokens between `holder_count` holders, one block per second.
+    """
+    rng = random.Random(seed)
+    holders = [address(i) for i in range(holder_count)]
+    owners = []
+    for token_id in range(TOKEN_COUNT):
+        owners.append(holders[token_id % holder_count])
+        yield token_id, ZERO_ADDRESS, owners[token_id]
+
+    for timestamp in range(TOKEN_COUNT, event_count):
+        token_id = rng.randrange(TOKEN_COUNT)
+        receiver = holders[rng.randrange(holder_count)]
+        yield timestamp, owners[token_id], receiver
+        owners[token_id] = receiver
+
+
+@pytest.fixture(scope="module")
+def distributor(accounts, project):
+    yield project.reward_distributor.deploy(sender=accounts[0])
+
+
+@pytest.fixture(scope="module")
+def erc20(accounts, project, distributor):
+    # A non-zero initial supply, so that the first claim does not pay to initialise it
+    c = project.ERC20_mintable.deploy(
+        "Mineable Token", "MNT", 18, 1, distributor.address, sender=accounts[0]
+    )
+    distributor.set_token_address(c.address, sender=accounts[0])
+    yield c
+
+
+@pytest.mark.parametrize("holder_count", HOLDER_COUNTS)
+def test_build_tree(gas_recorder, holder_count):
+    start = time.perf_counter()
+    ledger = RewardLedger()
+    for timestamp, sender, receiver in iter_synthetic_transfers(
+        holder_count, EVENT_COUNT
+    ):
+        ledger.apply(timestamp, sender, receiver)
+
+    replayed = time.perf_counter()
+    tree = MerkleTree(sorted(ledger.amounts(EVENT_COUNT)))
+
+    built = time.perf_counter()
+    proofs = sum(1 for _ in tree.iter_proofs())
+
+    done = time.perf_counter()
+    assert proofs == holder_count
+    gas_recorder.note(
+        "reward_distributor",
+        f"build_x{holder_count}_holders",
+        f"{EVENT_COUNT} events replayed in {replayed - start:.1f} s, "
+        f"tree built in {built - replayed:.2f} s, "
+        f"{proofs} proofs in {done - built:.2f} s",
+    )
+
+
+@pytest.mark.parametrize("holder_count", HOLDER_COUNTS)
+def test_claim(accounts, distributor, erc20, gas_recorder, holder_count):
+    claims = [(address(i), (i + 1) * 10**18) for i in range(holder_count)]
+    tree = MerkleTree(claims)
+    distributor.set_merkle_root(tree.root, sender=accounts[0])
+
+    holder, amount = claims[holder_count // 2]
+    tx = distributor.claim(holder, amount, tree.proof(holder), sender=accounts[1])
+    gas_recorder.record("reward_distributor", f"claim_depth{len(tree.levels)}", tx)
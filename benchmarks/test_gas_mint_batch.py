@@ -0,0 +1,55 @@
+import pytest
+
+# Number of tokens minted per batch
+BATCH_SIZES = [1, 10, 50]
+
+
+@pytest.fixture(
+    scope="module", params=["ERC721", "ERC721A", "EIP4494", "timed_ERC721", "timer"]
+)
+def erc721(request, accounts, project):
+    yield getattr(project, request.param).deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+
+
+def recipients(accounts, n):
+    # Spread the tokens over 4 recipients, grouped together
+    return [accounts[1 + i * 4 // n] for i in range(n)]
+
+
+@pytest.mark.parametrize("n", BATCH_SIZES)
+def test_mint_per_token(accounts, erc721, gas_recorder, n):
+    name = erc721.contract_type.name
+
+    gas_used = 0
+    for i, recipient in enumerate(recipients(accounts, n)):
+        tx = erc721.mint(recipient, f"{i}.json", sender=accounts[0])
+        gas_used += tx.gas_used
+
+    gas_recorder.record_gas(name, f"mint_per_token_x{n}", gas_used // n)
+
+
+@pytest.mark.parametrize("n", BATCH_SIZES)
+def test_mintBatch_per_token(accounts, erc721, gas_recorder, n):
+    name = erc721.contract_type.name
+
+    tx = erc721.mintBatch(
+        recipients(accounts, n), [f"{i}.json" for i in range(n)], sender=accounts[0]
+    )
+    gas_recorder.record(name, f"mintBatch_x{n}", tx)
+    gas_recorder.record_gas(name, f"mintBatch_per_token_x{n}", tx.gas_used // n)
+
+
+@pytest.mark.parametrize("n", BATCH_SIZES)
+def test_mintBatch_per_token_no_uri(accounts, erc721, gas_recorder, n):
+    name = erc721.contract_type.name
+
+    tx = erc721.mintBatch(recipients(accounts, n), [""] * n, sender=accounts[0])
+    gas_recorder.record_gas(name, f"mintBatch_per_token_no_uri_x{n}", tx.gas_used // n)
@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from utils.multicall import Multicall
+
+# Number of view calls read per page
+CALL_COUNTS = [10, 100]
+
+
+@pytest.fixture(scope="module")
+def erc721(accounts, project):
+    c = project.ERC721.deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    n = max(CALL_COUNTS)
+    c.mintBatch([accounts[1]] * n, [f"{i}.json" for i in range(n)], sender=accounts[0])
+    yield c
+
+
+@pytest.fixture(scope="module")
+def multicall(accounts, project):
+    yield project.Multicall.deploy(sender=accounts[0])
+
+
+@pytest.mark.parametrize("n", CALL_COUNTS)
+def test_ownerOf(accounts, erc721, multicall, gas_recorder, n):
+    token_ids = range(1, n + 1)
+
+    start = time.perf_counter()
+    sequential = [erc721.ownerOf(token_id) for token_id in token_ids]
+    sequential_time = time.perf_counter() - start
+
+    calls = Multicall(multicall)
+    for token_id in token_ids:
+        calls.add(erc721, "ownerOf", token_id)
+
+    start = time.perf_counter()
+    aggregated = calls()
+    aggregated_time = time.perf_counter() - start
+
+    assert aggregated == sequential
+
+    gas_used = sum(
+        erc721.ownerOf.transact(token_id, sender=accounts[0]).gas_used
+        for token_id in token_ids
+    )
+    gas_recorder.record_gas("Multicall", f"ownerOf_sequential_x{n}", gas_used)
+
+    tx = multicall.aggregate.transact(
+        [(target, calldata) for target, calldata, _ in calls.calls], sender=accounts[0]
+    )
+    gas_recorder.record("Multicall", f"ownerOf_aggregate_x{n}", tx)
+
+    gas_recorder.note(
+        "Multicall",
+        f"ownerOf_x{n}",
+        f"{n} sequential calls {sequential_time * 1000:.1f} ms, "
+        f"1 aggregated call {aggregated_time * 1000:.1f} ms "
+        f"({sequential_time / aggregated_time:.1f}x)",
+    )
@@ -0,0 +1,62 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def ntt(accounts, project):
+    c = project.NTT.deploy(
+        "Non-Tradable Token", "NTT", "https://ntt.com", 100, sender=accounts[0]
+    )
+    c.mint(accounts[1], "/1.json", sender=accounts[0])
+    yield c
+
+
+@pytest.fixture(scope="module")
+def ntt_delegate(accounts, project):
+    c = project.NTT_delegate.deploy(
+        "Non-Tradable Token", "NTT", "https://ntt.com", 100, sender=accounts[0]
+    )
+    c.mint(accounts[1], sender=accounts[0])
+    yield c
+
+
+def test_ntt(accounts, ntt, gas_recorder):
+    tx = ntt.mint(accounts[1], "/2.json", sender=accounts[0])
+    gas_recorder.record("NTT", "mint", tx)
+
+    tx = ntt.hasValidToken.transact(accounts[1], sender=accounts[0])
+    gas_recorder.record("NTT", "hasValidToken", tx)
+
+    tx = ntt.invalidate(1, sender=accounts[0])
+    gas_recorder.record("NTT", "invalidate", tx)
+
+    tx = ntt.hasValidToken.transact(accounts[3], sender=accounts[0])
+    gas_recorder.record("NTT", "hasValidToken_no_token", tx)
+
+
+def test_ntt_delegate(accounts, ntt_delegate, gas_recorder):
+    tx = ntt_delegate.mint(accounts[1], sender=accounts[0])
+    gas_recorder.record("NTT_delegate", "mint", tx)
+
+    tx = ntt_delegate.delegate(accounts[2], accounts[3], sender=accounts[0])
+    gas_recorder.record("NTT_delegate", "delegate", tx)
+
+    tx = ntt_delegate.mint(accounts[3], sender=accounts[2])
+    gas_recorder.record("NTT_delegate", "mint_delegated", tx)
+
+    tx = ntt_delegate.delegateBatch(
+        [accounts[2], accounts[2], accounts[2]],
+        [accounts[4], accounts[5], accounts[6]],
+        sender=accounts[0],
+    )
+    gas_recorder.record("NTT_delegate", "delegateBatch", tx)
+
+    tx = ntt_delegate.mintBatch(
+        [accounts[4], accounts[5], accounts[6]], sender=accounts[2]
+    )
+    gas_recorder.record("NTT_delegate", "mintBatch", tx)
+
+    tx = ntt_delegate.hasValidToken.transact(accounts[1], sender=accounts[0])
+    gas_recorder.record("NTT_delegate", "hasValidToken", tx)
+
+    tx = ntt_delegate.invalidate(1, sender=accounts[0])
+    gas_recorder.record("NTT_delegate", "invalidate", tx)
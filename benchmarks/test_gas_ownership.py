@@ -0,0 +1,105 @@
+import random
+import time
+import tracemalloc
+
+from eth_utils import to_checksum_address
+
+from utils.ownership import ZERO_ADDRESS, OwnershipSnapshot
+
+TRANSFER_COUNT = 1_000_000
+
+TRANSFERS_PER_BLOCK = 10
+
+HOLDER_COUNT = 10_000
+
+TOKEN_COUNT = 20_000
+
+QUERY_COUNT = 20
+
+ROLLBACK_DEPTH = 100
+
+
+def address(i):
+    return to_checksum_address((0x1000 + i).to_bytes(20, "big"))
+
+
+def iter_synthetic_blocks(seed=0):
+    """
+    Yield `(block_number, block_hash, transfers)` for a mint of every token, then random
+    transfers of the tokens between holders, `TRANSFERS_PER_BLOCK` per block.
+    """
+    rng = random.Random(seed)
+    holders = [address(i) for i in range(HOLDER_COUNT)]
+    owners = [ZERO_ADDRESS] * (TOKEN_COUNT + 1)
+
+    transfers = []
+    for count in range(TRANSFER_COUNT):
+        token_id = count + 1 if count < TOKEN_COUNT else rng.randrange(1, TOKEN_COUNT)
+        receiver = holders[rng.randrange(HOLDER_COUNT)]
+        transfers.append((owners[token_id], receiver, token_id))
+        owners[token_id] = receiver
+
+        if len(transfers) == TRANSFERS_PER_BLOCK:
+            block_number = count // TRANSFERS_PER_BLOCK
+            yield block_number, block_number.to_bytes(32, "big"), transfers
+            transfers = []
+
+
+def mean_time(f, args):
+    start = time.perf_counter()
+    for arg in args:
+        f(arg)
+
+    return (time.perf_counter() - start) / len(args)
+
+
+def test_materialize(gas_recorder):
+    blocks = list(iter_synthetic_blocks())
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    snapshot = OwnershipSnapshot()
+    for block in blocks:
+        snapshot.apply_block(*block)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(snapshot) == TRANSFER_COUNT
+    gas_recorder.note(
+        "ownership",
+        "apply_1M",
+        f"{TRANSFER_COUNT} transfers in {elapsed:.1f} s, "
+        f"{snapshot.nbytes / 2**20:.1f} MiB of arrays, "
+        f"{peak / 2**20:.1f} MiB peak including holders",
+    )
+
+    rng = random.Random(1)
+    last = snapshot.block_number
+    block_numbers = [rng.randrange(last) for _ in range(QUERY_COUNT)]
+    token_ids = [rng.randrange(1, TOKEN_COUNT) for _ in range(QUERY_COUNT)]
+    owners_at = mean_time(snapshot.owners_at, block_numbers)
+    balances_at = mean_time(snapshot.balances_at, block_numbers)
+    owner_of = mean_time(lambda t: snapshot.owner_of(t, block_numbers[0]), token_ids)
+    gas_recorder.note(
+        "ownership",
+        "query_1M",
+        f"owners_at {owners_at * 1000:.1f} ms, "
+        f"balances_at {balances_at * 1000:.1f} ms, "
+        f"owner_of {owner_of * 1000:.2f} ms",
+    )
+
+    # A reorg of the last blocks rolls back only their transfers
+    expected = snapshot.owners_at(last - ROLLBACK_DEPTH)
+    start = time.perf_counter()
+    snapshot.rollback(last - ROLLBACK_DEPTH)
+    elapsed = time.perf_counter() - start
+
+    assert (snapshot.owners_at(snapshot.block_number) == expected).all()
+    gas_recorder.note(
+        "ownership",
+        f"rollback_{ROLLBACK_DEPTH}_blocks",
+        f"{ROLLBACK_DEPTH * TRANSFERS_PER_BLOCK} transfers in "
+        f"{elapsed * 1000:.2f} ms",
+    )
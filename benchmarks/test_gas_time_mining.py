@@ -0,0 +1,81 @@
+import pytest
+from eth_utils import to_checksum_address
+
+TRANSFER_COUNTS = [1, 10, 50]
+
+CLAIM_BATCH_SIZES = [1, 10, 100, 300]
+
+# Holders minted to per call, so that a mint to distinct holders fits in a block
+MINT_CHUNK_SIZE = 100
+
+
+@pytest.fixture(scope="module")
+def timer(accounts, project):
+    c = project.timer.deploy(
+        "Time Token",
+        "TT",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    c.mint(accounts[1], "1.json", sender=accounts[0])
+    yield c
+
+
+@pytest.fixture(scope="module")
+def erc20(accounts, project, timer):
+    c = project.ERC20_mintable.deploy(
+        "Mineable Token", "MNT", 18, 0, timer.address, sender=accounts[0]
+    )
+    timer.set_token_address(c.address, sender=accounts[0])
+    yield c
+
+
+def test_claim_rewards(accounts, chain, timer, erc20, gas_recorder):
+    chain.mine(10)
+
+    tx = timer.claim_rewards(sender=accounts[1])
+    gas_recorder.record("timer", "claim_rewards", tx)
+
+
+@pytest.mark.parametrize("n", TRANSFER_COUNTS)
+def test_claim_rewards_after_transfers(accounts, chain, timer, erc20, gas_recorder, n):
+    holder = accounts[TRANSFER_COUNTS.index(n) + 2]
+    timer.mint(holder, f"{n}.json", sender=accounts[0])
+    token_id = timer.totalSupply()
+
+    # Each round trip checkpoints the rewards of the holder twice
+    for _ in range(n):
+        timer.transferFrom(holder, accounts[9], token_id, sender=holder)
+        timer.transferFrom(accounts[9], holder, token_id, sender=accounts[9])
+
+    chain.mine(10)
+
+    tx = timer.claim_rewards(sender=holder)
+    gas_recorder.record("timer", f"claim_rewards_after_x{n}_transfers", tx)
+
+
+@pytest.mark.parametrize("n", CLAIM_BATCH_SIZES)
+def test_claim_rewards_for(accounts, chain, timer, erc20, gas_recorder, n):
+    # Holders are fresh addresses, as claims can be made for any holder
+    first_holder = 0x1000 * (CLAIM_BATCH_SIZES.index(n) + 1)
+    holders = [
+        to_checksum_address((first_holder + i).to_bytes(20, "big")) for i in range(n)
+    ]
+    for start in range(0, n, MINT_CHUNK_SIZE):
+        end = start + MINT_CHUNK_SIZE
+        timer.mintBatch(
+            holders[start:end], ["1.json"] * len(holders[start:end]), sender=accounts[0]
+        )
+        # Mine an empty block so the base fee does not rise above the estimate
+        chain.mine()
+
+    chain.mine(10)
+
+    tx = timer.claim_rewards_for(holders, sender=accounts[0])
+    gas_recorder.record("timer", f"claim_rewards_for_x{n}", tx)
+    gas_recorder.record_gas(
+        "timer", f"claim_rewards_for_per_holder_x{n}", tx.gas_used // n
+    )
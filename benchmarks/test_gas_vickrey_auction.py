@@ -0,0 +1,246 @@
+import pytest
+from eth_abi import encode
+from eth_account import Account
+from eth_utils import keccak, to_wei
+
+from benchmarks.transactions import send_signed
+
+SEALED_BIDDER_COUNT = 1000
+
+
+@pytest.fixture(scope="module")
+def auction(accounts, chain, project):
+    yield project.vickrey_auction.deploy(
+        to_wei(1, "ether"), chain.pending_timestamp + 100, sender=accounts[0]
+    )
+
+
+@pytest.fixture(scope="module")
+def erc721(accounts, project):
+    c = project.ERC721.deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        100,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    c.mint(accounts[0], "1.json", sender=accounts[0])
+    yield c
+
+
+@pytest.fixture(scope="module")
+def auction_erc721(accounts, project, erc721):
+    yield project.vickrey_auction_ERC721.deploy(erc721.address, sender=accounts[0])
+
+
+def test_vickrey_auction(accounts, chain, auction, gas_recorder):
+    tx = auction.bid(sender=accounts[1], value=to_wei(1.5, "ether"))
+    gas_recorder.record("vickrey_auction", "bid", tx)
+
+    tx = auction.bid(sender=accounts[2], value=to_wei(3, "ether"))
+    gas_recorder.record("vickrey_auction", "bid_outbid", tx)
+
+    chain.mine(100)
+
+    tx = auction.close(sender=accounts[0])
+    gas_recorder.record("vickrey_auction", "close", tx)
+
+    tx = auction.refund(sender=accounts[1])
+    gas_recorder.record("vickrey_auction", "refund", tx)
+
+    tx = auction.refund(sender=accounts[2])
+    gas_recorder.record("vickrey_auction", "refund_winner", tx)
+
+
+def test_vickrey_auction_erc721(accounts, chain, erc721, auction_erc721, gas_recorder):
+    gas_recorder.record("vickrey_auction_ERC721", "deploy", auction_erc721.receipt)
+
+    erc721.approve(auction_erc721.address, 1, sender=accounts[0])
+    tx = auction_erc721.start_auction(
+        to_wei(1, "ether"), chain.pending_timestamp + 100, 1, sender=accounts[0]
+    )
+    gas_recorder.record("vickrey_auction_ERC721", "start_auction", tx)
+
+    tx = auction_erc721.bid(sender=accounts[1], value=to_wei(1.5, "ether"))
+    gas_recorder.record("vickrey_auction_ERC721", "bid", tx)
+
+    tx = auction_erc721.bid(sender=accounts[2], value=to_wei(3, "ether"))
+    gas_recorder.record("vickrey_auction_ERC721", "bid_outbid", tx)
+
+    chain.mine(100)
+
+    tx = auction_erc721.close(sender=accounts[0])
+    gas_recorder.record("vickrey_auction_ERC721", "close", tx)
+
+    tx = auction_erc721.refund(sender=accounts[1])
+    gas_recorder.record("vickrey_auction_ERC721", "refund", tx)
+
+
+def test_vickrey_auction_erc721_factory(
+    accounts, chain, project, erc721, auction_erc721, gas_recorder
+):
+    factory = project.vickrey_auction_ERC721_factory.deploy(
+        auction_erc721.address, sender=accounts[0]
+    )
+    erc721.setApprovalForAll(factory.address, True, sender=accounts[0])
+    erc721.mint(accounts[0], "2.json", sender=accounts[0])
+
+    tx = factory.create_auction(
+        erc721.address,
+        2,
+        to_wei(1, "ether"),
+        chain.pending_timestamp + 100,
+        sender=accounts[0],
+    )
+    create_gas = gas_recorder.record(
+        "vickrey_auction_ERC721_factory", "create_auction", tx
+    )
+
+    events = list(tx.decode_logs(factory.AuctionCreated))
+    auction = project.vickrey_auction_ERC721.at(events[0].event_arguments["auction"])
+
+    tx = auction.bid(sender=accounts[1], value=to_wei(1.5, "ether"))
+    gas_recorder.record("vickrey_auction_ERC721_factory", "bid", tx)
+
+    chain.mine(100)
+
+    tx = auction.close(sender=accounts[0])
+    gas_recorder.record("vickrey_auction_ERC721_factory", "close", tx)
+
+    # A directly deployed auction is deployed, then started with the token approved
+    full_gas = auction_erc721.receipt.gas_used
+    erc721.approve(auction_erc721.address, 1, sender=accounts[0])
+    tx = auction_erc721.start_auction(
+        to_wei(1, "ether"), chain.pending_timestamp + 100, 1, sender=accounts[0]
+    )
+    full_gas += tx.gas_used
+
+    gas_recorder.note(
+        "vickrey_auction_ERC721_factory",
+        "create_auction",
+        f"{create_gas} gas for a minimal proxy, {full_gas} gas to deploy and start "
+        f"an auction",
+    )
+
+
+def test_vickrey_auction_sealed(accounts, chain, project, gas_recorder):
+    """
+    Commit, reveal and close with `SEALED_BIDDER_COUNT` bidders. Every bid is higher
+    than the ones revealed before it, so each reveal takes the most expensive path.
+
+    The gas of the first and last commit and reveal differ only by the zero bytes of
+    their calldata, and by the first reveal replacing the second highest bid with the
+    start price, which is the same value.
+    """
+    web3 = chain.provider.web3
+    chain_id = chain.chain_id
+    max_fee = 10 * web3.eth.get_block("latest")["baseFeePerGas"]
+    commit_deadline = chain.pending_timestamp + 10**6
+    auction = project.vickrey_auction_sealed.deploy(
+        to_wei(1, "ether"),
+        commit_deadline,
+        commit_deadline + 10**6,
+        sender=accounts[0],
+    )
+
+    bidders = [
+        Account.from_key(keccak(text=f"bidder {i}")) for i in range(SEALED_BIDDER_COUNT)
+    ]
+    bids = [
+        to_wei(1, "ether") + (i + 1) * to_wei(1, "milliether")
+        for i in range(len(bidders))
+    ]
+    salts = [keccak(text=f"salt {i}") for i in range(len(bidders))]
+
+    def sign(sender, nonce, to, value=0, data=b""):
+        return sender.sign_transaction(
+            {
+                "chainId": chain_id,
+                "nonce": nonce,
+                "to": to,
+                "value": value,
+                "data": data,
+                "gas": 200000,
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": 0,
+            }
+        )
+
+    funder = Account.from_key(accounts[0].private_key)
+    funder_nonce = accounts[0].nonce
+    send_signed(
+        web3,
+        [
+            sign(funder, funder_nonce + i, bidder.address, value=to_wei(3, "ether"))
+            for i, bidder in enumerate(bidders)
+        ],
+    )
+
+    commitments = [
+        keccak(
+            encode(
+                ["address", "address", "uint256", "bytes32"],
+                [auction.address, bidder.address, bid, salt],
+            )
+        )
+        for bidder, bid, salt in zip(bidders, bids, salts)
+    ]
+    assert (
+        auction.get_commitment(bidders[0].address, bids[0], salts[0]) == commitments[0]
+    )
+    commit_gas = send_signed(
+        web3,
+        [
+            sign(
+                bidder,
+                0,
+                auction.address,
+                value=to_wei(2, "ether"),
+                data=auction.commit.encode_input(commitment),
+            )
+            for bidder, commitment in zip(bidders, commitments)
+        ],
+    )
+    gas_recorder.record_gas("vickrey_auction_sealed", "commit_first", commit_gas[0])
+    gas_recorder.record_gas("vickrey_auction_sealed", "commit_last", commit_gas[-1])
+
+    chain.pending_timestamp += 10**6
+
+    reveal_gas = send_signed(
+        web3,
+        [
+            sign(
+                bidder, 1, auction.address, data=auction.reveal.encode_input(bid, salt)
+            )
+            for bidder, bid, salt in zip(bidders, bids, salts)
+        ],
+    )
+    gas_recorder.record_gas("vickrey_auction_sealed", "reveal_first", reveal_gas[0])
+    gas_recorder.record_gas("vickrey_auction_sealed", "reveal_last", reveal_gas[-1])
+    assert auction.highest_bidder() == bidders[-1].address
+    assert auction.second_highest_bid() == bids[-2]
+
+    chain.pending_timestamp += 10**6
+
+    tx = auction.close(sender=accounts[0])
+    gas_recorder.record("vickrey_auction_sealed", "close", tx)
+
+    refund = auction.refund.encode_input()
+    refund_gas = send_signed(
+        web3,
+        [
+            sign(bidders[0], 2, auction.address, data=refund),
+            sign(bidders[-1], 2, auction.address, data=refund),
+        ],
+    )
+    gas_recorder.record_gas("vickrey_auction_sealed", "refund", refund_gas[0])
+    gas_recorder.record_gas("vickrey_auction_sealed", "refund_winner", refund_gas[1])
+
+    gas_recorder.note(
+        "vickrey_auction_sealed",
+        f"{SEALED_BIDDER_COUNT}_bidders",
+        f"commit {min(commit_gas)}-{max(commit_gas)} gas, "
+        f"reveal {min(reveal_gas)}-{max(reveal_gas)} gas",
+    )
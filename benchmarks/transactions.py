@@ -0,0 +1,18 @@
+"""
+Send transactions signed with `eth_account` straight through web3, for benchmarks that
+send thousands of them, without the overhead of ape for each.
+"""
+
+
+def send_signed(web3, signed_txs):
+    """
+    Send signed transactions through web3, one per block. Returns the gas used by each.
+    """
+    gas_used = []
+    for signed in signed_txs:
+        tx_hash = web3.eth.send_raw_transaction(signed.rawTransaction)
+        receipt = web3.eth.get_transaction_receipt(tx_hash)
+        assert receipt["status"] == 1
+        gas_used.append(receipt["gasUsed"])
+
+    return gas_used
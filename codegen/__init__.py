@@ -0,0 +1,84 @@
+"""
+Renders the ERC721 family of contracts from a shared core.
+
+`ERC721.vy`, `EIP4494.vy`, `conditional_soulbound/timed_ERC721.vy` and
+`time_mining_erc721/timer.vy` are generated from the template in `codegen/ERC721.vy`
+and the per-variant hooks in `codegen/variants.py`. Changes to the shared transfer,
+enumeration and mint/burn logic should be made in the template, and the contracts
+re-rendered with `python -m codegen`. `python -m codegen --check` fails if any of the
+committed contracts differ from their rendered output.
+
+The template marks each hook with `{{ name }}`. A marker on a line of its own is
+replaced by the lines of the hook, indented to the marker, and the line is dropped
+if the hook is empty. A marker within a line is replaced by the hook as it is.
+"""
+
+import re
+from pathlib import Path
+
+from codegen.variants import HOOKS, VARIANTS
+
+ROOT = Path(__file__).parent.parent
+
+TEMPLATE_PATH = Path(__file__).parent / "ERC721.vy"
+
+MARKER = re.compile(r"{{ (\w+) }}")
+
+
+def _render_line(line, hooks):
+    """
+    Render a single line of the template, which may expand to zero or more lines.
+    """
+    stripped = line.strip()
+    match = MARKER.fullmatch(stripped)
+    if match is None:
+        return [MARKER.sub(lambda m: hooks.get(m.group(1), ""), line)]
+
+    hook = hooks.get(match.group(1), "")
+    if not hook:
+        return []
+
+    indent = line[: len(line) - len(line.lstrip())]
+    return [indent + hook_line if hook_line else "" for hook_line in hook.split("\n")]
+
+
+def render(hooks, template=None):
+    """
+    Render the template with the given hooks, keyed by hook name.
+
+    Hooks that are not in `HOOKS` raise a ValueError, and hooks that are not given
+    render as empty.
+    """
+    unknown = set(hooks) - set(HOOKS)
+    if unknown:
+        raise ValueError(f"Unknown hooks: {', '.join(sorted(unknown))}")
+
+    if template is None:
+        template = TEMPLATE_PATH.read_text()
+
+    # A hook ends with a newline, like the lines it replaces
+    hooks = {name: hook.removesuffix("\n") for name, hook in hooks.items()}
+    lines = []
+    for line in template.split("\n"):
+        lines.extend(_render_line(line, hooks))
+
+    return "\n".join(lines)
+
+
+def render_all():
+    """
+    Returns a dict of output path to rendered contract for every variant.
+    """
+    template = TEMPLATE_PATH.read_text()
+    return {ROOT / path: render(hooks, template) for path, hooks in VARIANTS.items()}
+
+
+def stale_paths():
+    """
+    Returns the paths of the committed contracts that differ from their rendered output.
+    """
+    return [
+        path
+        for path, source in render_all().items()
+        if not path.exists() or path.read_text() != source
+    ]
@@ -0,0 +1,43 @@
+"""
+Render the ERC721 family of contracts, or check that the committed contracts are
+up to date with `--check`.
+"""
+
+import argparse
+import sys
+
+from codegen import ROOT, render_all, stale_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m codegen", description=__doc__)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with an error if any contract differs from its rendered output.",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        stale = stale_paths()
+        for path in stale:
+            print(
+                f"{path.relative_to(ROOT)} is out of date with codegen/",
+                file=sys.stderr,
+            )
+
+        if stale:
+            print(
+                "Run `python -m codegen` to re-render the contracts.", file=sys.stderr
+            )
+            sys.exit(1)
+
+        return
+
+    for path, source in render_all().items():
+        path.write_text(source)
+        print(f"Rendered {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,484 @@
+"""
+Per-variant hooks for the ERC721 template in `codegen/ERC721.vy`.
+"""
+
+# Hooks in the order they appear in the template
+HOOKS = (
+    "header",
+    "interfaces",
+    "storage",
+    "constants",
+    "init",
+    "interface_ids",
+    "views",
+    "before_add_token",
+    "on_add_token",
+    "before_remove_token",
+    "on_remove_token",
+    "on_transfer",
+    "functions",
+)
+
+ERC721_HEADER = """\
+# Adapted from official ERC721 Vyper example at https://github.com/vyperlang/vyper/blob/master/examples/tokens/ERC721.vy
+
+# @dev Implementation of ERC-721 non-fungible token standard.
+"""
+
+
+def timestamp_hooks(timestamp_map):
+    """
+    Hooks that set the timestamp of an address in `timestamp_map` when it receives its
+    first token, and reset it when it no longer holds any token.
+    """
+    return {
+        "on_add_token": f"""\
+if self.{timestamp_map}[_to] == 0:
+    self.{timestamp_map}[_to] = block.timestamp
+
+""",
+        "on_remove_token": f"""\
+
+# Set earliest timestamp to 0 if balance is now 0
+if new_count == 0:
+    self.{timestamp_map}[_from] = 0
+""",
+    }
+
+
+ERC721 = {"header": ERC721_HEADER}
+
+
+EIP4494 = {
+    "header": '''\
+# @dev
+
+"""
+@title ERC-721 non-fungible token standard with EIP-4494 extension for approval by
+       signature.
+@license GPL-3.0
+@author Gary Tse
+@notice You can use this contract for a simple Vickrey auction.
+@dev Implementation of EIP-4494 extension to ERC-721 non-fungible token standard.
+     Reference is made to EIP-4494 [https://eips.ethereum.org/EIPS/eip-4494]
+     and Yearn's implementation of EIP2612 [https://github.com/yearn/yearn-vaults/blob/main/contracts/Vault.vy]
+"""
+''',
+    "interfaces": """\
+
+
+interface ERC4494:
+
+    def permit(
+        spender: address,
+        tokenId: uint256,
+        deadline: uint256,
+        signature: Bytes[65]
+    ): nonpayable
+
+    def nonces(_tokenId: uint256) -> uint256: view
+
+    def DOMAIN_SEPARATOR() -> bytes32: view
+
+# @dev This emits when an entry of `permitBatch` is skipped because its permit is invalid.
+# @param index Index of the entry in the batch.
+# @param tokenId NFT of the entry.
+event PermitFailed:
+    index: uint256
+    tokenId: indexed(uint256)
+
+""",
+    "storage": """\
+
+# @dev Mapping from NFT ID to nonce for EIP4494 permit
+idToNonce: HashMap[uint256, uint256]
+""",
+    "constants": """\
+
+# @dev ERC165 interface ID of EIP4494
+EIP4494_INTERFACE_ID: constant(bytes4) = 0x5604e225
+
+# @dev EIP-4494 state variables
+DOMAIN_SEPARATOR: public(immutable(bytes32))
+DOMAIN_TYPE_HASH: public(constant(bytes32)) = keccak256(
+    'EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)'
+)
+PERMIT_TYPE_HASH: public(constant(bytes32)) = keccak256(
+    "Permit(address spender,uint256 tokenId,uint256 nonce,uint256 deadline)"
+)
+
+# @dev Maximum number of permits in a batch
+MAX_PERMIT_BATCH_SIZE: constant(uint256) = 256
+
+# @dev Mask of s in the vs word of an EIP-2098 compact signature
+COMPACT_S_MASK: constant(uint256) = 2 ** 255 - 1
+""",
+    "init": """\
+
+DOMAIN_SEPARATOR = keccak256(
+    _abi_encode(
+        DOMAIN_TYPE_HASH,
+        keccak256(convert("Vyper EIP4494", Bytes[13])),
+        keccak256(convert("1.0.0", Bytes[5])),
+        convert(chain.id, bytes32),
+        self
+    )
+)
+""",
+    "interface_ids": """,
+        EIP4494_INTERFACE_ID""",
+    "views": """\
+
+
+@view
+@external
+def nonces(tokenId: uint256) -> uint256:
+    return self.idToNonce[tokenId]
+""",
+    "on_transfer": """\
+# Increment nonce for token
+self.idToNonce[_tokenId] += 1
+""",
+    "functions": r'''
+
+### EIP-4494 functions
+
+@view
+@internal
+def _permitSigner(
+    spender: address,
+    tokenId: uint256,
+    nonce: uint256,
+    deadline: uint256,
+    r: uint256,
+    s: uint256,
+    v: uint256
+) -> address:
+    """
+    @dev Returns the signer of a Permit, or zero address if the signature is invalid
+    """
+    # Need to derive nonce and signer from signature
+    digest: bytes32 = keccak256(
+        concat( # not sure why _abi_encode does not work
+            b'\x19\x01',
+            DOMAIN_SEPARATOR,
+            keccak256(
+                _abi_encode(
+                    PERMIT_TYPE_HASH,
+                    spender,
+                    tokenId,
+                    nonce,
+                    deadline
+                )
+            )
+        )
+    )
+
+    return ecrecover(digest, v, r, s)
+
+
+@internal
+def _permit(
+    spender: address,
+    tokenId: uint256,
+    deadline: uint256,
+    r: uint256,
+    s: uint256,
+    v: uint256
+):
+    """
+    @dev Permit address to transfer owner's NFT by the r, s and v of owner's signature
+    """
+    # Throws if current block is greater than deadline
+    assert deadline >= block.timestamp, "Deadline must be equal to or greater than current block"
+
+    _owner: address = self._ownerOf(tokenId)
+
+    # Throws if token belongs to zero address
+    assert _owner != empty(address), "Token is owned by zero address"
+
+    # Throws if signature is not from owner
+    signer: address = self._permitSigner(spender, tokenId, self.idToNonce[tokenId], deadline, r, s, v)
+    assert signer == _owner, "Invalid signature"
+
+    # Set the approval
+    self.idToApprovals[tokenId] = spender
+    log Approval(_owner, spender, tokenId)
+
+
+@external
+def permit(
+    spender: address,
+    tokenId: uint256,
+    deadline: uint256,
+    signature: Bytes[65]
+) -> bool:
+    """
+    @dev Permit address to transfer owner's NFT by owner's signature
+    @param spender The address which is allowed to transfer the NFT
+    @param tokenId The token ID of the NFT
+    @param deadline The timestamp after which the Permit is no longer valid
+    @param signature A valid secp256k1 signature of Permit by owner encoded as r, s and v
+    @return True, if transaction completes successfully
+    """
+    # unpack signature into r, s and v
+    r: uint256 = convert(slice(signature, 0, 32), uint256)
+    s: uint256 = convert(slice(signature, 32, 32), uint256)
+    v: uint256 = convert(slice(signature, 64, 1), uint256)
+
+    self._permit(spender, tokenId, deadline, r, s, v)
+    return True
+
+
+@external
+def permitCompact(
+    spender: address,
+    tokenId: uint256,
+    deadline: uint256,
+    r: bytes32,
+    vs: bytes32
+) -> bool:
+    """
+    @dev Permit address to transfer owner's NFT by owner's EIP-2098 compact signature
+         [https://eips.ethereum.org/EIPS/eip-2098], which takes 96 fewer bytes of
+         calldata than `permit`.
+    @param spender The address which is allowed to transfer the NFT
+    @param tokenId The token ID of the NFT
+    @param deadline The timestamp after which the Permit is no longer valid
+    @param r The r of a valid secp256k1 signature of Permit by owner
+    @param vs The s of the signature, with the parity of its v in the highest bit
+    @return True, if transaction completes successfully
+    """
+    _vs: uint256 = convert(vs, uint256)
+    self._permit(
+        spender,
+        tokenId,
+        deadline,
+        convert(r, uint256),
+        _vs & COMPACT_S_MASK,
+        shift(_vs, -255) + 27
+    )
+    return True
+
+
+@external
+def permitBatch(
+    spenders: DynArray[address, MAX_PERMIT_BATCH_SIZE],
+    tokenIds: DynArray[uint256, MAX_PERMIT_BATCH_SIZE],
+    deadlines: DynArray[uint256, MAX_PERMIT_BATCH_SIZE],
+    signatures: DynArray[Bytes[65], MAX_PERMIT_BATCH_SIZE]
+) -> DynArray[uint256, MAX_PERMIT_BATCH_SIZE]:
+    """
+    @dev Apply a batch of permits, as `permit` does for each entry. An entry whose permit
+         is expired, is for a token owned by zero address, or is not signed by the owner
+         is skipped instead of reverting the batch, and a PermitFailed event is emitted.
+         The owner and nonce of each token are read once.
+         Throws if the arguments have different lengths.
+    @param spenders The addresses which are allowed to transfer each NFT
+    @param tokenIds The token IDs of the NFTs
+    @param deadlines The timestamps after which each Permit is no longer valid
+    @param signatures The signatures of each Permit by owner encoded as r, s and v
+    @return The indices of the entries that were skipped
+    """
+    batch_size: uint256 = len(tokenIds)
+    assert batch_size == len(spenders), "Arguments have different lengths"
+    assert batch_size == len(deadlines), "Arguments have different lengths"
+    assert batch_size == len(signatures), "Arguments have different lengths"
+
+    failed: DynArray[uint256, MAX_PERMIT_BATCH_SIZE] = []
+
+    for i in range(MAX_PERMIT_BATCH_SIZE):
+        if i == batch_size:
+            break
+
+        _tokenId: uint256 = tokenIds[i]
+        _owner: address = empty(address)
+        signer: address = empty(address)
+
+        if deadlines[i] >= block.timestamp and len(signatures[i]) == 65:
+            _owner = self._ownerOf(_tokenId)
+            signer = self._permitSigner(
+                spenders[i],
+                _tokenId,
+                self.idToNonce[_tokenId],
+                deadlines[i],
+                convert(slice(signatures[i], 0, 32), uint256),
+                convert(slice(signatures[i], 32, 32), uint256),
+                convert(slice(signatures[i], 64, 1), uint256)
+            )
+
+        if _owner == empty(address) or signer != _owner:
+            failed.append(i)
+            log PermitFailed(i, _tokenId)
+            continue
+
+        self.idToApprovals[_tokenId] = spenders[i]
+        log Approval(_owner, spenders[i], _tokenId)
+
+    return failed
+''',
+}
+
+
+TIMED_ERC721 = {
+    "header": """\
+# Adapted from official ERC721 Vyper example at https://github.com/vyperlang/vyper/blob/master/examples/tokens/ERC721.vy
+
+# @dev Implementation of ERC-721 non-fungible token standard with a mapping from address
+#      to the earliest timestamp of its ownership of a token.
+""",
+    "storage": """\
+
+# @dev Mapping from address to earliest timestamp it holds a token
+addressToEarliestTimestamp: public(HashMap[address, uint256])
+""",
+    **timestamp_hooks("addressToEarliestTimestamp"),
+}
+
+
+TIMER = {
+    "header": """\
+# Adapted from official ERC721 Vyper example at https://github.com/vyperlang/vyper/blob/master/examples/tokens/ERC721.vy
+
+# @dev Implementation of ERC-721 non-fungible token standard with time-mining
+""",
+    "interfaces": """\
+
+
+interface ERC20Mintable:
+    def mint(
+        recipient: address,
+        amount: uint256
+    ): nonpayable
+
+    def mintBatch(
+        recipients: DynArray[address, MAX_CLAIM_BATCH_SIZE],
+        amounts: DynArray[uint256, MAX_CLAIM_BATCH_SIZE]
+    ): nonpayable
+
+""",
+    "storage": """\
+
+# @dev Mapping from address to its packed reward checkpoint. The lower 64 bits hold the
+#      timestamp of the checkpoint, and the upper 192 bits hold the rewards accrued up to
+#      it, in token-seconds.
+address_to_checkpoint: HashMap[address, uint256]
+
+# @dev Time-mineable token
+token: address
+""",
+    "constants": """\
+
+# @dev Number of bits of the timestamp in a reward checkpoint
+CHECKPOINT_TIMESTAMP_BITS: constant(int128) = 64
+
+# @dev Mask of the timestamp in a reward checkpoint
+CHECKPOINT_TIMESTAMP_MASK: constant(uint256) = 2 ** 64 - 1
+
+# @dev Maximum number of holders in a single call to `claim_rewards_for`
+MAX_CLAIM_BATCH_SIZE: constant(uint256) = 500
+""",
+    "views": """\
+
+
+@view
+@internal
+def _accrued_rewards(_holder: address) -> uint256:
+    \"\"\"
+    @dev Returns the rewards accrued by `_holder` up to the current block, in
+         token-seconds. The balance of `_holder` is constant since its last checkpoint.
+    \"\"\"
+    checkpoint: uint256 = self.address_to_checkpoint[_holder]
+    elapsed: uint256 = block.timestamp - (checkpoint & CHECKPOINT_TIMESTAMP_MASK)
+    return shift(checkpoint, -CHECKPOINT_TIMESTAMP_BITS) + self.ownerToNFTokenCount[_holder] * elapsed
+
+
+@view
+@external
+def pending_rewards(_holder: address) -> uint256:
+    \"\"\"
+    @dev Returns the amount of the ERC20 that `_holder` can claim
+    @param _holder Address to query
+    \"\"\"
+    accrued: uint256 = self._accrued_rewards(_holder)
+    return as_wei_value(accrued, 'ether')
+""",
+    "before_add_token": """\
+self._checkpoint(_to)
+
+""",
+    "before_remove_token": """\
+self._checkpoint(_from)
+
+""",
+    "functions": '''
+
+# Additional functions for time mining
+
+@internal
+def _checkpoint(_holder: address):
+    """
+    @dev Accrue the rewards of `_holder` up to the current block. Called before every
+         change to its balance, so that rewards accrue at its balance at the time.
+    """
+    accrued: uint256 = self._accrued_rewards(_holder)
+    self.address_to_checkpoint[_holder] = shift(accrued, CHECKPOINT_TIMESTAMP_BITS) | block.timestamp
+
+
+@external
+def set_token_address(token_addr: address):
+    """
+    @dev Set the address for the time-mineable token
+    @param token_addr Address of the ERC20 token that is time-mineable
+    """
+    assert token_addr != empty(address), "Invalid token address"
+    self.token = token_addr
+
+
+@external
+def claim_rewards():
+    """
+    @dev Claim the accrued ERC20 mined by the period of holding. One token is mined per
+         second for each NFT held.
+    """
+    amt: uint256 = self._accrued_rewards(msg.sender)
+    assert amt != 0, "Nothing to claim"
+
+    self.address_to_checkpoint[msg.sender] = block.timestamp
+    token_addr: address = self.token
+    ERC20Mintable(token_addr).mint(msg.sender, as_wei_value(amt, 'ether'))
+
+
+@external
+def claim_rewards_for(holders: DynArray[address, MAX_CLAIM_BATCH_SIZE]):
+    """
+    @dev Claim the accrued ERC20 of each of a list of holders, to the holders, with a
+         single mint call to the token. Holders with nothing to claim are skipped.
+    @param holders Addresses to claim for
+    """
+    recipients: DynArray[address, MAX_CLAIM_BATCH_SIZE] = []
+    amounts: DynArray[uint256, MAX_CLAIM_BATCH_SIZE] = []
+
+    for holder in holders:
+        amt: uint256 = self._accrued_rewards(holder)
+        if amt == 0:
+            continue
+
+        self.address_to_checkpoint[holder] = block.timestamp
+        recipients.append(holder)
+        amounts.append(as_wei_value(amt, 'ether'))
+
+    if len(recipients) != 0:
+        token_addr: address = self.token
+        ERC20Mintable(token_addr).mintBatch(recipients, amounts)
+''',
+}
+
+
+# Output path of each variant, relative to the repository root
+VARIANTS = {
+    "contracts/ERC721.vy": ERC721,
+    "contracts/EIP4494.vy": EIP4494,
+    "contracts/conditional_soulbound/timed_ERC721.vy": TIMED_ERC721,
+    "contracts/time_mining_erc721/timer.vy": TIMER,
+}
@@ -0,0 +1,42 @@
+"""
+Shared pytest hooks for `tests` and `benchmarks`.
+"""
+
+import pytest
+
+ISOLATION_SCOPES = ("session", "package", "module", "class", "function")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Insert the isolation fixtures of ape before the first fixture of each scope that
+    the test uses, before ape does.
+
+    ape looks up the scopes of the fixtures of a test by name across every collected
+    module, so a fixture that is module scoped in one module and function scoped in
+    another can have its deployment reverted after the first test of its module,
+    depending on which modules are collected together, as when the tests are split
+    across workers.
+    """
+    if item.config.getoption("disable_isolation", False):
+        return
+
+    if "_function_isolation" in item.fixturenames:
+        return
+
+    name2fixturedefs = item._fixtureinfo.name2fixturedefs
+    fixturenames = []
+    for name in item.fixturenames:
+        definitions = name2fixturedefs.get(name)
+        scope = definitions[-1].scope if definitions else None
+        isolation = f"_{scope}_isolation"
+        if scope in ISOLATION_SCOPES and isolation not in fixturenames:
+            fixturenames.append(isolation)
+
+        fixturenames.append(name)
+
+    if "_function_isolation" not in fixturenames:
+        fixturenames.append("_function_isolation")
+
+    item.fixturenames[:] = fixturenames
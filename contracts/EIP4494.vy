@@ -66,6 +66,13 @@ interface ERC4494:
 
     def DOMAIN_SEPARATOR() -> bytes32: view
 
+# @dev This emits when an entry of `permitBatch` is skipped because its permit is invalid.
+# @param index Index of the entry in the batch.
+# @param tokenId NFT of the entry.
+event PermitFailed:
+    index: uint256
+    tokenId: indexed(uint256)
+
 
 # @dev Emits when ownership of any NFT changes by any mechanism. This event emits when NFTs are
 #      created (`from` == 0) and destroyed (`to` == 0). Exception: during contract creation, any
@@ -121,11 +128,10 @@ burntCount: uint256
 # @dev Mapping from index to token ID
 indexToTokenId: HashMap[uint256, uint256]
 
-# @dev Mapping from token ID to index
-tokenIdToIndex: HashMap[uint256, uint256]
-
-# @dev Mapping from NFT ID to the address that owns it.
-idToOwner: HashMap[uint256, address]
+# @dev Mapping from NFT ID to its packed token data. The lower 160 bits hold the address
+#      that owns it, the next 48 bits hold its index in the owner's token list, and the
+#      upper 48 bits hold its index in the token list.
+idToTokenData: HashMap[uint256, uint256]
 
 # @dev Mapping from NFT ID to approved address.
 idToApprovals: HashMap[uint256, address]
@@ -136,21 +142,18 @@ ownerToNFTokenCount: HashMap[address, uint256]
 # @dev Mapping from owner address to mapping of index to tokenIds
 ownerToNFTokenIdList: HashMap[address, HashMap[uint256, uint256]]
 
-# @dev Mapping from NFT ID to index of owner
-tokenToOwnerIndex: HashMap[uint256, uint256]
-
 # @dev Mapping from owner address to mapping of operator addresses.
 ownerToOperators: HashMap[address, HashMap[address, bool]]
 
 #@dev Maping from NFT ID to token URI
 idToURI: HashMap[uint256, String[64]]
 
-# @dev Mapping from NFT ID to nonce for EIP4494 permit
-idToNonce: HashMap[uint256, uint256]
-
 # @dev Address of minter, who can mint a token
 minter: address
 
+# @dev Mapping from NFT ID to nonce for EIP4494 permit
+idToNonce: HashMap[uint256, uint256]
+
 # @dev ERC165 interface ID of ERC165
 ERC165_INTERFACE_ID: constant(bytes4) = 0x01ffc9a7
 
@@ -166,18 +169,48 @@ ERC721_ENUMERABLE_INTERFACE_ID: constant(bytes4) = 0x780e9d63
 # @dev ERC165 interface ID of ERC721TokenReceiver
 ERC721_TOKEN_RECEIVER_INTERFACE_ID: constant(bytes4) = 0x150b7a02
 
+# @dev Mask for the owner address in packed token data
+OWNER_MASK: constant(uint256) = 2 ** 160 - 1
+
+# @dev Bit offset of the index in the owner's token list in packed token data
+OWNER_INDEX_OFFSET: constant(int128) = 160
+
+# @dev Bit offset of the index in the token list in packed token data
+INDEX_OFFSET: constant(int128) = 208
+
+# @dev Mask for an index in packed token data, after shifting it to the lowest bits
+INDEX_MASK: constant(uint256) = 2 ** 48 - 1
+
+# @dev Mask for packed token data without the index in the owner's token list
+WITHOUT_OWNER_INDEX_MASK: constant(uint256) = (2 ** 48 - 1) * 2 ** 208 + 2 ** 160 - 1
+
+# @dev Mask for packed token data without the index in the token list
+WITHOUT_INDEX_MASK: constant(uint256) = 2 ** 208 - 1
+
+# @dev Maximum number of tokens that can be minted in a single `mintBatch` call
+MAX_MINT_BATCH_SIZE: constant(uint256) = 256
+
+# @dev Maximum number of entries returned by a single call to a bulk view function
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
 # @dev ERC165 interface ID of EIP4494
 EIP4494_INTERFACE_ID: constant(bytes4) = 0x5604e225
 
 # @dev EIP-4494 state variables
 DOMAIN_SEPARATOR: public(immutable(bytes32))
 DOMAIN_TYPE_HASH: public(constant(bytes32)) = keccak256(
-	'EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)'
+    'EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)'
 )
 PERMIT_TYPE_HASH: public(constant(bytes32)) = keccak256(
-	"Permit(address spender,uint256 tokenId,uint256 nonce,uint256 deadline)"
+    "Permit(address spender,uint256 tokenId,uint256 nonce,uint256 deadline)"
 )
 
+# @dev Maximum number of permits in a batch
+MAX_PERMIT_BATCH_SIZE: constant(uint256) = 256
+
+# @dev Mask of s in the vs word of an EIP-2098 compact signature
+COMPACT_S_MASK: constant(uint256) = 2 ** 255 - 1
+
 
 @external
 def __init__(
@@ -239,6 +272,72 @@ def _totalSupply() -> uint256:
     return self.tokenId - self.burntCount
 
 
+### TOKEN DATA PACKING ###
+
+@pure
+@internal
+def _packTokenData(_owner: address, _ownerIndex: uint256, _index: uint256) -> uint256:
+    """
+    @dev Pack the owner of a NFT, its index in the owner's token list and its index in the
+         token list into a single word
+    """
+    return convert(_owner, uint256) | shift(_ownerIndex, OWNER_INDEX_OFFSET) | shift(_index, INDEX_OFFSET)
+
+
+@pure
+@internal
+def _unpackOwner(_tokenData: uint256) -> address:
+    """
+    @dev Returns the owner from packed token data
+    """
+    return convert(_tokenData & OWNER_MASK, address)
+
+
+@pure
+@internal
+def _unpackOwnerIndex(_tokenData: uint256) -> uint256:
+    """
+    @dev Returns the index in the owner's token list from packed token data
+    """
+    return shift(_tokenData, -OWNER_INDEX_OFFSET) & INDEX_MASK
+
+
+@pure
+@internal
+def _unpackIndex(_tokenData: uint256) -> uint256:
+    """
+    @dev Returns the index in the token list from packed token data
+    """
+    return shift(_tokenData, -INDEX_OFFSET)
+
+
+@pure
+@internal
+def _setOwnerIndex(_tokenData: uint256, _ownerIndex: uint256) -> uint256:
+    """
+    @dev Returns packed token data with the index in the owner's token list replaced
+    """
+    return (_tokenData & WITHOUT_OWNER_INDEX_MASK) | shift(_ownerIndex, OWNER_INDEX_OFFSET)
+
+
+@pure
+@internal
+def _setIndex(_tokenData: uint256, _index: uint256) -> uint256:
+    """
+    @dev Returns packed token data with the index in the token list replaced
+    """
+    return (_tokenData & WITHOUT_INDEX_MASK) | shift(_index, INDEX_OFFSET)
+
+
+@view
+@internal
+def _ownerOf(_tokenId: uint256) -> address:
+    """
+    @dev Returns the owner of a NFT, or zero address if `_tokenId` is not a valid NFT
+    """
+    return self._unpackOwner(self.idToTokenData[_tokenId])
+
+
 @view
 @external
 def supportsInterface(_interfaceID: bytes4) -> bool:
@@ -278,7 +377,7 @@ def ownerOf(_tokenId: uint256) -> address:
          Throws if `_tokenId` is not a valid NFT.
     @param _tokenId The identifier for an NFT.
     """
-    owner: address = self.idToOwner[_tokenId]
+    owner: address = self._ownerOf(_tokenId)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
     return owner
@@ -293,7 +392,7 @@ def getApproved(_tokenId: uint256) -> address:
     @param _tokenId ID of the NFT to query the approval of.
     """
     # Throws if `_tokenId` is not a valid NFT
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
     return self.idToApprovals[_tokenId]
 
 
@@ -333,7 +432,7 @@ def tokenURI(_tokenId: uint256) -> String[128]:
     @dev Returns the URI for the token ID
     @param _tokenId id of the ERC721 token
     """
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
 
     return concat(
         self.baseTokenURI,
@@ -357,7 +456,7 @@ def tokenByIndex(_index: uint256) -> uint256:
     @dev Get token by index
          Throws if '_index' is larger than totalSupply()
     """
-    assert _index <= self._totalSupply() - self.burntCount
+    assert _index <= self._totalSupply()
     assert _index > 0
 
     return self.indexToTokenId[_index]
@@ -382,6 +481,74 @@ def baseURI() -> String[64]:
     return self.baseTokenURI
 
 
+### BULK VIEW FUNCTIONS ###
+
+@view
+@external
+def tokensOfOwner(
+    _owner: address,
+    _start: uint256,
+    _count: uint256
+) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens of `_owner`, starting from index `_start`. Indexes count
+         from 1, as in `tokenOfOwnerByIndex`. Fewer tokens are returned at the end of the
+         token list of `_owner`.
+         Throws if `_owner` is zero address.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._balanceOf(_owner)
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _count or _start + i > last_index:
+            break
+
+        tokens.append(self.ownerToNFTokenIdList[_owner][_start + i])
+
+    return tokens
+
+
+@view
+@external
+def tokensByIndexRange(_start: uint256, _count: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens starting from index `_start`. Indexes count from 1, as
+         in `tokenByIndex`. Fewer tokens are returned at the end of the token list.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._totalSupply()
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _count or _start + i > last_index:
+            break
+
+        tokens.append(self.indexToTokenId[_start + i])
+
+    return tokens
+
+
+@view
+@external
+def ownersOf(_tokenIds: DynArray[uint256, MAX_PAGE_SIZE]) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @dev Get the owners of `_tokenIds`, in the same order. Unlike `ownerOf`, the owner of a
+         token ID that is not a valid NFT is returned as zero address.
+    """
+    owners: DynArray[address, MAX_PAGE_SIZE] = []
+    for _tokenId in _tokenIds:
+        owners.append(self._ownerOf(_tokenId))
+
+    return owners
+
+
 @view
 @external
 def nonces(tokenId: uint256) -> uint256:
@@ -392,123 +559,78 @@ def nonces(tokenId: uint256) -> uint256:
 
 @view
 @internal
-def _isApprovedOrOwner(_spender: address, _tokenId: uint256) -> bool:
+def _isApprovedOrOwner(_owner: address, _spender: address, _tokenId: uint256) -> bool:
     """
     @dev Returns whether the given spender can transfer a given token ID
+    @param owner address of the owner of the token
     @param spender address of the spender to query
     @param tokenId uint256 ID of the token to be transferred
     @return bool whether the msg.sender is approved for the given token ID,
         is an operator of the owner, or is the owner of the token
     """
-    owner: address = self.idToOwner[_tokenId]
-    spenderIsOwner: bool = owner == _spender
+    spenderIsOwner: bool = _owner == _spender
     spenderIsApproved: bool = _spender == self.idToApprovals[_tokenId]
-    spenderIsApprovedForAll: bool = (self.ownerToOperators[owner])[_spender]
+    spenderIsApprovedForAll: bool = (self.ownerToOperators[_owner])[_spender]
     return (spenderIsOwner or spenderIsApproved) or spenderIsApprovedForAll
 
+
 @internal
-def _addTokenToOwnerList(_to: address, _tokenId: uint256):
+def _addTokenTo(_to: address, _tokenId: uint256) -> uint256:
     """
-    @dev Add a NFT to an index mapping to a given address
+    @dev Add a NFT to the token list of a given address. The caller is responsible for
+         writing the packed token data of `_tokenId`.
     @param to address of the receiver
     @param tokenId uint256 ID Of the token to be added
+    @return uint256 index of the token in the token list of `_to`
     """
-    current_count: uint256 = self._balanceOf(_to)
+    # Change count tracking
+    current_count: uint256 = self.ownerToNFTokenCount[_to] + 1
+    self.ownerToNFTokenCount[_to] = current_count
 
+    # Update owner token index tracking
     self.ownerToNFTokenIdList[_to][current_count] = _tokenId
-    self.tokenToOwnerIndex[_tokenId] = current_count
+    return current_count
 
 
 @internal
-def _removeTokenFromOwnerList(_from: address, _tokenId: uint256):
+def _removeTokenFrom(_from: address, _ownerIndex: uint256):
     """
-    @dev Remove a NFT from an index mapping to a given address
+    @dev Remove a NFT from the token list of a given address, by moving the last token
+         of the list into its place. The caller is responsible for writing the packed
+         token data of the removed token.
     @param from address of the sender
-    @param tokenId uint256 ID Of the token to be removed
+    @param ownerIndex uint256 index of the token in the token list of `_from`
     """
-    # Delete
-    current_count: uint256 = self._balanceOf(_from)
-    current_index: uint256 = self.tokenToOwnerIndex[_tokenId]
+    current_count: uint256 = self.ownerToNFTokenCount[_from]
 
-    if current_count == current_index:
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_count] = 0
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[_tokenId] = 0
-
-    else:
+    if current_count != _ownerIndex:
         lastTokenId: uint256 = self.ownerToNFTokenIdList[_from][current_count]
 
-        # Add
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_index] = lastTokenId
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[lastTokenId] = current_index
-
-        # Delete
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_count] = 0
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[_tokenId] = 0
-
-@internal
-def _addTokenTo(_to: address, _tokenId: uint256):
-    """
-    @dev Add a NFT to a given address
-         Throws if `_tokenId` is owned by someone.
-    """
-    # Throws if `_tokenId` is owned by someone
-    assert self.idToOwner[_tokenId] == empty(address)
-    # Change the owner
-    self.idToOwner[_tokenId] = _to
-    # Change count tracking
-    self.ownerToNFTokenCount[_to] += 1
-	# Update owner token index tracking
-    self._addTokenToOwnerList(_to, _tokenId)
-
-
-@internal
-def _removeTokenFrom(_from: address, _tokenId: uint256):
-    """
-    @dev Remove a NFT from a given address
-         Throws if `_from` is not the current owner.
-    """
-    # Throws if `_from` is not the current owner
-    assert self.idToOwner[_tokenId] == _from
+        # Move the last token into the index of the removed token
+        self.ownerToNFTokenIdList[_from][_ownerIndex] = lastTokenId
+        self.idToTokenData[lastTokenId] = self._setOwnerIndex(
+            self.idToTokenData[lastTokenId],
+            _ownerIndex
+        )
 
-	# Update owner token index tracking
-    self._removeTokenFromOwnerList(_from, _tokenId)
+    # Delete the last index
+    self.ownerToNFTokenIdList[_from][current_count] = 0
 
-    # Change the owner
-    self.idToOwner[_tokenId] = empty(address)
     # Change count tracking
-    self.ownerToNFTokenCount[_from] -= 1
+    new_count: uint256 = current_count - 1
+    self.ownerToNFTokenCount[_from] = new_count
 
 
 @internal
-def _clearApproval(_owner: address, _tokenId: uint256):
+def _clearApproval(_tokenId: uint256):
     """
-    @dev Clear an approval of a given address
-         Throws if `_owner` is not the current owner.
+    @dev Clear an approval of a given NFT
     """
-    # Throws if `_owner` is not the current owner
-    assert self.idToOwner[_tokenId] == _owner
     if self.idToApprovals[_tokenId] != empty(address):
         # Reset approvals
         self.idToApprovals[_tokenId] = empty(address)
 
 
-@internal
-def _approve(_approved: address, _tokenId: uint256):
-    """
-    @dev Internal function to set or reaffirm the approved address for an NFT.
-    @param _approved Address to be approved for the given NFT ID.
-    @param _tokenId ID of the token to be approved.
-    """
-    # Set the approval
-    self.idToApprovals[_tokenId] = _approved
-
-
 @internal
 def _transferFrom(_from: address, _to: address, _tokenId: uint256, _sender: address):
     """
@@ -519,16 +641,27 @@ def _transferFrom(_from: address, _to: address, _tokenId: uint256, _sender: addr
          Throws if `_from` is not the current owner.
          Throws if `_tokenId` is not a valid NFT.
     """
+    tokenData: uint256 = self.idToTokenData[_tokenId]
+    owner: address = self._unpackOwner(tokenData)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Throws if `_from` is not the current owner
+    assert owner == _from
     # Check requirements
-    assert self._isApprovedOrOwner(_sender, _tokenId)
+    assert self._isApprovedOrOwner(owner, _sender, _tokenId)
     # Throws if `_to` is the zero address
     assert _to != empty(address)
-    # Clear approval. Throws if `_from` is not the current owner
-    self._clearApproval(_from, _tokenId)
-    # Remove NFT. Throws if `_tokenId` is not a valid NFT
-    self._removeTokenFrom(_from, _tokenId)
+    # Clear approval
+    self._clearApproval(_tokenId)
+    # Remove NFT
+    self._removeTokenFrom(_from, self._unpackOwnerIndex(tokenData))
     # Add NFT
-    self._addTokenTo(_to, _tokenId)
+    owner_index: uint256 = self._addTokenTo(_to, _tokenId)
+    self.idToTokenData[_tokenId] = self._packTokenData(
+        _to,
+        owner_index,
+        self._unpackIndex(tokenData)
+    )
     # Increment nonce for token
     self.idToNonce[_tokenId] += 1
     # Log the transfer
@@ -541,11 +674,10 @@ def _setTokenURI(_tokenId: uint256, _tokenURI: String[64]):
     @dev Set the URI for a token
          Throws if the token ID does not exist
     """
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
 
     self.idToURI[_tokenId] = _tokenURI
 
-
 ### TRANSFER FUNCTIONS ###
 
 @external
@@ -603,17 +735,17 @@ def approve(_approved: address, _tokenId: uint256):
     @param _approved Address to be approved for the given NFT ID.
     @param _tokenId ID of the token to be approved.
     """
-    owner: address = self.idToOwner[_tokenId]
+    owner: address = self._ownerOf(_tokenId)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
     # Throws if `_approved` is the current owner
     assert _approved != owner
     # Check requirements
-    senderIsOwner: bool = self.idToOwner[_tokenId] == msg.sender
+    senderIsOwner: bool = owner == msg.sender
     senderIsApprovedForAll: bool = (self.ownerToOperators[owner])[msg.sender]
     assert (senderIsOwner or senderIsApprovedForAll)
     # Set the approval
-    self._approve(_approved, _tokenId)
+    self.idToApprovals[_tokenId] = _approved
     log Approval(owner, _approved, _tokenId)
 
 
@@ -640,7 +772,7 @@ def _mint(_to: address, _tokenURI: String[64]) -> bool:
     """
     @dev Function to mint tokens
          Throws if `_to` is zero address.
-         Throws if `_tokenId` is owned by someone.
+         Throws if the token ID would exceed `self.maxSupply`.
     @param _to The address that will receive the minted tokens.
     @param _tokenURI The token URI
     @return A boolean that indicates if the operation was successful.
@@ -648,19 +780,18 @@ def _mint(_to: address, _tokenURI: String[64]) -> bool:
     # Throws if `_to` is zero address
     assert _to != empty(address)
 
-    # Throws if '_tokenId' is equal to or greater than 'self.maxSupply'
-    assert self.tokenId < self.maxSupply
-
-    # Add NFT. Throws if `_tokenId` is owned by someone
-    self.tokenId += 1
-    _tokenId: uint256 = self.tokenId
+    # Throws if '_tokenId' is greater than 'self.maxSupply'
+    _tokenId: uint256 = self.tokenId + 1
+    assert _tokenId <= self.maxSupply
+    self.tokenId = _tokenId
 
-    self._addTokenTo(_to, _tokenId)
-    current_index: uint256 = self._totalSupply() - self.burntCount
+    # Add NFT. Token IDs are never reused, so `_tokenId` is not owned by anyone
+    owner_index: uint256 = self._addTokenTo(_to, _tokenId)
+    current_index: uint256 = _tokenId - self.burntCount
 
     self.indexToTokenId[current_index] = _tokenId
-    self.tokenIdToIndex[_tokenId] = current_index
-    self._setTokenURI(_tokenId, _tokenURI)
+    self.idToTokenData[_tokenId] = self._packTokenData(_to, owner_index, current_index)
+    self.idToURI[_tokenId] = _tokenURI
     log Transfer(empty(address), _to, _tokenId)
 
     return True
@@ -683,6 +814,76 @@ def mint(_to: address, _tokenURI: String[64]) -> bool:
     return True
 
 
+@payable
+@external
+def mintBatch(
+    _recipients: DynArray[address, MAX_MINT_BATCH_SIZE],
+    _tokenURIs: DynArray[String[64], MAX_MINT_BATCH_SIZE]
+) -> bool:
+    """
+    @dev Function to mint a batch of tokens. Token IDs are assigned in the order of
+         `_recipients`. `tokenId` is read and written once for the batch, and the
+         balance of a recipient is written once for each consecutive run of mints to it,
+         so recipients should be grouped together.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_recipients` and `_tokenURIs` have different lengths.
+         Throws if any of `_recipients` is zero address.
+         Throws if the batch would exceed `self.maxSupply`.
+    @param _recipients The addresses that will receive the minted tokens.
+    @param _tokenURIs The token URIs, in the same order as `_recipients`.
+    @return Boolean indicating if operation was successful
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+
+    batch_size: uint256 = len(_recipients)
+    assert batch_size == len(_tokenURIs)
+
+    _tokenId: uint256 = self.tokenId
+
+    # Throws if the last token ID is greater than 'self.maxSupply'
+    assert _tokenId + batch_size <= self.maxSupply
+
+    current_index: uint256 = _tokenId - self.burntCount
+    current_owner: address = empty(address)
+    current_count: uint256 = 0
+
+    for i in range(MAX_MINT_BATCH_SIZE):
+        if i == batch_size:
+            break
+
+        _to: address = _recipients[i]
+
+        if _to != current_owner:
+            # Throws if `_to` is zero address
+            assert _to != empty(address)
+
+            # Write the balance of the previous run of recipients
+            if current_owner != empty(address):
+                self.ownerToNFTokenCount[current_owner] = current_count
+
+            current_owner = _to
+            current_count = self.ownerToNFTokenCount[_to]
+
+        _tokenId += 1
+        current_count += 1
+        current_index += 1
+
+        # Token IDs in the batch have never been minted, so they are not owned by anyone
+        self.ownerToNFTokenIdList[_to][current_count] = _tokenId
+        self.indexToTokenId[current_index] = _tokenId
+        self.idToTokenData[_tokenId] = self._packTokenData(_to, current_count, current_index)
+
+        self.idToURI[_tokenId] = _tokenURIs[i]
+        log Transfer(empty(address), _to, _tokenId)
+
+    if current_owner != empty(address):
+        self.ownerToNFTokenCount[current_owner] = current_count
+
+    self.tokenId = _tokenId
+    return True
+
+
 @external
 def withdraw():
     """
@@ -701,24 +902,31 @@ def burn(_tokenId: uint256):
          Throws if `_tokenId` is not a valid NFT.
     @param _tokenId uint256 id of the ERC721 token to be burned.
     """
-    # Check requirements
-    assert self._isApprovedOrOwner(msg.sender, _tokenId)
-    owner: address = self.idToOwner[_tokenId]
+    tokenData: uint256 = self.idToTokenData[_tokenId]
+    owner: address = self._unpackOwner(tokenData)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
-    self._clearApproval(owner, _tokenId)
-    self._removeTokenFrom(owner, _tokenId)
-    current_index: uint256 = self.tokenIdToIndex[_tokenId]
-    last_index: uint256 = self._totalSupply() - self.burntCount
+    # Check requirements
+    assert self._isApprovedOrOwner(owner, msg.sender, _tokenId)
+    self._clearApproval(_tokenId)
+    self._removeTokenFrom(owner, self._unpackOwnerIndex(tokenData))
+
+    current_index: uint256 = self._unpackIndex(tokenData)
+    last_index: uint256 = self._totalSupply()
 
-    last_index_token_id: uint256 = self.indexToTokenId[last_index]
+    if current_index != last_index:
+        last_index_token_id: uint256 = self.indexToTokenId[last_index]
 
-    # Set last index to current index
-    self.indexToTokenId[current_index] = last_index_token_id
-    self.tokenIdToIndex[last_index_token_id] = current_index
+        # Set last index to current index
+        self.indexToTokenId[current_index] = last_index_token_id
+        self.idToTokenData[last_index_token_id] = self._setIndex(
+            self.idToTokenData[last_index_token_id],
+            current_index
+        )
 
-    # Remove burnt token from mapping of token ID to index
-    self.tokenIdToIndex[_tokenId] = 0
+    # Remove burnt token from the token list and delete its token data
+    self.indexToTokenId[last_index] = 0
+    self.idToTokenData[_tokenId] = 0
 
 	# Increment coun of burnt tokens
     self.burntCount += 1
@@ -728,30 +936,20 @@ def burn(_tokenId: uint256):
 
 ### EIP-4494 functions
 
-@external
-def permit(
+@view
+@internal
+def _permitSigner(
     spender: address,
     tokenId: uint256,
+    nonce: uint256,
     deadline: uint256,
-    signature: Bytes[65]
-) -> bool:
+    r: uint256,
+    s: uint256,
+    v: uint256
+) -> address:
     """
-    @dev Permit address to transfer owner's NFT by owner's signature
-    @param spender The address which is allowed to transfer the NFT
-    @param tokenId The token ID of the NFT
-    @param deadline The timestamp after which the Permit is no longer valid
-    @param signature A valid secp256k1 signature of Permit by owner encoded as r, s and v
-    @return True, if transaction completes successfully
+    @dev Returns the signer of a Permit, or zero address if the signature is invalid
     """
-    # Throws if current block is greater than deadline
-    assert deadline >= block.timestamp, "Deadline must be equal to or greater than current block"
-
-    # Throws if token belongs to zero address
-    assert self.idToOwner[tokenId] != empty(address), "Token is owned by zero address"
-
-    _owner: address = self.idToOwner[tokenId]
-    _nonce: uint256 = self.idToNonce[tokenId]
-
     # Need to derive nonce and signer from signature
     digest: bytes32 = keccak256(
         concat( # not sure why _abi_encode does not work
@@ -762,21 +960,152 @@ def permit(
                     PERMIT_TYPE_HASH,
                     spender,
                     tokenId,
-                    _nonce,
+                    nonce,
                     deadline
                 )
             )
         )
     )
+
+    return ecrecover(digest, v, r, s)
+
+
+@internal
+def _permit(
+    spender: address,
+    tokenId: uint256,
+    deadline: uint256,
+    r: uint256,
+    s: uint256,
+    v: uint256
+):
+    """
+    @dev Permit address to transfer owner's NFT by the r, s and v of owner's signature
+    """
+    # Throws if current block is greater than deadline
+    assert deadline >= block.timestamp, "Deadline must be equal to or greater than current block"
+
+    _owner: address = self._ownerOf(tokenId)
+
+    # Throws if token belongs to zero address
+    assert _owner != empty(address), "Token is owned by zero address"
+
+    # Throws if signature is not from owner
+    signer: address = self._permitSigner(spender, tokenId, self.idToNonce[tokenId], deadline, r, s, v)
+    assert signer == _owner, "Invalid signature"
+
+    # Set the approval
+    self.idToApprovals[tokenId] = spender
+    log Approval(_owner, spender, tokenId)
+
+
+@external
+def permit(
+    spender: address,
+    tokenId: uint256,
+    deadline: uint256,
+    signature: Bytes[65]
+) -> bool:
+    """
+    @dev Permit address to transfer owner's NFT by owner's signature
+    @param spender The address which is allowed to transfer the NFT
+    @param tokenId The token ID of the NFT
+    @param deadline The timestamp after which the Permit is no longer valid
+    @param signature A valid secp256k1 signature of Permit by owner encoded as r, s and v
+    @return True, if transaction completes successfully
+    """
     # unpack signature into r, s and v
     r: uint256 = convert(slice(signature, 0, 32), uint256)
     s: uint256 = convert(slice(signature, 32, 32), uint256)
     v: uint256 = convert(slice(signature, 64, 1), uint256)
 
-    # Throws if signature is not from owner
-    assert ecrecover(digest, v, r, s) == _owner, "Invalid signature"
+    self._permit(spender, tokenId, deadline, r, s, v)
+    return True
 
-    self._approve(spender, tokenId)
-    log Approval(_owner, spender, tokenId)
 
+@external
+def permitCompact(
+    spender: address,
+    tokenId: uint256,
+    deadline: uint256,
+    r: bytes32,
+    vs: bytes32
+) -> bool:
+    """
+    @dev Permit address to transfer owner's NFT by owner's EIP-2098 compact signature
+         [https://eips.ethereum.org/EIPS/eip-2098], which takes 96 fewer bytes of
+         calldata than `permit`.
+    @param spender The address which is allowed to transfer the NFT
+    @param tokenId The token ID of the NFT
+    @param deadline The timestamp after which the Permit is no longer valid
+    @param r The r of a valid secp256k1 signature of Permit by owner
+    @param vs The s of the signature, with the parity of its v in the highest bit
+    @return True, if transaction completes successfully
+    """
+    _vs: uint256 = convert(vs, uint256)
+    self._permit(
+        spender,
+        tokenId,
+        deadline,
+        convert(r, uint256),
+        _vs & COMPACT_S_MASK,
+        shift(_vs, -255) + 27
+    )
     return True
+
+
+@external
+def permitBatch(
+    spenders: DynArray[address, MAX_PERMIT_BATCH_SIZE],
+    tokenIds: DynArray[uint256, MAX_PERMIT_BATCH_SIZE],
+    deadlines: DynArray[uint256, MAX_PERMIT_BATCH_SIZE],
+    signatures: DynArray[Bytes[65], MAX_PERMIT_BATCH_SIZE]
+) -> DynArray[uint256, MAX_PERMIT_BATCH_SIZE]:
+    """
+    @dev Apply a batch of permits, as `permit` does for each entry. An entry whose permit
+         is expired, is for a token owned by zero address, or is not signed by the owner
+         is skipped instead of reverting the batch, and a PermitFailed event is emitted.
+         The owner and nonce of each token are read once.
+         Throws if the arguments have different lengths.
+    @param spenders The addresses which are allowed to transfer each NFT
+    @param tokenIds The token IDs of the NFTs
+    @param deadlines The timestamps after which each Permit is no longer valid
+    @param signatures The signatures of each Permit by owner encoded as r, s and v
+    @return The indices of the entries that were skipped
+    """
+    batch_size: uint256 = len(tokenIds)
+    assert batch_size == len(spenders), "Arguments have different lengths"
+    assert batch_size == len(deadlines), "Arguments have different lengths"
+    assert batch_size == len(signatures), "Arguments have different lengths"
+
+    failed: DynArray[uint256, MAX_PERMIT_BATCH_SIZE] = []
+
+    for i in range(MAX_PERMIT_BATCH_SIZE):
+        if i == batch_size:
+            break
+
+        _tokenId: uint256 = tokenIds[i]
+        _owner: address = empty(address)
+        signer: address = empty(address)
+
+        if deadlines[i] >= block.timestamp and len(signatures[i]) == 65:
+            _owner = self._ownerOf(_tokenId)
+            signer = self._permitSigner(
+                spenders[i],
+                _tokenId,
+                self.idToNonce[_tokenId],
+                deadlines[i],
+                convert(slice(signatures[i], 0, 32), uint256),
+                convert(slice(signatures[i], 32, 32), uint256),
+                convert(slice(signatures[i], 64, 1), uint256)
+            )
+
+        if _owner == empty(address) or signer != _owner:
+            failed.append(i)
+            log PermitFailed(i, _tokenId)
+            continue
+
+        self.idToApprovals[_tokenId] = spenders[i]
+        log Approval(_owner, spenders[i], _tokenId)
+
+    return failed
@@ -56,6 +56,9 @@ tokenIdToOwner: HashMap[uint256, address]
 # @dev Mapping from address to balance
 ownerToBalance: HashMap[address, uint256]
 
+# @dev Mapping from address to number of valid tokens
+ownerToValidBalance: HashMap[address, uint256]
+
 # @dev Mapping from token ID to URI
 tokenIdToURI: HashMap[uint256, String[64]]
 
@@ -72,14 +75,12 @@ SUPPORTED_INTERFACES: constant(bytes4[5]) = [
 	0x79297b26,  # EIP_4671_DELEGATE_INTERFACE_ID
 ]
 
-# @dev Maximum number of tokens that can be issued for an address
-# 	   This is meant to overcome Vyper's feature of limiting range iteration and
-#	   can be set to an arbitrary high value.
-MAX_BALANCE: constant(uint256) = 100
-
 # @dev Size per batch for batch minting and batch delegating
 BATCH_SIZE: constant(uint256) = 3
 
+# @dev Maximum number of entries returned by a single call to a bulk view function
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
 ### Constructor
 
 
@@ -132,6 +133,7 @@ def _mint(_to: address, _issuer: address):
 	self.ownerToBalance[_to] = _current_owner_index
 	self.ownerToIndexToId[_to][_current_owner_index] = _current_token_id
 	self.ownerToBalance[_to] = _current_owner_index + 1
+	self.ownerToValidBalance[_to] += 1
 
 	log Mint(_to, _current_token_id, _issuer)
 
@@ -142,9 +144,12 @@ def _invalidate(_tokenId: uint256):
 	@dev Internal function to invalidate a token for an address
 	@param _tokenId The token ID to be invalidated
 	"""
-	self.tokenIdToValidity[_tokenId] = False
 	_owner: address = self.tokenIdToOwner[_tokenId]
 
+	if self.tokenIdToValidity[_tokenId]:
+		self.tokenIdToValidity[_tokenId] = False
+		self.ownerToValidBalance[_owner] -= 1
+
 	log Invalidate(_owner, _tokenId)
 
 
@@ -340,14 +345,7 @@ def hasValidToken(owner: address) -> bool:
 	@param owner Address to check for
 	@return A boolean that indicates if the owner has a valid token
 	"""
-	_owner_balance: uint256 = self.ownerToBalance[owner]
-
-	for i in range(MAX_BALANCE):
-		_tokenId: uint256 = self.ownerToIndexToId[owner][i]
-		if self.tokenIdToValidity[_tokenId] == True:
-			return True
-
-	return False
+	return self.ownerToValidBalance[owner] > 0
 
 
 @external
@@ -435,3 +433,43 @@ def total() -> uint256:
 	@return Total number of tokens minted
 	"""
 	return self.totalSupply
+
+
+@external
+@view
+def tokensOfOwner(owner: address, start: uint256, count: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+	"""
+	@notice Get the token IDs of a page of tokens of an owner
+	@dev Throws if `count` is greater than `MAX_PAGE_SIZE`
+	@param owner Address for whom to get the tokens
+	@param start Index of the first token, counting from 0 as in `tokenOfOwnerByIndex`
+	@param count Maximum number of tokens to return
+	@return Token IDs, which are fewer than `count` at the end of the tokens of `owner`
+	"""
+	assert count <= MAX_PAGE_SIZE, "Count exceeds maximum page size"
+
+	_balance: uint256 = self.ownerToBalance[owner]
+	_tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+	for i in range(MAX_PAGE_SIZE):
+		if i == count or start + i >= _balance:
+			break
+
+		_tokens.append(self.ownerToIndexToId[owner][start + i])
+
+	return _tokens
+
+
+@external
+@view
+def ownersOf(tokenIds: DynArray[uint256, MAX_PAGE_SIZE]) -> DynArray[address, MAX_PAGE_SIZE]:
+	"""
+	@notice Get the owners of a list of tokens
+	@param tokenIds The token IDs to check for
+	@return Addresses that own the token IDs, in the same order, with zero address for
+			token IDs that do not exist
+	"""
+	_owners: DynArray[address, MAX_PAGE_SIZE] = []
+	for _tokenId in tokenIds:
+		_owners.append(self.tokenIdToOwner[_tokenId])
+
+	return _owners
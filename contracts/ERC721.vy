@@ -97,11 +97,10 @@ burntCount: uint256
 # @dev Mapping from index to token ID
 indexToTokenId: HashMap[uint256, uint256]
 
-# @dev Mapping from token ID to index
-tokenIdToIndex: HashMap[uint256, uint256]
-
-# @dev Mapping from NFT ID to the address that owns it.
-idToOwner: HashMap[uint256, address]
+# @dev Mapping from NFT ID to its packed token data. The lower 160 bits hold the address
+#      that owns it, the next 48 bits hold its index in the owner's token list, and the
+#      upper 48 bits hold its index in the token list.
+idToTokenData: HashMap[uint256, uint256]
 
 # @dev Mapping from NFT ID to approved address.
 idToApprovals: HashMap[uint256, address]
@@ -112,9 +111,6 @@ ownerToNFTokenCount: HashMap[address, uint256]
 # @dev Mapping from owner address to mapping of index to tokenIds
 ownerToNFTokenIdList: HashMap[address, HashMap[uint256, uint256]]
 
-# @dev Mapping from NFT ID to index of owner
-tokenToOwnerIndex: HashMap[uint256, uint256]
-
 # @dev Mapping from owner address to mapping of operator addresses.
 ownerToOperators: HashMap[address, HashMap[address, bool]]
 
@@ -139,6 +135,30 @@ ERC721_ENUMERABLE_INTERFACE_ID: constant(bytes4) = 0x780e9d63
 # @dev ERC165 interface ID of ERC721TokenReceiver
 ERC721_TOKEN_RECEIVER_INTERFACE_ID: constant(bytes4) = 0x150b7a02
 
+# @dev Mask for the owner address in packed token data
+OWNER_MASK: constant(uint256) = 2 ** 160 - 1
+
+# @dev Bit offset of the index in the owner's token list in packed token data
+OWNER_INDEX_OFFSET: constant(int128) = 160
+
+# @dev Bit offset of the index in the token list in packed token data
+INDEX_OFFSET: constant(int128) = 208
+
+# @dev Mask for an index in packed token data, after shifting it to the lowest bits
+INDEX_MASK: constant(uint256) = 2 ** 48 - 1
+
+# @dev Mask for packed token data without the index in the owner's token list
+WITHOUT_OWNER_INDEX_MASK: constant(uint256) = (2 ** 48 - 1) * 2 ** 208 + 2 ** 160 - 1
+
+# @dev Mask for packed token data without the index in the token list
+WITHOUT_INDEX_MASK: constant(uint256) = 2 ** 208 - 1
+
+# @dev Maximum number of tokens that can be minted in a single `mintBatch` call
+MAX_MINT_BATCH_SIZE: constant(uint256) = 256
+
+# @dev Maximum number of entries returned by a single call to a bulk view function
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
 
 @external
 def __init__(
@@ -190,6 +210,72 @@ def _totalSupply() -> uint256:
     return self.tokenId - self.burntCount
 
 
+### TOKEN DATA PACKING ###
+
+@pure
+@internal
+def _packTokenData(_owner: address, _ownerIndex: uint256, _index: uint256) -> uint256:
+    """
+    @dev Pack the owner of a NFT, its index in the owner's token list and its index in the
+         token list into a single word
+    """
+    return convert(_owner, uint256) | shift(_ownerIndex, OWNER_INDEX_OFFSET) | shift(_index, INDEX_OFFSET)
+
+
+@pure
+@internal
+def _unpackOwner(_tokenData: uint256) -> address:
+    """
+    @dev Returns the owner from packed token data
+    """
+    return convert(_tokenData & OWNER_MASK, address)
+
+
+@pure
+@internal
+def _unpackOwnerIndex(_tokenData: uint256) -> uint256:
+    """
+    @dev Returns the index in the owner's token list from packed token data
+    """
+    return shift(_tokenData, -OWNER_INDEX_OFFSET) & INDEX_MASK
+
+
+@pure
+@internal
+def _unpackIndex(_tokenData: uint256) -> uint256:
+    """
+    @dev Returns the index in the token list from packed token data
+    """
+    return shift(_tokenData, -INDEX_OFFSET)
+
+
+@pure
+@internal
+def _setOwnerIndex(_tokenData: uint256, _ownerIndex: uint256) -> uint256:
+    """
+    @dev Returns packed token data with the index in the owner's token list replaced
+    """
+    return (_tokenData & WITHOUT_OWNER_INDEX_MASK) | shift(_ownerIndex, OWNER_INDEX_OFFSET)
+
+
+@pure
+@internal
+def _setIndex(_tokenData: uint256, _index: uint256) -> uint256:
+    """
+    @dev Returns packed token data with the index in the token list replaced
+    """
+    return (_tokenData & WITHOUT_INDEX_MASK) | shift(_index, INDEX_OFFSET)
+
+
+@view
+@internal
+def _ownerOf(_tokenId: uint256) -> address:
+    """
+    @dev Returns the owner of a NFT, or zero address if `_tokenId` is not a valid NFT
+    """
+    return self._unpackOwner(self.idToTokenData[_tokenId])
+
+
 @view
 @external
 def supportsInterface(_interfaceID: bytes4) -> bool:
@@ -228,7 +314,7 @@ def ownerOf(_tokenId: uint256) -> address:
          Throws if `_tokenId` is not a valid NFT.
     @param _tokenId The identifier for an NFT.
     """
-    owner: address = self.idToOwner[_tokenId]
+    owner: address = self._ownerOf(_tokenId)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
     return owner
@@ -243,7 +329,7 @@ def getApproved(_tokenId: uint256) -> address:
     @param _tokenId ID of the NFT to query the approval of.
     """
     # Throws if `_tokenId` is not a valid NFT
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
     return self.idToApprovals[_tokenId]
 
 
@@ -283,7 +369,7 @@ def tokenURI(_tokenId: uint256) -> String[128]:
     @dev Returns the URI for the token ID
     @param _tokenId id of the ERC721 token
     """
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
 
     return concat(
         self.baseTokenURI,
@@ -307,7 +393,7 @@ def tokenByIndex(_index: uint256) -> uint256:
     @dev Get token by index
          Throws if '_index' is larger than totalSupply()
     """
-    assert _index <= self._totalSupply() - self.burntCount
+    assert _index <= self._totalSupply()
     assert _index > 0
 
     return self.indexToTokenId[_index]
@@ -332,113 +418,145 @@ def baseURI() -> String[64]:
     return self.baseTokenURI
 
 
+### BULK VIEW FUNCTIONS ###
+
+@view
+@external
+def tokensOfOwner(
+    _owner: address,
+    _start: uint256,
+    _count: uint256
+) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens of `_owner`, starting from index `_start`. Indexes count
+         from 1, as in `tokenOfOwnerByIndex`. Fewer tokens are returned at the end of the
+         token list of `_owner`.
+         Throws if `_owner` is zero address.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._balanceOf(_owner)
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _count or _start + i > last_index:
+            break
+
+        tokens.append(self.ownerToNFTokenIdList[_owner][_start + i])
+
+    return tokens
+
+
+@view
+@external
+def tokensByIndexRange(_start: uint256, _count: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens starting from index `_start`. Indexes count from 1, as
+         in `tokenByIndex`. Fewer tokens are returned at the end of the token list.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._totalSupply()
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _count or _start + i > last_index:
+            break
+
+        tokens.append(self.indexToTokenId[_start + i])
+
+    return tokens
+
+
+@view
+@external
+def ownersOf(_tokenIds: DynArray[uint256, MAX_PAGE_SIZE]) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @dev Get the owners of `_tokenIds`, in the same order. Unlike `ownerOf`, the owner of a
+         token ID that is not a valid NFT is returned as zero address.
+    """
+    owners: DynArray[address, MAX_PAGE_SIZE] = []
+    for _tokenId in _tokenIds:
+        owners.append(self._ownerOf(_tokenId))
+
+    return owners
+
+
 ### TRANSFER FUNCTION HELPERS ###
 
 @view
 @internal
-def _isApprovedOrOwner(_spender: address, _tokenId: uint256) -> bool:
+def _isApprovedOrOwner(_owner: address, _spender: address, _tokenId: uint256) -> bool:
     """
     @dev Returns whether the given spender can transfer a given token ID
+    @param owner address of the owner of the token
     @param spender address of the spender to query
     @param tokenId uint256 ID of the token to be transferred
     @return bool whether the msg.sender is approved for the given token ID,
         is an operator of the owner, or is the owner of the token
     """
-    owner: address = self.idToOwner[_tokenId]
-    spenderIsOwner: bool = owner == _spender
+    spenderIsOwner: bool = _owner == _spender
     spenderIsApproved: bool = _spender == self.idToApprovals[_tokenId]
-    spenderIsApprovedForAll: bool = (self.ownerToOperators[owner])[_spender]
+    spenderIsApprovedForAll: bool = (self.ownerToOperators[_owner])[_spender]
     return (spenderIsOwner or spenderIsApproved) or spenderIsApprovedForAll
 
 
 @internal
-def _addTokenToOwnerList(_to: address, _tokenId: uint256):
+def _addTokenTo(_to: address, _tokenId: uint256) -> uint256:
     """
-    @dev Add a NFT to an index mapping to a given address
+    @dev Add a NFT to the token list of a given address. The caller is responsible for
+         writing the packed token data of `_tokenId`.
     @param to address of the receiver
     @param tokenId uint256 ID Of the token to be added
+    @return uint256 index of the token in the token list of `_to`
     """
-    current_count: uint256 = self._balanceOf(_to)
+    # Change count tracking
+    current_count: uint256 = self.ownerToNFTokenCount[_to] + 1
+    self.ownerToNFTokenCount[_to] = current_count
 
+    # Update owner token index tracking
     self.ownerToNFTokenIdList[_to][current_count] = _tokenId
-    self.tokenToOwnerIndex[_tokenId] = current_count
+    return current_count
 
 
 @internal
-def _removeTokenFromOwnerList(_from: address, _tokenId: uint256):
+def _removeTokenFrom(_from: address, _ownerIndex: uint256):
     """
-    @dev Remove a NFT from an index mapping to a given address
+    @dev Remove a NFT from the token list of a given address, by moving the last token
+         of the list into its place. The caller is responsible for writing the packed
+         token data of the removed token.
     @param from address of the sender
-    @param tokenId uint256 ID Of the token to be removed
+    @param ownerIndex uint256 index of the token in the token list of `_from`
     """
-    # Delete
-    current_count: uint256 = self._balanceOf(_from)
-    current_index: uint256 = self.tokenToOwnerIndex[_tokenId]
-
-    if current_count == current_index:
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_count] = 0
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[_tokenId] = 0
+    current_count: uint256 = self.ownerToNFTokenCount[_from]
 
-    else:
+    if current_count != _ownerIndex:
         lastTokenId: uint256 = self.ownerToNFTokenIdList[_from][current_count]
 
-        # Add
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_index] = lastTokenId
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[lastTokenId] = current_index
+        # Move the last token into the index of the removed token
+        self.ownerToNFTokenIdList[_from][_ownerIndex] = lastTokenId
+        self.idToTokenData[lastTokenId] = self._setOwnerIndex(
+            self.idToTokenData[lastTokenId],
+            _ownerIndex
+        )
 
-        # Delete
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_count] = 0
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[_tokenId] = 0
+    # Delete the last index
+    self.ownerToNFTokenIdList[_from][current_count] = 0
 
-
-@internal
-def _addTokenTo(_to: address, _tokenId: uint256):
-    """
-    @dev Add a NFT to a given address
-         Throws if `_tokenId` is owned by someone.
-    """
-    # Throws if `_tokenId` is owned by someone
-    assert self.idToOwner[_tokenId] == empty(address)
-    # Change the owner
-    self.idToOwner[_tokenId] = _to
     # Change count tracking
-    self.ownerToNFTokenCount[_to] += 1
-	# Update owner token index tracking
-    self._addTokenToOwnerList(_to, _tokenId)
+    new_count: uint256 = current_count - 1
+    self.ownerToNFTokenCount[_from] = new_count
 
 
 @internal
-def _removeTokenFrom(_from: address, _tokenId: uint256):
+def _clearApproval(_tokenId: uint256):
     """
-    @dev Remove a NFT from a given address
-         Throws if `_from` is not the current owner.
+    @dev Clear an approval of a given NFT
     """
-    # Throws if `_from` is not the current owner
-    assert self.idToOwner[_tokenId] == _from
-
-	# Update owner token index tracking
-    self._removeTokenFromOwnerList(_from, _tokenId)
-
-    # Change the owner
-    self.idToOwner[_tokenId] = empty(address)
-    # Change count tracking
-    self.ownerToNFTokenCount[_from] -= 1
-
-
-@internal
-def _clearApproval(_owner: address, _tokenId: uint256):
-    """
-    @dev Clear an approval of a given address
-         Throws if `_owner` is not the current owner.
-    """
-    # Throws if `_owner` is not the current owner
-    assert self.idToOwner[_tokenId] == _owner
     if self.idToApprovals[_tokenId] != empty(address):
         # Reset approvals
         self.idToApprovals[_tokenId] = empty(address)
@@ -454,16 +572,27 @@ def _transferFrom(_from: address, _to: address, _tokenId: uint256, _sender: addr
          Throws if `_from` is not the current owner.
          Throws if `_tokenId` is not a valid NFT.
     """
+    tokenData: uint256 = self.idToTokenData[_tokenId]
+    owner: address = self._unpackOwner(tokenData)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Throws if `_from` is not the current owner
+    assert owner == _from
     # Check requirements
-    assert self._isApprovedOrOwner(_sender, _tokenId)
+    assert self._isApprovedOrOwner(owner, _sender, _tokenId)
     # Throws if `_to` is the zero address
     assert _to != empty(address)
-    # Clear approval. Throws if `_from` is not the current owner
-    self._clearApproval(_from, _tokenId)
-    # Remove NFT. Throws if `_tokenId` is not a valid NFT
-    self._removeTokenFrom(_from, _tokenId)
+    # Clear approval
+    self._clearApproval(_tokenId)
+    # Remove NFT
+    self._removeTokenFrom(_from, self._unpackOwnerIndex(tokenData))
     # Add NFT
-    self._addTokenTo(_to, _tokenId)
+    owner_index: uint256 = self._addTokenTo(_to, _tokenId)
+    self.idToTokenData[_tokenId] = self._packTokenData(
+        _to,
+        owner_index,
+        self._unpackIndex(tokenData)
+    )
     # Log the transfer
     log Transfer(_from, _to, _tokenId)
 
@@ -474,7 +603,7 @@ def _setTokenURI(_tokenId: uint256, _tokenURI: String[64]):
     @dev Set the URI for a token
          Throws if the token ID does not exist
     """
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
 
     self.idToURI[_tokenId] = _tokenURI
 
@@ -535,13 +664,13 @@ def approve(_approved: address, _tokenId: uint256):
     @param _approved Address to be approved for the given NFT ID.
     @param _tokenId ID of the token to be approved.
     """
-    owner: address = self.idToOwner[_tokenId]
+    owner: address = self._ownerOf(_tokenId)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
     # Throws if `_approved` is the current owner
     assert _approved != owner
     # Check requirements
-    senderIsOwner: bool = self.idToOwner[_tokenId] == msg.sender
+    senderIsOwner: bool = owner == msg.sender
     senderIsApprovedForAll: bool = (self.ownerToOperators[owner])[msg.sender]
     assert (senderIsOwner or senderIsApprovedForAll)
     # Set the approval
@@ -572,7 +701,7 @@ def _mint(_to: address, _tokenURI: String[64]) -> bool:
     """
     @dev Function to mint tokens
          Throws if `_to` is zero address.
-         Throws if `_tokenId` is owned by someone.
+         Throws if the token ID would exceed `self.maxSupply`.
     @param _to The address that will receive the minted tokens.
     @param _tokenURI The token URI
     @return A boolean that indicates if the operation was successful.
@@ -580,19 +709,18 @@ def _mint(_to: address, _tokenURI: String[64]) -> bool:
     # Throws if `_to` is zero address
     assert _to != empty(address)
 
-    # Throws if '_tokenId' is equal to or greater than 'self.maxSupply'
-    assert self.tokenId < self.maxSupply
-
-    # Add NFT. Throws if `_tokenId` is owned by someone
-    self.tokenId += 1
-    _tokenId: uint256 = self.tokenId
+    # Throws if '_tokenId' is greater than 'self.maxSupply'
+    _tokenId: uint256 = self.tokenId + 1
+    assert _tokenId <= self.maxSupply
+    self.tokenId = _tokenId
 
-    self._addTokenTo(_to, _tokenId)
-    current_index: uint256 = self._totalSupply() - self.burntCount
+    # Add NFT. Token IDs are never reused, so `_tokenId` is not owned by anyone
+    owner_index: uint256 = self._addTokenTo(_to, _tokenId)
+    current_index: uint256 = _tokenId - self.burntCount
 
     self.indexToTokenId[current_index] = _tokenId
-    self.tokenIdToIndex[_tokenId] = current_index
-    self._setTokenURI(_tokenId, _tokenURI)
+    self.idToTokenData[_tokenId] = self._packTokenData(_to, owner_index, current_index)
+    self.idToURI[_tokenId] = _tokenURI
     log Transfer(empty(address), _to, _tokenId)
 
     return True
@@ -615,6 +743,76 @@ def mint(_to: address, _tokenURI: String[64]) -> bool:
     return True
 
 
+@payable
+@external
+def mintBatch(
+    _recipients: DynArray[address, MAX_MINT_BATCH_SIZE],
+    _tokenURIs: DynArray[String[64], MAX_MINT_BATCH_SIZE]
+) -> bool:
+    """
+    @dev Function to mint a batch of tokens. Token IDs are assigned in the order of
+         `_recipients`. `tokenId` is read and written once for the batch, and the
+         balance of a recipient is written once for each consecutive run of mints to it,
+         so recipients should be grouped together.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_recipients` and `_tokenURIs` have different lengths.
+         Throws if any of `_recipients` is zero address.
+         Throws if the batch would exceed `self.maxSupply`.
+    @param _recipients The addresses that will receive the minted tokens.
+    @param _tokenURIs The token URIs, in the same order as `_recipients`.
+    @return Boolean indicating if operation was successful
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+
+    batch_size: uint256 = len(_recipients)
+    assert batch_size == len(_tokenURIs)
+
+    _tokenId: uint256 = self.tokenId
+
+    # Throws if the last token ID is greater than 'self.maxSupply'
+    assert _tokenId + batch_size <= self.maxSupply
+
+    current_index: uint256 = _tokenId - self.burntCount
+    current_owner: address = empty(address)
+    current_count: uint256 = 0
+
+    for i in range(MAX_MINT_BATCH_SIZE):
+        if i == batch_size:
+            break
+
+        _to: address = _recipients[i]
+
+        if _to != current_owner:
+            # Throws if `_to` is zero address
+            assert _to != empty(address)
+
+            # Write the balance of the previous run of recipients
+            if current_owner != empty(address):
+                self.ownerToNFTokenCount[current_owner] = current_count
+
+            current_owner = _to
+            current_count = self.ownerToNFTokenCount[_to]
+
+        _tokenId += 1
+        current_count += 1
+        current_index += 1
+
+        # Token IDs in the batch have never been minted, so they are not owned by anyone
+        self.ownerToNFTokenIdList[_to][current_count] = _tokenId
+        self.indexToTokenId[current_index] = _tokenId
+        self.idToTokenData[_tokenId] = self._packTokenData(_to, current_count, current_index)
+
+        self.idToURI[_tokenId] = _tokenURIs[i]
+        log Transfer(empty(address), _to, _tokenId)
+
+    if current_owner != empty(address):
+        self.ownerToNFTokenCount[current_owner] = current_count
+
+    self.tokenId = _tokenId
+    return True
+
+
 @external
 def withdraw():
     """
@@ -633,24 +831,31 @@ def burn(_tokenId: uint256):
          Throws if `_tokenId` is not a valid NFT.
     @param _tokenId uint256 id of the ERC721 token to be burned.
     """
-    # Check requirements
-    assert self._isApprovedOrOwner(msg.sender, _tokenId)
-    owner: address = self.idToOwner[_tokenId]
+    tokenData: uint256 = self.idToTokenData[_tokenId]
+    owner: address = self._unpackOwner(tokenData)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
-    self._clearApproval(owner, _tokenId)
-    self._removeTokenFrom(owner, _tokenId)
-    current_index: uint256 = self.tokenIdToIndex[_tokenId]
-    last_index: uint256 = self._totalSupply() - self.burntCount
-
-    last_index_token_id: uint256 = self.indexToTokenId[last_index]
-
-    # Set last index to current index
-    self.indexToTokenId[current_index] = last_index_token_id
-    self.tokenIdToIndex[last_index_token_id] = current_index
-
-    # Remove burnt token from mapping of token ID to index
-    self.tokenIdToIndex[_tokenId] = 0
+    # Check requirements
+    assert self._isApprovedOrOwner(owner, msg.sender, _tokenId)
+    self._clearApproval(_tokenId)
+    self._removeTokenFrom(owner, self._unpackOwnerIndex(tokenData))
+
+    current_index: uint256 = self._unpackIndex(tokenData)
+    last_index: uint256 = self._totalSupply()
+
+    if current_index != last_index:
+        last_index_token_id: uint256 = self.indexToTokenId[last_index]
+
+        # Set last index to current index
+        self.indexToTokenId[current_index] = last_index_token_id
+        self.idToTokenData[last_index_token_id] = self._setIndex(
+            self.idToTokenData[last_index_token_id],
+            current_index
+        )
+
+    # Remove burnt token from the token list and delete its token data
+    self.indexToTokenId[last_index] = 0
+    self.idToTokenData[_tokenId] = 0
 
 	# Increment coun of burnt tokens
     self.burntCount += 1
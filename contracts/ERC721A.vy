@@ -0,0 +1,790 @@
+# @version ^0.3.7
+
+"""
+@title ERC-721 non-fungible token standard with lazy ownership storage
+@license GPL-3.0
+@author Gary Tse
+@notice You can use this contract in place of `ERC721.vy` when tokens are minted in
+        large batches. It has the same external interface as `ERC721.vy`.
+@dev Ownership is only recorded for the first token of each run of consecutive token IDs
+     minted to the same address, based on the ERC721A design by Chiru Labs
+     [https://github.com/chiru-labs/ERC721A]. The owner of any other token is found by
+     scanning backwards to the nearest recorded ownership. Transfers and burns record
+     ownership of the next token ID if it is not recorded yet, so that runs stay intact.
+     Enumeration is computed by scanning token IDs instead of being stored, so
+     `tokenByIndex` and `tokenOfOwnerByIndex` are meant to be called off-chain.
+"""
+
+from vyper.interfaces import ERC721
+
+implements: ERC721
+
+# Interface for the contract called by safeTransferFrom()
+interface ERC721Receiver:
+    def onERC721Received(
+        _operator: address,
+        _from: address,
+        _tokenId: uint256,
+        _data: Bytes[1024]
+    ) -> bytes4: view
+
+
+# @dev Emits when ownership of any NFT changes by any mechanism. This event emits when NFTs are
+#      created (`from` == 0) and destroyed (`to` == 0). Exception: during contract creation, any
+#      number of NFTs may be created and assigned without emitting Transfer. At the time of any
+#      transfer, the approved address for that NFT (if any) is reset to none.
+# @param _from Sender of NFT (if address is zero address it indicates token creation).
+# @param _to Receiver of NFT (if address is zero address it indicates token destruction).
+# @param _tokenId The NFT that got transfered.
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    tokenId: indexed(uint256)
+
+# @dev This emits when the approved address for an NFT is changed or reaffirmed. The zero
+#      address indicates there is no approved address. When a Transfer event emits, this also
+#      indicates that the approved address for that NFT (if any) is reset to none.
+# @param _owner Owner of NFT.
+# @param _approved Address that we are approving.
+# @param _tokenId NFT which we are approving.
+event Approval:
+    owner: indexed(address)
+    approved: indexed(address)
+    tokenId: indexed(uint256)
+
+# @dev This emits when an operator is enabled or disabled for an owner. The operator can manage
+#      all NFTs of the owner.
+# @param _owner Owner of NFT.
+# @param _operator Address to which we are setting operator rights.
+# @param _approved Status of operator rights(true if operator rights are given and false if
+# revoked).
+event ApprovalForAll:
+    owner: indexed(address)
+    operator: indexed(address)
+    approved: bool
+
+
+tokenName: String[64]
+tokenSymbol: String[32]
+baseTokenURI: String[64]
+
+# @dev current count of token
+tokenId: uint256
+
+# @dev Maximum supply of token
+maxSupply: public(uint256)
+
+# @dev Beneficiary for withdrawal of funds
+beneficiary: address
+
+# @dev count of burnt tokens
+burntCount: uint256
+
+# @dev Mapping from NFT ID to the packed ownership of the run of tokens starting at that ID.
+#      The lower 160 bits hold the owner address, and `BURNT_FLAG` is set if the token has
+#      been burnt. A value of zero means that the ownership is recorded at a lower token ID.
+idToOwnership: HashMap[uint256, uint256]
+
+# @dev Mapping from NFT ID to approved address.
+idToApprovals: HashMap[uint256, address]
+
+# @dev Mapping from owner address to count of his tokens.
+ownerToNFTokenCount: HashMap[address, uint256]
+
+# @dev Mapping from owner address to mapping of operator addresses.
+ownerToOperators: HashMap[address, HashMap[address, bool]]
+
+#@dev Maping from NFT ID to token URI
+idToURI: HashMap[uint256, String[64]]
+
+# @dev Address of minter, who can mint a token
+minter: address
+
+# @dev ERC165 interface ID of ERC165
+ERC165_INTERFACE_ID: constant(bytes4) = 0x01ffc9a7
+
+# @dev ERC165 interface ID of ERC721
+ERC721_INTERFACE_ID: constant(bytes4) = 0x80ac58cd
+
+# @dev ERC165 interface ID of ERC721Metadata
+ERC721_METADATA_INTERFACE_ID: constant(bytes4) = 0x5b5e139f
+
+# @dev ERC165 interface ID of ERC721Enumerable
+ERC721_ENUMERABLE_INTERFACE_ID: constant(bytes4) = 0x780e9d63
+
+# @dev ERC165 interface ID of ERC721TokenReceiver
+ERC721_TOKEN_RECEIVER_INTERFACE_ID: constant(bytes4) = 0x150b7a02
+
+# @dev Maximum number of tokens that can be minted in a single `mintBatch` call. This is
+#      also the maximum length of a run of token IDs sharing a recorded ownership.
+MAX_MINT_BATCH_SIZE: constant(uint256) = 256
+
+# @dev Flag in a packed ownership for a burnt token
+BURNT_FLAG: constant(uint256) = 2 ** 160
+
+# @dev Mask for the owner address in a packed ownership
+OWNER_MASK: constant(uint256) = 2 ** 160 - 1
+
+# @dev Upper bound of token IDs scanned by the enumeration functions
+MAX_TOKEN_ID: constant(uint256) = 2 ** 64
+
+# @dev Maximum number of entries returned by a single call to a bulk view function
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
+
+@external
+def __init__(
+    _name: String[64],
+    _symbol: String[32],
+    _baseURI: String[64],
+    _maxSupply: uint256,
+    _minter: address,
+    _beneficiary: address
+):
+    """
+    @notice Initialize the NFT contract
+    @param _name Name of the token
+    @param _symbol Symbol of the token
+    @param _baseURI Base URI of the token metadata
+    @param _maxSupply Maximum supply of the token
+    @param _minter Address which can mint tokens
+    @param _beneficiary Address which funds will be withdrawn to
+    """
+    self.minter = _minter
+    self.tokenName = _name
+    self.tokenSymbol = _symbol
+    self.baseTokenURI = _baseURI
+    self.tokenId = 0
+    self.burntCount = 0
+    self.maxSupply = _maxSupply
+    self.beneficiary = _beneficiary
+
+
+@view
+@internal
+def _balanceOf(_owner: address) -> uint256:
+    """
+    @dev 	Returns number of tokens held by '_owner'
+    		Throws if '_owner' is zero address.
+    @param 	_owner Address to query
+    """
+    assert _owner != empty(address)
+    return self.ownerToNFTokenCount[_owner]
+
+
+@view
+@internal
+def _totalSupply() -> uint256:
+    """
+    @dev Returns total supply
+    """
+    return self.tokenId - self.burntCount
+
+
+@view
+@internal
+def _ownerOf(_tokenId: uint256) -> address:
+    """
+    @dev Returns the owner of a NFT by scanning backwards to the nearest recorded ownership.
+         Returns zero address if `_tokenId` is not a valid NFT.
+    @param _tokenId The identifier for an NFT.
+    """
+    if _tokenId == 0 or _tokenId > self.tokenId:
+        return empty(address)
+
+    packed: uint256 = self.idToOwnership[_tokenId]
+    if packed & BURNT_FLAG != 0:
+        return empty(address)
+
+    # A run of token IDs sharing an ownership is at most `MAX_MINT_BATCH_SIZE` long, and
+    # burnt tokens always record the ownership of the next token ID.
+    for i in range(1, MAX_MINT_BATCH_SIZE):
+        if packed != 0:
+            break
+        packed = self.idToOwnership[_tokenId - i]
+
+    return convert(packed & OWNER_MASK, address)
+
+
+@internal
+def _initializeNextOwnership(_owner: address, _tokenId: uint256):
+    """
+    @dev Record the ownership of the token ID after `_tokenId` if it has been minted and
+         its ownership is not recorded yet. This keeps the rest of the run of `_owner`
+         intact after the ownership of `_tokenId` changes.
+    @param _owner The owner of `_tokenId` before the change
+    @param _tokenId The NFT whose ownership is changing
+    """
+    next_token_id: uint256 = _tokenId + 1
+    if next_token_id <= self.tokenId and self.idToOwnership[next_token_id] == 0:
+        self.idToOwnership[next_token_id] = convert(_owner, uint256)
+
+
+@view
+@external
+def supportsInterface(_interfaceID: bytes4) -> bool:
+    """
+    @dev Interface identification is specified in ERC-165.
+    @param _interfaceID Id of the interface
+    """
+    return _interfaceID in [
+        ERC165_INTERFACE_ID,
+        ERC721_INTERFACE_ID,
+        ERC721_METADATA_INTERFACE_ID,
+        ERC721_ENUMERABLE_INTERFACE_ID,
+        ERC721_TOKEN_RECEIVER_INTERFACE_ID
+    ]
+
+
+### VIEW FUNCTIONS ###
+
+@view
+@external
+def balanceOf(_owner: address) -> uint256:
+    """
+    @dev Returns the number of NFTs owned by `_owner`.
+         Throws if `_owner` is the zero address. NFTs assigned to the zero address are considered invalid.
+    @param _owner Address for whom to query the balance.
+    """
+
+    return self._balanceOf(_owner)
+
+
+@view
+@external
+def ownerOf(_tokenId: uint256) -> address:
+    """
+    @dev Returns the address of the owner of the NFT.
+         Throws if `_tokenId` is not a valid NFT.
+    @param _tokenId The identifier for an NFT.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    return owner
+
+
+@view
+@external
+def getApproved(_tokenId: uint256) -> address:
+    """
+    @dev Get the approved address for a single NFT.
+         Throws if `_tokenId` is not a valid NFT.
+    @param _tokenId ID of the NFT to query the approval of.
+    """
+    # Throws if `_tokenId` is not a valid NFT
+    assert self._ownerOf(_tokenId) != empty(address)
+    return self.idToApprovals[_tokenId]
+
+
+@view
+@external
+def isApprovedForAll(_owner: address, _operator: address) -> bool:
+    """
+    @dev Checks if `_operator` is an approved operator for `_owner`.
+    @param _owner The address that owns the NFTs.
+    @param _operator The address that acts on behalf of the owner.
+    """
+    return (self.ownerToOperators[_owner])[_operator]
+
+
+@view
+@external
+def name() -> String[64]:
+    """
+    @dev Get the name of the token
+    """
+    return self.tokenName
+
+
+@view
+@external
+def symbol() -> String[32]:
+    """
+    @dev Get the symbol of the token
+    """
+    return self.tokenSymbol
+
+
+@view
+@external
+def tokenURI(_tokenId: uint256) -> String[128]:
+    """
+    @dev Returns the URI for the token ID
+    @param _tokenId id of the ERC721 token
+    """
+    assert self._ownerOf(_tokenId) != empty(address)
+
+    return concat(
+        self.baseTokenURI,
+        self.idToURI[_tokenId]
+    )
+
+
+@view
+@external
+def totalSupply() -> uint256:
+    """
+    @dev Returns total supply
+    """
+    return self._totalSupply()
+
+
+@view
+@external
+def tokenByIndex(_index: uint256) -> uint256:
+    """
+    @dev Get token by index, counting from 1 in order of token ID
+         Throws if '_index' is larger than totalSupply()
+         Loops over all token IDs up to the result if any token has been burnt.
+    """
+    assert _index <= self._totalSupply()
+    assert _index > 0
+
+    if self.burntCount == 0:
+        return _index
+
+    last_token_id: uint256 = self.tokenId
+    count: uint256 = 0
+    for i in range(1, MAX_TOKEN_ID):
+        if i > last_token_id:
+            break
+
+        if self.idToOwnership[i] & BURNT_FLAG == 0:
+            count += 1
+            if count == _index:
+                return i
+
+    raise "Index does not exist"
+
+
+@view
+@external
+def tokenOfOwnerByIndex(_owner: address, _index: uint256) -> uint256:
+    """
+    @dev Get token by index, counting from 1 in order of token ID
+         Throws if '_index' is larger than balance of '_owner'
+         Throws if value has been set to 0
+         Loops over all token IDs up to the result.
+    """
+    assert _index <= self._balanceOf(_owner)
+    assert _index > 0
+
+    last_token_id: uint256 = self.tokenId
+    current_owner: address = empty(address)
+    count: uint256 = 0
+    for i in range(1, MAX_TOKEN_ID):
+        if i > last_token_id:
+            break
+
+        packed: uint256 = self.idToOwnership[i]
+        if packed == 0:
+            if current_owner == _owner:
+                count += 1
+        elif packed & BURNT_FLAG == 0:
+            current_owner = convert(packed & OWNER_MASK, address)
+            if current_owner == _owner:
+                count += 1
+
+        if count == _index:
+            return i
+
+    raise "Index does not exist"
+
+
+@view
+@external
+def baseURI() -> String[64]:
+    return self.baseTokenURI
+
+
+### BULK VIEW FUNCTIONS ###
+
+@view
+@external
+def tokensOfOwner(
+    _owner: address,
+    _start: uint256,
+    _count: uint256
+) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens of `_owner`, starting from index `_start`. Indexes count
+         from 1 in order of token ID, as in `tokenOfOwnerByIndex`. Fewer tokens are
+         returned at the end of the tokens of `_owner`.
+         Throws if `_owner` is zero address.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+         Loops over all token IDs up to the last token returned.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._balanceOf(_owner)
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    if _count == 0 or _start > last_index:
+        return tokens
+
+    last_token_id: uint256 = self.tokenId
+    current_owner: address = empty(address)
+    count: uint256 = 0
+    for i in range(1, MAX_TOKEN_ID):
+        if i > last_token_id:
+            break
+
+        packed: uint256 = self.idToOwnership[i]
+        if packed & BURNT_FLAG != 0:
+            continue
+
+        if packed != 0:
+            current_owner = convert(packed & OWNER_MASK, address)
+
+        if current_owner == _owner:
+            count += 1
+            if count >= _start:
+                tokens.append(i)
+                if len(tokens) == _count or count == last_index:
+                    break
+
+    return tokens
+
+
+@view
+@external
+def tokensByIndexRange(_start: uint256, _count: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens starting from index `_start`. Indexes count from 1 in
+         order of token ID, as in `tokenByIndex`. Fewer tokens are returned at the end of
+         the token list.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+         Loops over all token IDs up to the last token returned if any token has been burnt.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._totalSupply()
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    if self.burntCount == 0:
+        for i in range(MAX_PAGE_SIZE):
+            if i == _count or _start + i > last_index:
+                break
+
+            tokens.append(_start + i)
+
+        return tokens
+
+    if _count == 0 or _start > last_index:
+        return tokens
+
+    last_token_id: uint256 = self.tokenId
+    count: uint256 = 0
+    for i in range(1, MAX_TOKEN_ID):
+        if i > last_token_id:
+            break
+
+        if self.idToOwnership[i] & BURNT_FLAG == 0:
+            count += 1
+            if count >= _start:
+                tokens.append(i)
+                if len(tokens) == _count:
+                    break
+
+    return tokens
+
+
+@view
+@external
+def ownersOf(_tokenIds: DynArray[uint256, MAX_PAGE_SIZE]) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @dev Get the owners of `_tokenIds`, in the same order. Unlike `ownerOf`, the owner of a
+         token ID that is not a valid NFT is returned as zero address.
+    """
+    owners: DynArray[address, MAX_PAGE_SIZE] = []
+    for _tokenId in _tokenIds:
+        owners.append(self._ownerOf(_tokenId))
+
+    return owners
+
+
+### TRANSFER FUNCTION HELPERS ###
+
+@view
+@internal
+def _isApprovedOrOwner(_owner: address, _spender: address, _tokenId: uint256) -> bool:
+    """
+    @dev Returns whether the given spender can transfer a given token ID
+    @param owner address of the owner of the token
+    @param spender address of the spender to query
+    @param tokenId uint256 ID of the token to be transferred
+    @return bool whether the msg.sender is approved for the given token ID,
+        is an operator of the owner, or is the owner of the token
+    """
+    spenderIsOwner: bool = _owner == _spender
+    spenderIsApproved: bool = _spender == self.idToApprovals[_tokenId]
+    spenderIsApprovedForAll: bool = (self.ownerToOperators[_owner])[_spender]
+    return (spenderIsOwner or spenderIsApproved) or spenderIsApprovedForAll
+
+
+@internal
+def _clearApproval(_tokenId: uint256):
+    """
+    @dev Clear an approval of a given address
+    """
+    if self.idToApprovals[_tokenId] != empty(address):
+        # Reset approvals
+        self.idToApprovals[_tokenId] = empty(address)
+
+
+@internal
+def _transferFrom(_from: address, _to: address, _tokenId: uint256, _sender: address):
+    """
+    @dev Exeute transfer of a NFT.
+         Throws unless `msg.sender` is the current owner, an authorized operator, or the approved
+         address for this NFT. (NOTE: `msg.sender` not allowed in private function so pass `_sender`.)
+         Throws if `_to` is the zero address.
+         Throws if `_from` is not the current owner.
+         Throws if `_tokenId` is not a valid NFT.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Throws if `_from` is not the current owner
+    assert owner == _from
+    # Check requirements
+    assert self._isApprovedOrOwner(owner, _sender, _tokenId)
+    # Throws if `_to` is the zero address
+    assert _to != empty(address)
+    # Clear approval
+    self._clearApproval(_tokenId)
+    # Change count tracking
+    self.ownerToNFTokenCount[_from] -= 1
+    self.ownerToNFTokenCount[_to] += 1
+    # Change the owner, and keep the rest of the run owned by `_from`
+    self.idToOwnership[_tokenId] = convert(_to, uint256)
+    self._initializeNextOwnership(_from, _tokenId)
+    # Log the transfer
+    log Transfer(_from, _to, _tokenId)
+
+
+### TRANSFER FUNCTIONS ###
+
+@external
+def transferFrom(_from: address, _to: address, _tokenId: uint256):
+    """
+    @dev Throws unless `msg.sender` is the current owner, an authorized operator, or the approved
+         address for this NFT.
+         Throws if `_from` is not the current owner.
+         Throws if `_to` is the zero address.
+         Throws if `_tokenId` is not a valid NFT.
+    @notice The caller is responsible to confirm that `_to` is capable of receiving NFTs or else
+            they maybe be permanently lost.
+    @param _from The current owner of the NFT.
+    @param _to The new owner.
+    @param _tokenId The NFT to transfer.
+    """
+    self._transferFrom(_from, _to, _tokenId, msg.sender)
+
+
+@external
+def safeTransferFrom(
+        _from: address,
+        _to: address,
+        _tokenId: uint256,
+        _data: Bytes[1024]=b""
+    ):
+    """
+    @dev Transfers the ownership of an NFT from one address to another address.
+         Throws unless `msg.sender` is the current owner, an authorized operator, or the
+         approved address for this NFT.
+         Throws if `_from` is not the current owner.
+         Throws if `_to` is the zero address.
+         Throws if `_tokenId` is not a valid NFT.
+         If `_to` is a smart contract, it calls `onERC721Received` on `_to` and throws if
+         the return value is not `bytes4(keccak256("onERC721Received(address,address,uint256,bytes)"))`.
+    @param _from The current owner of the NFT.
+    @param _to The new owner.
+    @param _tokenId The NFT to transfer.
+    @param _data Additional data with no specified format, sent in call to `_to`.
+    """
+    self._transferFrom(_from, _to, _tokenId, msg.sender)
+    if _to.is_contract: # check if `_to` is a contract address
+        returnValue: bytes4 = ERC721Receiver(_to).onERC721Received(msg.sender, _from, _tokenId, _data)
+        # Throws if transfer destination is a contract which does not implement 'onERC721Received'
+        assert returnValue == method_id("onERC721Received(address,address,uint256,bytes)", output_type=bytes4)
+
+
+@external
+def approve(_approved: address, _tokenId: uint256):
+    """
+    @dev Set or reaffirm the approved address for an NFT. The zero address indicates there is no approved address.
+         Throws unless `msg.sender` is the current NFT owner, or an authorized operator of the current owner.
+         Throws if `_tokenId` is not a valid NFT. (NOTE: This is not written the EIP)
+         Throws if `_approved` is the current owner. (NOTE: This is not written the EIP)
+    @param _approved Address to be approved for the given NFT ID.
+    @param _tokenId ID of the token to be approved.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Throws if `_approved` is the current owner
+    assert _approved != owner
+    # Check requirements
+    senderIsOwner: bool = owner == msg.sender
+    senderIsApprovedForAll: bool = (self.ownerToOperators[owner])[msg.sender]
+    assert (senderIsOwner or senderIsApprovedForAll)
+    # Set the approval
+    self.idToApprovals[_tokenId] = _approved
+    log Approval(owner, _approved, _tokenId)
+
+
+@external
+def setApprovalForAll(_operator: address, _approved: bool):
+    """
+    @dev Enables or disables approval for a third party ("operator") to manage all of
+         `msg.sender`'s assets. It also emits the ApprovalForAll event.
+         Throws if `_operator` is the `msg.sender`. (NOTE: This is not written the EIP)
+    @notice This works even if sender doesn't own any tokens at the time.
+    @param _operator Address to add to the set of authorized operators.
+    @param _approved True if the operators is approved, false to revoke approval.
+    """
+    # Throws if `_operator` is the `msg.sender`
+    assert _operator != msg.sender
+    self.ownerToOperators[msg.sender][_operator] = _approved
+    log ApprovalForAll(msg.sender, _operator, _approved)
+
+
+### MINT & BURN FUNCTIONS ###
+
+@payable
+@external
+def mint(_to: address, _tokenURI: String[64]) -> bool:
+    """
+    @dev Function to mint a token
+         Throws if `msg.sender` is not the minter.
+         Throws if `_to` is zero address.
+         Throws if the token ID would exceed `self.maxSupply`.
+    @return Boolean indicating if operation was successful
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+
+    # Throws if `_to` is zero address
+    assert _to != empty(address)
+
+    # Throws if '_tokenId' is equal to or greater than 'self.maxSupply'
+    _tokenId: uint256 = self.tokenId + 1
+    assert _tokenId <= self.maxSupply
+
+    self.tokenId = _tokenId
+    self.idToOwnership[_tokenId] = convert(_to, uint256)
+    self.ownerToNFTokenCount[_to] += 1
+
+    if len(_tokenURI) != 0:
+        self.idToURI[_tokenId] = _tokenURI
+
+    log Transfer(empty(address), _to, _tokenId)
+    return True
+
+
+@payable
+@external
+def mintBatch(
+    _recipients: DynArray[address, MAX_MINT_BATCH_SIZE],
+    _tokenURIs: DynArray[String[64], MAX_MINT_BATCH_SIZE]
+) -> bool:
+    """
+    @dev Function to mint a batch of tokens. Token IDs are assigned in the order of
+         `_recipients`. Ownership and balance are written once for each consecutive run
+         of mints to the same recipient, so recipients should be grouped together. Empty
+         token URIs are not written to storage.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_recipients` and `_tokenURIs` have different lengths.
+         Throws if any of `_recipients` is zero address.
+         Throws if the batch would exceed `self.maxSupply`.
+    @param _recipients The addresses that will receive the minted tokens.
+    @param _tokenURIs The token URIs, in the same order as `_recipients`.
+    @return Boolean indicating if operation was successful
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+
+    batch_size: uint256 = len(_recipients)
+    assert batch_size == len(_tokenURIs)
+
+    _tokenId: uint256 = self.tokenId
+
+    # Throws if the last token ID is greater than 'self.maxSupply'
+    assert _tokenId + batch_size <= self.maxSupply
+
+    current_owner: address = empty(address)
+    current_count: uint256 = 0
+
+    for i in range(MAX_MINT_BATCH_SIZE):
+        if i == batch_size:
+            break
+
+        _to: address = _recipients[i]
+        _tokenId += 1
+
+        if _to != current_owner:
+            # Throws if `_to` is zero address
+            assert _to != empty(address)
+
+            # Write the balance of the previous run of recipients
+            if current_owner != empty(address):
+                self.ownerToNFTokenCount[current_owner] = current_count
+
+            # Record the ownership for the start of the run
+            self.idToOwnership[_tokenId] = convert(_to, uint256)
+
+            current_owner = _to
+            current_count = self.ownerToNFTokenCount[_to]
+
+        current_count += 1
+
+        if len(_tokenURIs[i]) != 0:
+            self.idToURI[_tokenId] = _tokenURIs[i]
+
+        log Transfer(empty(address), _to, _tokenId)
+
+    if current_owner != empty(address):
+        self.ownerToNFTokenCount[current_owner] = current_count
+
+    self.tokenId = _tokenId
+    return True
+
+
+@external
+def withdraw():
+    """
+    @dev Function to withdraw funds
+         Throws if `msg.sender` is not `self.admin`
+    """
+    send(self.beneficiary, self.balance)
+
+
+@external
+def burn(_tokenId: uint256):
+    """
+    @dev Burns a specific ERC721 token.
+         Throws unless `msg.sender` is the current owner, an authorized operator, or the approved
+         address for this NFT.
+         Throws if `_tokenId` is not a valid NFT.
+    @param _tokenId uint256 id of the ERC721 token to be burned.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Check requirements
+    assert self._isApprovedOrOwner(owner, msg.sender, _tokenId)
+    self._clearApproval(_tokenId)
+    self.ownerToNFTokenCount[owner] -= 1
+
+    # Mark the token as burnt, and keep the rest of the run owned by `owner`
+    self.idToOwnership[_tokenId] = convert(owner, uint256) | BURNT_FLAG
+    self._initializeNextOwnership(owner, _tokenId)
+
+	# Increment coun of burnt tokens
+    self.burntCount += 1
+
+    log Transfer(owner, empty(address), _tokenId)
@@ -0,0 +1,57 @@
+# @version ^0.3.7
+
+"""
+@title Multicall
+@license GPL-3.0
+@author Gary Tse
+@notice You can use this contract to read many view functions, across any number of
+        contracts, in a single call.
+@dev Based on Multicall2 by MakerDAO [https://github.com/makerdao/multicall]. Each call is
+     made as a static call, and a failed call is returned with `success` set to False
+     instead of reverting the batch.
+"""
+
+# @dev Maximum number of calls in a single batch
+MAX_CALLS: constant(uint256) = 256
+
+# @dev Maximum size of the calldata of a call
+MAX_CALLDATA_SIZE: constant(uint256) = 260
+
+# @dev Maximum size of the return data of a call. Return data that is larger than this
+#      is truncated.
+MAX_RETURN_SIZE: constant(uint256) = 256
+
+
+struct Request:
+	target: address
+	callData: Bytes[MAX_CALLDATA_SIZE]
+
+
+struct Result:
+	success: bool
+	returnData: Bytes[MAX_RETURN_SIZE]
+
+
+@view
+@external
+def aggregate(calls: DynArray[Request, MAX_CALLS]) -> (uint256, DynArray[Result, MAX_CALLS]):
+	"""
+	@notice Make a batch of static calls
+	@param calls The target and calldata of each call
+	@return The block number, and the success and return data of each call in the same
+			order as `calls`
+	"""
+	results: DynArray[Result, MAX_CALLS] = []
+	for c in calls:
+		success: bool = False
+		response: Bytes[MAX_RETURN_SIZE] = b""
+		success, response = raw_call(
+			c.target,
+			c.callData,
+			max_outsize=MAX_RETURN_SIZE,
+			is_static_call=True,
+			revert_on_failure=False
+		)
+		results.append(Result({success: success, returnData: response}))
+
+	return block.number, results
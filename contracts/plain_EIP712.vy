@@ -20,6 +20,9 @@ PERMIT_TYPE_HASH: public(constant(bytes32)) = keccak256(
 	"Message(uint256 sms)"
 )
 
+# @dev Mask of s in the vs word of an EIP-2098 compact signature
+COMPACT_S_MASK: constant(uint256) = 2 ** 255 - 1
+
 @external
 def __init__():
 	DOMAIN_SEPARATOR = keccak256(
@@ -32,17 +35,11 @@ def __init__():
 		)
 	)
 
-@external
-def message(
-	sms: uint256,
-	signature: Bytes[65]
-) -> bool:
+@internal
+def _message(sms: uint256, r: uint256, s: uint256, v: uint256):
 	"""
-	@notice Verify a signature and check if it was signed by `msg.sender`.
-	@dev Throws if the signature cannot be verified.
-	@param sms An arbitrary number to append to the message
-	@param signature A 65-bytes signature comprising v, r and s components.
-	@return True if the signature is verified.
+	@dev Verify the r, s and v of a signature of a message and check if it was signed by
+		 `msg.sender`. Throws if the signature cannot be verified.
 	"""
 	digest: bytes32 = keccak256(
 		concat(
@@ -57,10 +54,45 @@ def message(
 		)
 	)
 
+	assert ecrecover(digest, v, r, s) == msg.sender
+	log Incoming(sms, msg.sender)
+
+@external
+def message(
+	sms: uint256,
+	signature: Bytes[65]
+) -> bool:
+	"""
+	@notice Verify a signature and check if it was signed by `msg.sender`.
+	@dev Throws if the signature cannot be verified.
+	@param sms An arbitrary number to append to the message
+	@param signature A 65-bytes signature comprising v, r and s components.
+	@return True if the signature is verified.
+	"""
 	r: uint256 = convert(slice(signature, 0, 32), uint256)
 	s: uint256 = convert(slice(signature, 32, 32), uint256)
 	v: uint256 = convert(slice(signature, 64, 1), uint256)
 
-	assert ecrecover(digest, v, r, s) == msg.sender
-	log Incoming(sms, msg.sender)
+	self._message(sms, r, s, v)
+	return True
+
+@external
+def messageCompact(
+	sms: uint256,
+	r: bytes32,
+	vs: bytes32
+) -> bool:
+	"""
+	@notice Verify an EIP-2098 compact signature and check if it was signed by
+			`msg.sender`.
+	@dev Throws if the signature cannot be verified. Reference is made to EIP-2098
+		 [https://eips.ethereum.org/EIPS/eip-2098].
+	@param sms An arbitrary number to append to the message
+	@param r The r component of the signature.
+	@param vs The s component of the signature, with the parity of v in the highest bit.
+	@return True if the signature is verified.
+	"""
+	_vs: uint256 = convert(vs, uint256)
+
+	self._message(sms, convert(r, uint256), _vs & COMPACT_S_MASK, shift(_vs, -255) + 27)
 	return True
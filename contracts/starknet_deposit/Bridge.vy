@@ -1,4 +1,4 @@
-# @version ^0.3.0
+# @version ^0.3.7
 
 """
 @title Starknet ERC-20 Bridge, adapted from official Starknet documentation
@@ -14,24 +14,38 @@
 
 from vyper.interfaces import ERC20
 
+event WithdrawalFailed:
+	index: uint256
+	user_l2_address: indexed(uint256)
+
+# @dev Maximum number of deposits or withdrawals in a batch
+MAX_BATCH_SIZE: constant(uint256) = 100
+
+# @dev Payload of a batch, with the number of deposits followed by the L2
+#	   address and amount of each
+MAX_BATCH_PAYLOAD_SIZE: constant(uint256) = 1 + 2 * MAX_BATCH_SIZE
+
+# @dev Payload of a withdrawal message
+WITHDRAW_PAYLOAD_SIZE: constant(uint256) = 4
+
 interface IStarknetCore:
 
 	def sendMessageToL2(
 		to_address: uint256,
 		selector: uint256,
-		payload: uint256[4]
+		payload: DynArray[uint256, MAX_BATCH_PAYLOAD_SIZE]
 	) -> bytes32: nonpayable
 
 	def consumeMessageFromL2(
 		fromAddress: uint256,
-		payload: uint256[3]
+		payload: DynArray[uint256, WITHDRAW_PAYLOAD_SIZE]
 	) -> bytes32: nonpayable
 
 # @dev Address of ERC-20 token
-token: public(ERC20)
+token: public(immutable(ERC20))
 
 # @dev Address of Starknet Core contract on L1
-sn_core: public(IStarknetCore)
+sn_core: public(immutable(IStarknetCore))
 
 # @dev Mapping from L2 address to balance
 user_balances: HashMap[uint256, uint256]
@@ -39,16 +53,19 @@ user_balances: HashMap[uint256, uint256]
 # @dev Selector for "deposit" function
 DEPOSIT_SELECTOR: constant(uint256) = 352040181584456735608515580760888541466059565068553383579463728554843487745
 
+# @dev Selector for "deposit_batch" function
+DEPOSIT_BATCH_SELECTOR: constant(uint256) = 1389472725367045055775894311058896868291301291094778976937293337825976292778
+
 # @dev Starknet message
 MESSAGE_WITHDRAW: constant(uint256) = 0
 
 MAX_AMOUNT: constant(uint256) = 2 ** 64
 
 @external
-def __init__(token: address, sn_core: address):
+def __init__(token_address: address, sn_core_address: address):
 
-	self.token = ERC20(token)
-	self.sn_core = IStarknetCore(sn_core)
+	token = ERC20(token_address)
+	sn_core = IStarknetCore(sn_core_address)
 
 
 @external
@@ -64,31 +81,85 @@ def withdraw(
 	@param user_l2_address Address of the user on Starknet
 	@param amount Amount to be withdrawn
 	"""
-	# Custom workaround pending merging of PR #2603
-	# [https://github.com/vyperlang/vyper/pull/2603]
-	_message_withdraw: uint256 = MESSAGE_WITHDRAW
-	_offset: uint256 = 64
-	_payload_size: uint256 = 4
+	self.user_balances[user_l2_address] -= amount
 
-	payload: Bytes[228] = _abi_encode(
+	sn_core.consumeMessageFromL2(
 		l2_contract_address,
-		_offset,
-		_payload_size,
-		_message_withdraw,
-		user_l2_address,
-		msg.sender,
-		amount,
-		method_id=method_id("consumeMessageFromL2(uint256,uint256[])")
+		[MESSAGE_WITHDRAW, user_l2_address, convert(msg.sender, uint256), amount]
 	)
 
-	response: Bytes[32] = raw_call(
-		self.sn_core.address,
-		payload,
-		max_outsize=32
-	)
+	token.transfer(msg.sender, amount)
 
-	self.token.transfer(msg.sender, amount)
-	self.user_balances[user_l2_address] -= amount
+
+@external
+def withdrawBatch(
+	l2_contract_address: uint256,
+	user_l2_addresses: DynArray[uint256, MAX_BATCH_SIZE],
+	recipients: DynArray[address, MAX_BATCH_SIZE],
+	amounts: DynArray[uint256, MAX_BATCH_SIZE]
+) -> DynArray[uint256, MAX_BATCH_SIZE]:
+	"""
+	@notice Withdraw from the contract for many users, after the equivalent
+			withdrawal transactions on Starknet are `ACCEPTED_ON_L1`
+	@dev Each withdrawal is made as `withdraw` does for its recipient, and can be
+		 made by anyone, as the message from Starknet names the recipient. A
+		 withdrawal whose message can not be consumed, or which is above the
+		 balance of the user, is skipped instead of reverting the batch, and a
+		 WithdrawalFailed event is emitted.
+		 Throws if the arguments have different lengths.
+	@param l2_contract_address Address of the Starknet contract
+	@param user_l2_addresses Addresses of the users on Starknet
+	@param recipients Addresses on L1 that each withdrawal is released to
+	@param amounts Amount to be withdrawn for each user
+	@return The indices of the withdrawals that were skipped
+	"""
+	batch_size: uint256 = len(amounts)
+	assert batch_size == len(user_l2_addresses), "Invalid batch"
+	assert batch_size == len(recipients), "Invalid batch"
+
+	failed: DynArray[uint256, MAX_BATCH_SIZE] = []
+
+	for i in range(MAX_BATCH_SIZE):
+		if i == batch_size:
+			break
+
+		_user_l2_address: uint256 = user_l2_addresses[i]
+		_recipient: address = recipients[i]
+		_amount: uint256 = amounts[i]
+		_balance: uint256 = self.user_balances[_user_l2_address]
+
+		_success: bool = False
+		_response: Bytes[32] = b""
+		if _amount <= _balance:
+			_payload: DynArray[uint256, WITHDRAW_PAYLOAD_SIZE] = [
+				MESSAGE_WITHDRAW,
+				_user_l2_address,
+				convert(_recipient, uint256),
+				_amount
+			]
+
+			# Called without the interface, so that a message that can not be
+			# consumed does not revert the batch
+			_success, _response = raw_call(
+				sn_core.address,
+				_abi_encode(
+					l2_contract_address,
+					_payload,
+					method_id=method_id("consumeMessageFromL2(uint256,uint256[])")
+				),
+				max_outsize=32,
+				revert_on_failure=False
+			)
+
+		if not _success:
+			failed.append(i)
+			log WithdrawalFailed(i, _user_l2_address)
+			continue
+
+		self.user_balances[_user_l2_address] = _balance - _amount
+		token.transfer(_recipient, _amount)
+
+	return failed
 
 
 @external
@@ -96,7 +167,7 @@ def deposit(
 	l2_contract_address: uint256,
 	user_l2_address: uint256,
 	amount: uint256
-) -> Bytes[32]:
+) -> bytes32:
 	"""
 	@notice Deposit to the contract for message transmission to Starknet contract
 	@dev Throws if `amount` is equal to or greater than MAX_AMOUNT
@@ -104,39 +175,64 @@ def deposit(
 	@param l2_contract_address Address of the Starknet contract
 	@param user_l2_address Address of the user on Starknet
 	@param amount Amount to be deposited
-	@return Response of the call to Starknet core contract to transmit message to
-	        Starknet
+	@return Hash of the message to Starknet
 	"""
 	assert amount < MAX_AMOUNT, "Invalid amount"
-	assert self.token.allowance(msg.sender, self) >= amount, "Contract is not approved"
 
-	self.token.transferFrom(msg.sender, self, amount)
+	token.transferFrom(msg.sender, self, amount)
 	self.user_balances[user_l2_address] += amount
 
-	_offset: uint256 = 96
-	_payload_size: uint256 = 2
-
-	# Custom workaround pending merging of PR #2603
-	# [https://github.com/vyperlang/vyper/pull/2603]
-	_deposit_selector: uint256 = DEPOSIT_SELECTOR
-
-	payload: Bytes[196] = _abi_encode(
+	return sn_core.sendMessageToL2(
 		l2_contract_address,
-		_deposit_selector,
-		_offset,
-		_payload_size,
-		user_l2_address,
-		amount,
-		method_id=method_id("sendMessageToL2(uint256,uint256,uint256[])")
+		DEPOSIT_SELECTOR,
+		[user_l2_address, amount]
 	)
 
-	response: Bytes[32] = raw_call(
-		self.sn_core.address,
-		payload,
-		max_outsize=32
-	)
 
-	return response
+@external
+def depositBatch(
+	l2_contract_address: uint256,
+	user_l2_addresses: DynArray[uint256, MAX_BATCH_SIZE],
+	amounts: DynArray[uint256, MAX_BATCH_SIZE]
+) -> bytes32:
+	"""
+	@notice Deposit to the contract for many users on Starknet, with a single
+			transfer of the total amount and a single message to the Starknet
+			contract
+	@dev Throws if `user_l2_addresses` and `amounts` differ in length, or are empty
+		 Throws if any amount is equal to or greater than MAX_AMOUNT
+		 Throws if contract is not approved to transfer the total amount of ERC-20
+	@param l2_contract_address Address of the Starknet contract
+	@param user_l2_addresses Addresses of the users on Starknet
+	@param amounts Amount to be deposited for each user
+	@return Hash of the message to Starknet
+	"""
+	assert len(user_l2_addresses) == len(amounts), "Invalid batch"
+	assert len(amounts) > 0, "Invalid batch"
+
+	_payload: DynArray[uint256, MAX_BATCH_PAYLOAD_SIZE] = [len(amounts)]
+	_total: uint256 = 0
+
+	for i in range(MAX_BATCH_SIZE):
+		if i == len(amounts):
+			break
+
+		_user_l2_address: uint256 = user_l2_addresses[i]
+		_amount: uint256 = amounts[i]
+		assert _amount < MAX_AMOUNT, "Invalid amount"
+
+		self.user_balances[_user_l2_address] += _amount
+		_total += _amount
+		_payload.append(_user_l2_address)
+		_payload.append(_amount)
+
+	token.transferFrom(msg.sender, self, _total)
+
+	return sn_core.sendMessageToL2(
+		l2_contract_address,
+		DEPOSIT_BATCH_SELECTOR,
+		_payload
+	)
 
 
 @external
@@ -0,0 +1,136 @@
+# @version ^0.3.7
+
+"""
+@title Local stand-in for the Starknet core contract
+@license GPL-3.0
+@author Gary Tse
+@notice You can use this contract in place of the Starknet core contract on a
+		local chain, to exchange messages between L1 contracts and a simulated
+		Starknet.
+@dev Messages are hashed and counted as in the `StarknetMessaging` contract of
+	 Starknet, so `sendMessageToL2` and `consumeMessageFromL2` behave as they do
+	 on Ethereum. The state updates of Starknet are replaced by `mockUpdateState`,
+	 which the operator calls with the hashes of the messages to L2 consumed by
+	 the simulated Starknet, and of the messages it sends to L1.
+"""
+
+event LogMessageToL2:
+	from_address: indexed(address)
+	to_address: indexed(uint256)
+	selector: indexed(uint256)
+	payload: DynArray[uint256, MAX_PAYLOAD_SIZE]
+	nonce: uint256
+
+event ConsumedMessageToL1:
+	from_address: indexed(uint256)
+	to_address: indexed(address)
+	payload: DynArray[uint256, MAX_PAYLOAD_SIZE]
+
+MAX_PAYLOAD_SIZE: constant(uint256) = 256
+
+MAX_MESSAGES: constant(uint256) = 256
+
+# @dev Address that submits the state updates of the simulated Starknet
+operator: public(address)
+
+# @dev Mapping from hash of a message to L2 to the number of pending copies
+l1ToL2Messages: public(HashMap[bytes32, uint256])
+
+# @dev Mapping from hash of a message to L1 to the number of copies that can be
+#	   consumed
+l2ToL1Messages: public(HashMap[bytes32, uint256])
+
+# @dev Nonce of the next message to L2
+l1ToL2MessageNonce: public(uint256)
+
+@external
+def __init__():
+
+	self.operator = msg.sender
+
+
+@internal
+@pure
+def _pack(
+	header: Bytes[128],
+	payload: DynArray[uint256, MAX_PAYLOAD_SIZE]
+) -> Bytes[8384]:
+	# Packed encoding of the header words, the payload size and the payload
+	_encoded: Bytes[8256] = _abi_encode(payload)
+	return concat(header, slice(_encoded, 32, len(_encoded) - 32))
+
+
+@external
+def sendMessageToL2(
+	to_address: uint256,
+	selector: uint256,
+	payload: DynArray[uint256, MAX_PAYLOAD_SIZE]
+) -> bytes32:
+	"""
+	@notice Send a message to the L1 handler `selector` of the L2 contract at
+			`to_address`.
+	@return Hash of the message.
+	"""
+	_nonce: uint256 = self.l1ToL2MessageNonce
+	self.l1ToL2MessageNonce = _nonce + 1
+
+	_header: Bytes[128] = concat(
+		convert(convert(msg.sender, uint256), bytes32),
+		convert(to_address, bytes32),
+		convert(_nonce, bytes32),
+		convert(selector, bytes32)
+	)
+	_hash: bytes32 = keccak256(self._pack(_header, payload))
+	self.l1ToL2Messages[_hash] += 1
+
+	log LogMessageToL2(msg.sender, to_address, selector, payload, _nonce)
+
+	return _hash
+
+
+@external
+def consumeMessageFromL2(
+	from_address: uint256,
+	payload: DynArray[uint256, MAX_PAYLOAD_SIZE]
+) -> bytes32:
+	"""
+	@notice Consume a message sent to `msg.sender` by the L2 contract at
+			`from_address`.
+	@dev Throws if the message has not been sent to L1, or has been consumed.
+	@return Hash of the message.
+	"""
+	_header: Bytes[128] = concat(
+		convert(from_address, bytes32),
+		convert(convert(msg.sender, uint256), bytes32)
+	)
+	_hash: bytes32 = keccak256(self._pack(_header, payload))
+	assert self.l2ToL1Messages[_hash] > 0, "INVALID_MESSAGE_TO_CONSUME"
+	self.l2ToL1Messages[_hash] -= 1
+
+	log ConsumedMessageToL1(from_address, msg.sender, payload)
+
+	return _hash
+
+
+@external
+def mockUpdateState(
+	consumed_messages_to_l2: DynArray[bytes32, MAX_MESSAGES],
+	messages_to_l1: DynArray[bytes32, MAX_MESSAGES]
+):
+	"""
+	@notice Apply a state update of the simulated Starknet.
+	@dev Throws if `msg.sender` is not the operator.
+		 Throws if a consumed message to L2 is not pending.
+	@param consumed_messages_to_l2 Hashes of the messages to L2 handled by the
+		   simulated Starknet.
+	@param messages_to_l1 Hashes of the messages sent to L1 by the simulated
+		   Starknet.
+	"""
+	assert msg.sender == self.operator, "Caller is not the operator"
+
+	for _hash in consumed_messages_to_l2:
+		assert self.l1ToL2Messages[_hash] > 0, "INVALID_MESSAGE_TO_CONSUME"
+		self.l1ToL2Messages[_hash] -= 1
+
+	for _hash in messages_to_l1:
+		self.l2ToL1Messages[_hash] += 1
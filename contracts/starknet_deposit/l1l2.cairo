@@ -10,6 +10,12 @@ const L1_CONTRACT_ADDRESS = (
     0x53c3a4FF1482767Cde76935f47A2C0bb6365A2Ea)
 const MESSAGE_WITHDRAW = 0
 
+# A deposit in the payload of a batch from L1.
+struct Deposit:
+    member user : felt
+    member amount : felt
+end
+
 # Modified to L2 address
 # A mapping from a user to their balance.
 @storage_var
@@ -66,3 +72,29 @@ func deposit{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}(
 
     return ()
 end
+
+func _deposit_all{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}(
+        deposits_len : felt, deposits : Deposit*):
+    if deposits_len == 0:
+        return ()
+    end
+
+    let (res) = balance.read(user=deposits.user)
+    tempvar new_balance = res + deposits.amount
+    balance.write(deposits.user, new_balance)
+
+    return _deposit_all(deposits_len=deposits_len - 1, deposits=deposits + Deposit.SIZE)
+end
+
+# Deposits for many users, sent by `depositBatch` of the L1 contract in a single
+# message.
+@l1_handler
+func deposit_batch{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}(
+        from_address : felt, deposits_len : felt, deposits : Deposit*):
+    # Make sure the message was sent by the intended L1 contract.
+    assert from_address = L1_CONTRACT_ADDRESS
+
+    _deposit_all(deposits_len=deposits_len, deposits=deposits)
+
+    return ()
+end
@@ -34,6 +34,9 @@ allowance: public(HashMap[address, HashMap[address, uint256]])
 totalSupply: public(uint256)
 minter: address
 
+# @dev Maximum number of recipients in a single call to `mintBatch`
+MAX_MINT_BATCH_SIZE: constant(uint256) = 500
+
 
 @external
 def __init__(_name: String[64], _symbol: String[32], _decimals: uint8, _supply: uint256, _minter: address):
@@ -114,6 +117,35 @@ def mint(_to: address, _value: uint256):
     log Transfer(empty(address), _to, _value)
 
 
+@external
+def mintBatch(
+    _recipients: DynArray[address, MAX_MINT_BATCH_SIZE],
+    _values: DynArray[uint256, MAX_MINT_BATCH_SIZE]
+):
+    """
+    @dev Mint an amount of the token to each of a list of accounts. The total supply is
+         written once for the batch.
+    @param _recipients The accounts that will receive the created tokens.
+    @param _values The amounts that will be created, in the same order as `_recipients`.
+    """
+    assert msg.sender == self.minter
+    assert len(_recipients) == len(_values)
+
+    total: uint256 = 0
+    for i in range(MAX_MINT_BATCH_SIZE):
+        if i == len(_recipients):
+            break
+
+        _to: address = _recipients[i]
+        _value: uint256 = _values[i]
+        assert _to != empty(address)
+        total += _value
+        self.balanceOf[_to] += _value
+        log Transfer(empty(address), _to, _value)
+
+    self.totalSupply += total
+
+
 @internal
 def _burn(_to: address, _value: uint256):
     """
@@ -0,0 +1,120 @@
+# @version ^0.3.7
+
+"""
+@title Merkle distributor for time-mining rewards
+@license GPL-3.0
+@author Gary Tse
+@notice You can use this contract to distribute the time-mining rewards of `timer.vy`
+        by Merkle proofs, instead of accounting for them on-chain.
+@dev The rewards of each holder are computed off-chain from the `Transfer` events of
+     `timer.vy` by `utils/merkle_rewards.py`. Each epoch, the owner sets the root of a
+     tree of the cumulative rewards of every holder, and a holder claims the difference
+     between its cumulative rewards and what it has claimed so far. Leaves are the double
+     keccak256 of the ABI encoded `(holder, amount)`, and pairs are hashed in sorted order.
+     This contract must be the minter of the ERC20 token.
+"""
+
+interface ERC20Mintable:
+    def mint(
+        recipient: address,
+        amount: uint256
+    ): nonpayable
+
+
+# @dev Emits when the root of the tree is set for a new epoch.
+event RootUpdated:
+    epoch: indexed(uint256)
+    root: bytes32
+
+# @dev Emits when rewards are claimed for a holder.
+event Claimed:
+    holder: indexed(address)
+    amount: uint256
+    epoch: uint256
+
+
+# @dev Maximum length of a proof, for a tree of up to 2 ** 32 holders
+MAX_PROOF_LENGTH: constant(uint256) = 32
+
+# @dev Owner, who can set the token and the root
+owner: public(address)
+
+# @dev Time-mineable token
+token: public(address)
+
+# @dev Root of the tree of cumulative rewards of the current epoch
+merkle_root: public(bytes32)
+
+# @dev Current epoch, incremented each time the root is set
+epoch: public(uint256)
+
+# @dev Mapping from holder to cumulative rewards claimed
+claimed: public(HashMap[address, uint256])
+
+
+@external
+def __init__():
+    self.owner = msg.sender
+
+
+@external
+def set_token_address(token_addr: address):
+    """
+    @dev Set the address for the time-mineable token
+    @param token_addr Address of the ERC20 token that is time-mineable
+    """
+    assert msg.sender == self.owner, "Caller is not owner"
+    assert token_addr != empty(address), "Invalid token address"
+    self.token = token_addr
+
+
+@external
+def set_merkle_root(root: bytes32):
+    """
+    @dev Set the root of the tree of cumulative rewards, and start a new epoch
+    @param root Root of the tree
+    """
+    assert msg.sender == self.owner, "Caller is not owner"
+
+    epoch: uint256 = self.epoch + 1
+    self.epoch = epoch
+    self.merkle_root = root
+    log RootUpdated(epoch, root)
+
+
+@view
+@internal
+def _verify(proof: DynArray[bytes32, MAX_PROOF_LENGTH], leaf: bytes32) -> bool:
+    """
+    @dev Returns True if `proof` proves `leaf` is in the tree of the current root
+    """
+    computed: bytes32 = leaf
+    for node in proof:
+        if convert(computed, uint256) <= convert(node, uint256):
+            computed = keccak256(concat(computed, node))
+        else:
+            computed = keccak256(concat(node, computed))
+
+    return computed == self.merkle_root
+
+
+@external
+def claim(holder: address, amount: uint256, proof: DynArray[bytes32, MAX_PROOF_LENGTH]):
+    """
+    @dev Claim the rewards of `holder` that it has not claimed yet. Rewards are minted to
+         `holder`, so anyone can claim on its behalf.
+         Throws if the proof is invalid.
+         Throws if there is nothing to claim.
+    @param holder Address to claim for
+    @param amount Cumulative rewards of `holder` in the tree
+    @param proof Proof of `(holder, amount)` in the tree
+    """
+    leaf: bytes32 = keccak256(keccak256(_abi_encode(holder, amount)))
+    assert self._verify(proof, leaf), "Invalid proof"
+
+    claimed: uint256 = self.claimed[holder]
+    assert amount > claimed, "Nothing to claim"
+
+    self.claimed[holder] = amount
+    ERC20Mintable(self.token).mint(holder, amount - claimed)
+    log Claimed(holder, amount - claimed, self.epoch)
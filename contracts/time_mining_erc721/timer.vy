@@ -2,7 +2,7 @@
 
 # Adapted from official ERC721 Vyper example at https://github.com/vyperlang/vyper/blob/master/examples/tokens/ERC721.vy
 
-# @dev Implementation of ERC-721 non-fungible token standard.
+# @dev Implementation of ERC-721 non-fungible token standard with time-mining
 
 from vyper.interfaces import ERC721
 
@@ -17,12 +17,6 @@ interface ERC721Receiver:
         _data: Bytes[1024]
     ) -> bytes4: view
 
-interface ERC20Mintable:
-    def mint(
-        recipient: address,
-        amount: uint256
-    ): nonpayable
-
 
 # Interface for ERC721Metadata
 
@@ -49,6 +43,19 @@ interface ERC721Enumerable:
         _index: uint256
     ) -> uint256: view
 
+
+interface ERC20Mintable:
+    def mint(
+        recipient: address,
+        amount: uint256
+    ): nonpayable
+
+    def mintBatch(
+        recipients: DynArray[address, MAX_CLAIM_BATCH_SIZE],
+        amounts: DynArray[uint256, MAX_CLAIM_BATCH_SIZE]
+    ): nonpayable
+
+
 # @dev Emits when ownership of any NFT changes by any mechanism. This event emits when NFTs are
 #      created (`from` == 0) and destroyed (`to` == 0). Exception: during contract creation, any
 #      number of NFTs may be created and assigned without emitting Transfer. At the time of any
@@ -103,11 +110,10 @@ burntCount: uint256
 # @dev Mapping from index to token ID
 indexToTokenId: HashMap[uint256, uint256]
 
-# @dev Mapping from token ID to index
-tokenIdToIndex: HashMap[uint256, uint256]
-
-# @dev Mapping from NFT ID to the address that owns it.
-idToOwner: HashMap[uint256, address]
+# @dev Mapping from NFT ID to its packed token data. The lower 160 bits hold the address
+#      that owns it, the next 48 bits hold its index in the owner's token list, and the
+#      upper 48 bits hold its index in the token list.
+idToTokenData: HashMap[uint256, uint256]
 
 # @dev Mapping from NFT ID to approved address.
 idToApprovals: HashMap[uint256, address]
@@ -118,24 +124,23 @@ ownerToNFTokenCount: HashMap[address, uint256]
 # @dev Mapping from owner address to mapping of index to tokenIds
 ownerToNFTokenIdList: HashMap[address, HashMap[uint256, uint256]]
 
-# @dev Mapping from NFT ID to index of owner
-tokenToOwnerIndex: HashMap[uint256, uint256]
-
 # @dev Mapping from owner address to mapping of operator addresses.
 ownerToOperators: HashMap[address, HashMap[address, bool]]
 
 #@dev Maping from NFT ID to token URI
 idToURI: HashMap[uint256, String[64]]
 
-# @dev Mapping from address to last claimed timestamp
-address_to_last_claimed: public(HashMap[address, uint256])
+# @dev Address of minter, who can mint a token
+minter: address
+
+# @dev Mapping from address to its packed reward checkpoint. The lower 64 bits hold the
+#      timestamp of the checkpoint, and the upper 192 bits hold the rewards accrued up to
+#      it, in token-seconds.
+address_to_checkpoint: HashMap[address, uint256]
 
 # @dev Time-mineable token
 token: address
 
-# @dev Address of minter, who can mint a token
-minter: address
-
 # @dev ERC165 interface ID of ERC165
 ERC165_INTERFACE_ID: constant(bytes4) = 0x01ffc9a7
 
@@ -151,6 +156,39 @@ ERC721_ENUMERABLE_INTERFACE_ID: constant(bytes4) = 0x780e9d63
 # @dev ERC165 interface ID of ERC721TokenReceiver
 ERC721_TOKEN_RECEIVER_INTERFACE_ID: constant(bytes4) = 0x150b7a02
 
+# @dev Mask for the owner address in packed token data
+OWNER_MASK: constant(uint256) = 2 ** 160 - 1
+
+# @dev Bit offset of the index in the owner's token list in packed token data
+OWNER_INDEX_OFFSET: constant(int128) = 160
+
+# @dev Bit offset of the index in the token list in packed token data
+INDEX_OFFSET: constant(int128) = 208
+
+# @dev Mask for an index in packed token data, after shifting it to the lowest bits
+INDEX_MASK: constant(uint256) = 2 ** 48 - 1
+
+# @dev Mask for packed token data without the index in the owner's token list
+WITHOUT_OWNER_INDEX_MASK: constant(uint256) = (2 ** 48 - 1) * 2 ** 208 + 2 ** 160 - 1
+
+# @dev Mask for packed token data without the index in the token list
+WITHOUT_INDEX_MASK: constant(uint256) = 2 ** 208 - 1
+
+# @dev Maximum number of tokens that can be minted in a single `mintBatch` call
+MAX_MINT_BATCH_SIZE: constant(uint256) = 256
+
+# @dev Maximum number of entries returned by a single call to a bulk view function
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
+# @dev Number of bits of the timestamp in a reward checkpoint
+CHECKPOINT_TIMESTAMP_BITS: constant(int128) = 64
+
+# @dev Mask of the timestamp in a reward checkpoint
+CHECKPOINT_TIMESTAMP_MASK: constant(uint256) = 2 ** 64 - 1
+
+# @dev Maximum number of holders in a single call to `claim_rewards_for`
+MAX_CLAIM_BATCH_SIZE: constant(uint256) = 500
+
 
 @external
 def __init__(
@@ -202,6 +240,72 @@ def _totalSupply() -> uint256:
     return self.tokenId - self.burntCount
 
 
+### TOKEN DATA PACKING ###
+
+@pure
+@internal
+def _packTokenData(_owner: address, _ownerIndex: uint256, _index: uint256) -> uint256:
+    """
+    @dev Pack the owner of a NFT, its index in the owner's token list and its index in the
+         token list into a single word
+    """
+    return convert(_owner, uint256) | shift(_ownerIndex, OWNER_INDEX_OFFSET) | shift(_index, INDEX_OFFSET)
+
+
+@pure
+@internal
+def _unpackOwner(_tokenData: uint256) -> address:
+    """
+    @dev Returns the owner from packed token data
+    """
+    return convert(_tokenData & OWNER_MASK, address)
+
+
+@pure
+@internal
+def _unpackOwnerIndex(_tokenData: uint256) -> uint256:
+    """
+    @dev Returns the index in the owner's token list from packed token data
+    """
+    return shift(_tokenData, -OWNER_INDEX_OFFSET) & INDEX_MASK
+
+
+@pure
+@internal
+def _unpackIndex(_tokenData: uint256) -> uint256:
+    """
+    @dev Returns the index in the token list from packed token data
+    """
+    return shift(_tokenData, -INDEX_OFFSET)
+
+
+@pure
+@internal
+def _setOwnerIndex(_tokenData: uint256, _ownerIndex: uint256) -> uint256:
+    """
+    @dev Returns packed token data with the index in the owner's token list replaced
+    """
+    return (_tokenData & WITHOUT_OWNER_INDEX_MASK) | shift(_ownerIndex, OWNER_INDEX_OFFSET)
+
+
+@pure
+@internal
+def _setIndex(_tokenData: uint256, _index: uint256) -> uint256:
+    """
+    @dev Returns packed token data with the index in the token list replaced
+    """
+    return (_tokenData & WITHOUT_INDEX_MASK) | shift(_index, INDEX_OFFSET)
+
+
+@view
+@internal
+def _ownerOf(_tokenId: uint256) -> address:
+    """
+    @dev Returns the owner of a NFT, or zero address if `_tokenId` is not a valid NFT
+    """
+    return self._unpackOwner(self.idToTokenData[_tokenId])
+
+
 @view
 @external
 def supportsInterface(_interfaceID: bytes4) -> bool:
@@ -240,7 +344,7 @@ def ownerOf(_tokenId: uint256) -> address:
          Throws if `_tokenId` is not a valid NFT.
     @param _tokenId The identifier for an NFT.
     """
-    owner: address = self.idToOwner[_tokenId]
+    owner: address = self._ownerOf(_tokenId)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
     return owner
@@ -255,7 +359,7 @@ def getApproved(_tokenId: uint256) -> address:
     @param _tokenId ID of the NFT to query the approval of.
     """
     # Throws if `_tokenId` is not a valid NFT
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
     return self.idToApprovals[_tokenId]
 
 
@@ -295,7 +399,7 @@ def tokenURI(_tokenId: uint256) -> String[128]:
     @dev Returns the URI for the token ID
     @param _tokenId id of the ERC721 token
     """
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
 
     return concat(
         self.baseTokenURI,
@@ -319,7 +423,7 @@ def tokenByIndex(_index: uint256) -> uint256:
     @dev Get token by index
          Throws if '_index' is larger than totalSupply()
     """
-    assert _index <= self._totalSupply() - self.burntCount
+    assert _index <= self._totalSupply()
     assert _index > 0
 
     return self.indexToTokenId[_index]
@@ -344,121 +448,172 @@ def baseURI() -> String[64]:
     return self.baseTokenURI
 
 
+### BULK VIEW FUNCTIONS ###
+
+@view
+@external
+def tokensOfOwner(
+    _owner: address,
+    _start: uint256,
+    _count: uint256
+) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens of `_owner`, starting from index `_start`. Indexes count
+         from 1, as in `tokenOfOwnerByIndex`. Fewer tokens are returned at the end of the
+         token list of `_owner`.
+         Throws if `_owner` is zero address.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._balanceOf(_owner)
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _count or _start + i > last_index:
+            break
+
+        tokens.append(self.ownerToNFTokenIdList[_owner][_start + i])
+
+    return tokens
+
+
+@view
+@external
+def tokensByIndexRange(_start: uint256, _count: uint256) -> DynArray[uint256, MAX_PAGE_SIZE]:
+    """
+    @dev Get up to `_count` tokens starting from index `_start`. Indexes count from 1, as
+         in `tokenByIndex`. Fewer tokens are returned at the end of the token list.
+         Throws if `_start` is 0.
+         Throws if `_count` is larger than MAX_PAGE_SIZE.
+    """
+    assert _start > 0
+    assert _count <= MAX_PAGE_SIZE
+
+    last_index: uint256 = self._totalSupply()
+    tokens: DynArray[uint256, MAX_PAGE_SIZE] = []
+    for i in range(MAX_PAGE_SIZE):
+        if i == _count or _start + i > last_index:
+            break
+
+        tokens.append(self.indexToTokenId[_start + i])
+
+    return tokens
+
+
+@view
+@external
+def ownersOf(_tokenIds: DynArray[uint256, MAX_PAGE_SIZE]) -> DynArray[address, MAX_PAGE_SIZE]:
+    """
+    @dev Get the owners of `_tokenIds`, in the same order. Unlike `ownerOf`, the owner of a
+         token ID that is not a valid NFT is returned as zero address.
+    """
+    owners: DynArray[address, MAX_PAGE_SIZE] = []
+    for _tokenId in _tokenIds:
+        owners.append(self._ownerOf(_tokenId))
+
+    return owners
+
+
+@view
+@internal
+def _accrued_rewards(_holder: address) -> uint256:
+    """
+    @dev Returns the rewards accrued by `_holder` up to the current block, in
+         token-seconds. The balance of `_holder` is constant since its last checkpoint.
+    """
+    checkpoint: uint256 = self.address_to_checkpoint[_holder]
+    elapsed: uint256 = block.timestamp - (checkpoint & CHECKPOINT_TIMESTAMP_MASK)
+    return shift(checkpoint, -CHECKPOINT_TIMESTAMP_BITS) + self.ownerToNFTokenCount[_holder] * elapsed
+
+
+@view
+@external
+def pending_rewards(_holder: address) -> uint256:
+    """
+    @dev Returns the amount of the ERC20 that `_holder` can claim
+    @param _holder Address to query
+    """
+    accrued: uint256 = self._accrued_rewards(_holder)
+    return as_wei_value(accrued, 'ether')
+
+
 ### TRANSFER FUNCTION HELPERS ###
 
 @view
 @internal
-def _isApprovedOrOwner(_spender: address, _tokenId: uint256) -> bool:
+def _isApprovedOrOwner(_owner: address, _spender: address, _tokenId: uint256) -> bool:
     """
     @dev Returns whether the given spender can transfer a given token ID
+    @param owner address of the owner of the token
     @param spender address of the spender to query
     @param tokenId uint256 ID of the token to be transferred
     @return bool whether the msg.sender is approved for the given token ID,
         is an operator of the owner, or is the owner of the token
     """
-    owner: address = self.idToOwner[_tokenId]
-    spenderIsOwner: bool = owner == _spender
+    spenderIsOwner: bool = _owner == _spender
     spenderIsApproved: bool = _spender == self.idToApprovals[_tokenId]
-    spenderIsApprovedForAll: bool = (self.ownerToOperators[owner])[_spender]
+    spenderIsApprovedForAll: bool = (self.ownerToOperators[_owner])[_spender]
     return (spenderIsOwner or spenderIsApproved) or spenderIsApprovedForAll
 
 
 @internal
-def _addTokenToOwnerList(_to: address, _tokenId: uint256):
+def _addTokenTo(_to: address, _tokenId: uint256) -> uint256:
     """
-    @dev Add a NFT to an index mapping to a given address
+    @dev Add a NFT to the token list of a given address. The caller is responsible for
+         writing the packed token data of `_tokenId`.
     @param to address of the receiver
     @param tokenId uint256 ID Of the token to be added
+    @return uint256 index of the token in the token list of `_to`
     """
-    current_count: uint256 = self._balanceOf(_to)
+    self._checkpoint(_to)
 
-    if self.address_to_last_claimed[_to] == 0:
-        self.address_to_last_claimed[_to] = block.timestamp
+    # Change count tracking
+    current_count: uint256 = self.ownerToNFTokenCount[_to] + 1
+    self.ownerToNFTokenCount[_to] = current_count
 
+    # Update owner token index tracking
     self.ownerToNFTokenIdList[_to][current_count] = _tokenId
-    self.tokenToOwnerIndex[_tokenId] = current_count
+    return current_count
 
 
 @internal
-def _removeTokenFromOwnerList(_from: address, _tokenId: uint256):
+def _removeTokenFrom(_from: address, _ownerIndex: uint256):
     """
-    @dev Remove a NFT from an index mapping to a given address
+    @dev Remove a NFT from the token list of a given address, by moving the last token
+         of the list into its place. The caller is responsible for writing the packed
+         token data of the removed token.
     @param from address of the sender
-    @param tokenId uint256 ID Of the token to be removed
+    @param ownerIndex uint256 index of the token in the token list of `_from`
     """
-    # Delete
-    current_count: uint256 = self._balanceOf(_from)
-    current_index: uint256 = self.tokenToOwnerIndex[_tokenId]
+    self._checkpoint(_from)
 
-    if current_count == current_index:
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_count] = 0
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[_tokenId] = 0
+    current_count: uint256 = self.ownerToNFTokenCount[_from]
 
-    else:
+    if current_count != _ownerIndex:
         lastTokenId: uint256 = self.ownerToNFTokenIdList[_from][current_count]
 
-        # Add
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_index] = lastTokenId
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[lastTokenId] = current_index
-
-        # Delete
-        # update ownerToNFTokenIdList
-        self.ownerToNFTokenIdList[_from][current_count] = 0
-        # update tokenToOwnerIndex
-        self.tokenToOwnerIndex[_tokenId] = 0
-
-
-@internal
-def _addTokenTo(_to: address, _tokenId: uint256):
-    """
-    @dev Add a NFT to a given address
-         Throws if `_tokenId` is owned by someone.
-    """
-    # Throws if `_tokenId` is owned by someone
-    assert self.idToOwner[_tokenId] == empty(address)
-    # Change the owner
-    self.idToOwner[_tokenId] = _to
-    # Change count tracking
-    self.ownerToNFTokenCount[_to] += 1
-	# Update owner token index tracking
-    self._addTokenToOwnerList(_to, _tokenId)
-
-
-@internal
-def _removeTokenFrom(_from: address, _tokenId: uint256):
-    """
-    @dev Remove a NFT from a given address
-         Throws if `_from` is not the current owner.
-    """
-    # Throws if `_from` is not the current owner
-    assert self.idToOwner[_tokenId] == _from
+        # Move the last token into the index of the removed token
+        self.ownerToNFTokenIdList[_from][_ownerIndex] = lastTokenId
+        self.idToTokenData[lastTokenId] = self._setOwnerIndex(
+            self.idToTokenData[lastTokenId],
+            _ownerIndex
+        )
 
-	# Update owner token index tracking
-    self._removeTokenFromOwnerList(_from, _tokenId)
+    # Delete the last index
+    self.ownerToNFTokenIdList[_from][current_count] = 0
 
-    # Change the owner
-    self.idToOwner[_tokenId] = empty(address)
     # Change count tracking
-    new_count: uint256 = self.ownerToNFTokenCount[_from] - 1
+    new_count: uint256 = current_count - 1
     self.ownerToNFTokenCount[_from] = new_count
 
-    # Set earliest timestamp to 0 if balance is now 0
-    if new_count == 0:
-        self.address_to_last_claimed[_from] = 0
-
 
 @internal
-def _clearApproval(_owner: address, _tokenId: uint256):
+def _clearApproval(_tokenId: uint256):
     """
-    @dev Clear an approval of a given address
-         Throws if `_owner` is not the current owner.
+    @dev Clear an approval of a given NFT
     """
-    # Throws if `_owner` is not the current owner
-    assert self.idToOwner[_tokenId] == _owner
     if self.idToApprovals[_tokenId] != empty(address):
         # Reset approvals
         self.idToApprovals[_tokenId] = empty(address)
@@ -474,16 +629,27 @@ def _transferFrom(_from: address, _to: address, _tokenId: uint256, _sender: addr
          Throws if `_from` is not the current owner.
          Throws if `_tokenId` is not a valid NFT.
     """
+    tokenData: uint256 = self.idToTokenData[_tokenId]
+    owner: address = self._unpackOwner(tokenData)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Throws if `_from` is not the current owner
+    assert owner == _from
     # Check requirements
-    assert self._isApprovedOrOwner(_sender, _tokenId)
+    assert self._isApprovedOrOwner(owner, _sender, _tokenId)
     # Throws if `_to` is the zero address
     assert _to != empty(address)
-    # Clear approval. Throws if `_from` is not the current owner
-    self._clearApproval(_from, _tokenId)
-    # Remove NFT. Throws if `_tokenId` is not a valid NFT
-    self._removeTokenFrom(_from, _tokenId)
+    # Clear approval
+    self._clearApproval(_tokenId)
+    # Remove NFT
+    self._removeTokenFrom(_from, self._unpackOwnerIndex(tokenData))
     # Add NFT
-    self._addTokenTo(_to, _tokenId)
+    owner_index: uint256 = self._addTokenTo(_to, _tokenId)
+    self.idToTokenData[_tokenId] = self._packTokenData(
+        _to,
+        owner_index,
+        self._unpackIndex(tokenData)
+    )
     # Log the transfer
     log Transfer(_from, _to, _tokenId)
 
@@ -494,7 +660,7 @@ def _setTokenURI(_tokenId: uint256, _tokenURI: String[64]):
     @dev Set the URI for a token
          Throws if the token ID does not exist
     """
-    assert self.idToOwner[_tokenId] != empty(address)
+    assert self._ownerOf(_tokenId) != empty(address)
 
     self.idToURI[_tokenId] = _tokenURI
 
@@ -555,13 +721,13 @@ def approve(_approved: address, _tokenId: uint256):
     @param _approved Address to be approved for the given NFT ID.
     @param _tokenId ID of the token to be approved.
     """
-    owner: address = self.idToOwner[_tokenId]
+    owner: address = self._ownerOf(_tokenId)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
     # Throws if `_approved` is the current owner
     assert _approved != owner
     # Check requirements
-    senderIsOwner: bool = self.idToOwner[_tokenId] == msg.sender
+    senderIsOwner: bool = owner == msg.sender
     senderIsApprovedForAll: bool = (self.ownerToOperators[owner])[msg.sender]
     assert (senderIsOwner or senderIsApprovedForAll)
     # Set the approval
@@ -592,7 +758,7 @@ def _mint(_to: address, _tokenURI: String[64]) -> bool:
     """
     @dev Function to mint tokens
          Throws if `_to` is zero address.
-         Throws if `_tokenId` is owned by someone.
+         Throws if the token ID would exceed `self.maxSupply`.
     @param _to The address that will receive the minted tokens.
     @param _tokenURI The token URI
     @return A boolean that indicates if the operation was successful.
@@ -600,19 +766,18 @@ def _mint(_to: address, _tokenURI: String[64]) -> bool:
     # Throws if `_to` is zero address
     assert _to != empty(address)
 
-    # Throws if '_tokenId' is equal to or greater than 'self.maxSupply'
-    assert self.tokenId < self.maxSupply
+    # Throws if '_tokenId' is greater than 'self.maxSupply'
+    _tokenId: uint256 = self.tokenId + 1
+    assert _tokenId <= self.maxSupply
+    self.tokenId = _tokenId
 
-    # Add NFT. Throws if `_tokenId` is owned by someone
-    self.tokenId += 1
-    _tokenId: uint256 = self.tokenId
-
-    self._addTokenTo(_to, _tokenId)
-    current_index: uint256 = self._totalSupply() - self.burntCount
+    # Add NFT. Token IDs are never reused, so `_tokenId` is not owned by anyone
+    owner_index: uint256 = self._addTokenTo(_to, _tokenId)
+    current_index: uint256 = _tokenId - self.burntCount
 
     self.indexToTokenId[current_index] = _tokenId
-    self.tokenIdToIndex[_tokenId] = current_index
-    self._setTokenURI(_tokenId, _tokenURI)
+    self.idToTokenData[_tokenId] = self._packTokenData(_to, owner_index, current_index)
+    self.idToURI[_tokenId] = _tokenURI
     log Transfer(empty(address), _to, _tokenId)
 
     return True
@@ -635,6 +800,78 @@ def mint(_to: address, _tokenURI: String[64]) -> bool:
     return True
 
 
+@payable
+@external
+def mintBatch(
+    _recipients: DynArray[address, MAX_MINT_BATCH_SIZE],
+    _tokenURIs: DynArray[String[64], MAX_MINT_BATCH_SIZE]
+) -> bool:
+    """
+    @dev Function to mint a batch of tokens. Token IDs are assigned in the order of
+         `_recipients`. `tokenId` is read and written once for the batch, and the
+         balance of a recipient is written once for each consecutive run of mints to it,
+         so recipients should be grouped together.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_recipients` and `_tokenURIs` have different lengths.
+         Throws if any of `_recipients` is zero address.
+         Throws if the batch would exceed `self.maxSupply`.
+    @param _recipients The addresses that will receive the minted tokens.
+    @param _tokenURIs The token URIs, in the same order as `_recipients`.
+    @return Boolean indicating if operation was successful
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+
+    batch_size: uint256 = len(_recipients)
+    assert batch_size == len(_tokenURIs)
+
+    _tokenId: uint256 = self.tokenId
+
+    # Throws if the last token ID is greater than 'self.maxSupply'
+    assert _tokenId + batch_size <= self.maxSupply
+
+    current_index: uint256 = _tokenId - self.burntCount
+    current_owner: address = empty(address)
+    current_count: uint256 = 0
+
+    for i in range(MAX_MINT_BATCH_SIZE):
+        if i == batch_size:
+            break
+
+        _to: address = _recipients[i]
+
+        if _to != current_owner:
+            # Throws if `_to` is zero address
+            assert _to != empty(address)
+
+            self._checkpoint(_to)
+
+            # Write the balance of the previous run of recipients
+            if current_owner != empty(address):
+                self.ownerToNFTokenCount[current_owner] = current_count
+
+            current_owner = _to
+            current_count = self.ownerToNFTokenCount[_to]
+
+        _tokenId += 1
+        current_count += 1
+        current_index += 1
+
+        # Token IDs in the batch have never been minted, so they are not owned by anyone
+        self.ownerToNFTokenIdList[_to][current_count] = _tokenId
+        self.indexToTokenId[current_index] = _tokenId
+        self.idToTokenData[_tokenId] = self._packTokenData(_to, current_count, current_index)
+
+        self.idToURI[_tokenId] = _tokenURIs[i]
+        log Transfer(empty(address), _to, _tokenId)
+
+    if current_owner != empty(address):
+        self.ownerToNFTokenCount[current_owner] = current_count
+
+    self.tokenId = _tokenId
+    return True
+
+
 @external
 def withdraw():
     """
@@ -653,24 +890,31 @@ def burn(_tokenId: uint256):
          Throws if `_tokenId` is not a valid NFT.
     @param _tokenId uint256 id of the ERC721 token to be burned.
     """
-    # Check requirements
-    assert self._isApprovedOrOwner(msg.sender, _tokenId)
-    owner: address = self.idToOwner[_tokenId]
+    tokenData: uint256 = self.idToTokenData[_tokenId]
+    owner: address = self._unpackOwner(tokenData)
     # Throws if `_tokenId` is not a valid NFT
     assert owner != empty(address)
-    self._clearApproval(owner, _tokenId)
-    self._removeTokenFrom(owner, _tokenId)
-    current_index: uint256 = self.tokenIdToIndex[_tokenId]
-    last_index: uint256 = self._totalSupply() - self.burntCount
+    # Check requirements
+    assert self._isApprovedOrOwner(owner, msg.sender, _tokenId)
+    self._clearApproval(_tokenId)
+    self._removeTokenFrom(owner, self._unpackOwnerIndex(tokenData))
+
+    current_index: uint256 = self._unpackIndex(tokenData)
+    last_index: uint256 = self._totalSupply()
 
-    last_index_token_id: uint256 = self.indexToTokenId[last_index]
+    if current_index != last_index:
+        last_index_token_id: uint256 = self.indexToTokenId[last_index]
 
-    # Set last index to current index
-    self.indexToTokenId[current_index] = last_index_token_id
-    self.tokenIdToIndex[last_index_token_id] = current_index
+        # Set last index to current index
+        self.indexToTokenId[current_index] = last_index_token_id
+        self.idToTokenData[last_index_token_id] = self._setIndex(
+            self.idToTokenData[last_index_token_id],
+            current_index
+        )
 
-    # Remove burnt token from mapping of token ID to index
-    self.tokenIdToIndex[_tokenId] = 0
+    # Remove burnt token from the token list and delete its token data
+    self.indexToTokenId[last_index] = 0
+    self.idToTokenData[_tokenId] = 0
 
 	# Increment coun of burnt tokens
     self.burntCount += 1
@@ -680,6 +924,16 @@ def burn(_tokenId: uint256):
 
 # Additional functions for time mining
 
+@internal
+def _checkpoint(_holder: address):
+    """
+    @dev Accrue the rewards of `_holder` up to the current block. Called before every
+         change to its balance, so that rewards accrue at its balance at the time.
+    """
+    accrued: uint256 = self._accrued_rewards(_holder)
+    self.address_to_checkpoint[_holder] = shift(accrued, CHECKPOINT_TIMESTAMP_BITS) | block.timestamp
+
+
 @external
 def set_token_address(token_addr: address):
     """
@@ -693,11 +947,36 @@ def set_token_address(token_addr: address):
 @external
 def claim_rewards():
     """
-    @dev Claim the accrued ERC20 mined by the period of holding.
+    @dev Claim the accrued ERC20 mined by the period of holding. One token is mined per
+         second for each NFT held.
     """
-    last_claimed: uint256 = self.address_to_last_claimed[msg.sender]
-    assert last_claimed != 0, "Nothing to claim"
+    amt: uint256 = self._accrued_rewards(msg.sender)
+    assert amt != 0, "Nothing to claim"
 
-    amt: uint256 = block.timestamp - last_claimed
+    self.address_to_checkpoint[msg.sender] = block.timestamp
     token_addr: address = self.token
     ERC20Mintable(token_addr).mint(msg.sender, as_wei_value(amt, 'ether'))
+
+
+@external
+def claim_rewards_for(holders: DynArray[address, MAX_CLAIM_BATCH_SIZE]):
+    """
+    @dev Claim the accrued ERC20 of each of a list of holders, to the holders, with a
+         single mint call to the token. Holders with nothing to claim are skipped.
+    @param holders Addresses to claim for
+    """
+    recipients: DynArray[address, MAX_CLAIM_BATCH_SIZE] = []
+    amounts: DynArray[uint256, MAX_CLAIM_BATCH_SIZE] = []
+
+    for holder in holders:
+        amt: uint256 = self._accrued_rewards(holder)
+        if amt == 0:
+            continue
+
+        self.address_to_checkpoint[holder] = block.timestamp
+        recipients.append(holder)
+        amounts.append(as_wei_value(amt, 'ether'))
+
+    if len(recipients) != 0:
+        token_addr: address = self.token
+        ERC20Mintable(token_addr).mintBatch(recipients, amounts)
@@ -8,10 +8,16 @@
 @notice You can use this contract for a simple Vickrey auction.
 @dev The ERC-721 non-fungible token needs to be transferred to the contract in
 	 order for the auction to begin.
+	 The contract can also be deployed as a minimal proxy by
+	 `vickrey_auction_ERC721_factory.vy`, which escrows the token and starts the
+	 auction with `initialize`.
 """
 
 from vyper.interfaces import ERC721
 
+interface VickreyAuctionERC721Factory:
+	def remove_auction(): nonpayable
+
 event Bid:
 	value: uint256
 	bidder: indexed(address)
@@ -49,6 +55,9 @@ start_price: public(uint256)
 # @dev Token ID of ERC-721 non-fungible token
 token_id: public(uint256)
 
+# @dev Factory that created the auction, or the zero address if deployed directly
+factory: public(address)
+
 @external
 def __init__(
 	token_address: address
@@ -60,6 +69,53 @@ def __init__(
 	self.erc721_contract = ERC721(token_address)
 
 
+@internal
+def _start(
+	start_price: uint256,
+	deadline: uint256,
+	token_id: uint256
+):
+	# Deadline must be after current block
+	assert deadline > block.timestamp, "Deadline for auction must be in the future"
+
+	self.start_price = start_price
+	self.deadline = deadline
+	self.token_id = token_id
+	self.top_two_bids = [start_price, start_price]
+	self.bids_to_bidder[start_price] = self.owner
+	self.is_started = True
+
+
+@external
+def initialize(
+	token_address: address,
+	owner: address,
+	start_price: uint256,
+	deadline: uint256,
+	token_id: uint256
+) -> bool:
+	"""
+	@notice Initialise a minimal proxy of the auction and start it, with the
+			ERC-721 non-fungible token already transferred to the auction contract.
+	@dev `msg.sender` is recorded as the factory of the auction.
+		 Throws if the auction has an owner, which includes any auction deployed
+		 with the constructor.
+		 Throws if deadline is at or before current timestamp.
+		 Throws if the auction contract is not owner of the ERC-721 non-fungible token.
+	"""
+	assert self.owner == empty(address), "Auction is already initialised"
+
+	self.owner = owner
+	self.factory = msg.sender
+	self.erc721_contract = ERC721(token_address)
+
+	assert self.erc721_contract.ownerOf(token_id) == self, "Token is not escrowed"
+
+	self._start(start_price, deadline, token_id)
+
+	return True
+
+
 @external
 def start_auction(
 	start_price: uint256,
@@ -79,19 +135,11 @@ def start_auction(
 
 	assert self.is_started == False, "Auction has already started"
 
-	# Deadline must be after current block
-	assert deadline > block.timestamp, "Deadline for auction must be in the future"
-
 	assert self.erc721_contract.ownerOf(token_id) == msg.sender
 	assert self.erc721_contract.getApproved(token_id) == self
 	self.erc721_contract.transferFrom(msg.sender, self, token_id)
 
-	self.start_price = start_price
-	self.deadline = deadline
-	self.token_id = token_id
-	self.top_two_bids = [start_price, start_price]
-	self.bids_to_bidder[start_price] = self.owner
-	self.is_started = True
+	self._start(start_price, deadline, token_id)
 
 	return True
 
@@ -150,6 +198,9 @@ def close():
 		# If no winner, transfer ERC-721 non-fungible token back to owner
 		self.erc721_contract.transferFrom(self, self.owner, self.token_id)
 
+	if self.factory != empty(address):
+		VickreyAuctionERC721Factory(self.factory).remove_auction()
+
 
 @external
 def refund():
@@ -0,0 +1,151 @@
+# @version ^0.3.2
+
+"""
+@title Factory of Vickrey auctions for ERC-721 non-fungible tokens
+@license GPL-3.0
+@author Gary Tse
+@notice You can use this contract to start a Vickrey auction for an ERC-721
+		non-fungible token in a single transaction.
+@dev Each auction is an EIP-1167 minimal proxy to a single deployment of
+	 `vickrey_auction_ERC721.vy`, which is far cheaper to deploy than a copy
+	 of the auction contract.
+	 The factory needs to be approved for the ERC-721 non-fungible token, as it
+	 transfers the token from its owner to the auction.
+"""
+
+from vyper.interfaces import ERC721
+
+interface VickreyAuctionERC721:
+	def initialize(
+		token_address: address,
+		owner: address,
+		start_price: uint256,
+		deadline: uint256,
+		token_id: uint256
+	) -> bool: nonpayable
+
+event AuctionCreated:
+	auction: indexed(address)
+	owner: indexed(address)
+	token_address: indexed(address)
+	token_id: uint256
+
+event AuctionRemoved:
+	auction: indexed(address)
+
+MAX_PAGE_SIZE: constant(uint256) = 1000
+
+# @dev Address of the auction contract that every minimal proxy delegates to
+IMPLEMENTATION: public(immutable(address))
+
+# @dev Mapping from index to address of live auctions
+live_auctions: public(HashMap[uint256, address])
+
+# @dev Number of live auctions
+live_auction_count: public(uint256)
+
+# @dev Mapping from address of live auctions to their index plus one, so that
+#	   the auctions that are not live map to zero
+auction_to_index: HashMap[address, uint256]
+
+@external
+def __init__(
+	implementation: address
+):
+
+	IMPLEMENTATION = implementation
+
+
+@external
+def create_auction(
+	token_address: address,
+	token_id: uint256,
+	start_price: uint256,
+	deadline: uint256
+) -> address:
+	"""
+	@notice Create an auction for an ERC-721 non-fungible token owned by
+			`msg.sender`, transfer the token to the auction and start it.
+	@dev Throws if `msg.sender` is not owner of the ERC-721 non-fungible token.
+		 Throws if the factory is not approved for the ERC-721 non-fungible token.
+		 Throws if deadline is at or before current timestamp.
+	@param token_address Address of the ERC-721 non-fungible token.
+	@param token_id Token ID of the ERC-721 non-fungible token.
+	@param start_price Start price of the auction.
+	@param deadline Deadline of the auction.
+	@return Address of the auction.
+	"""
+	_auction: address = create_minimal_proxy_to(IMPLEMENTATION)
+
+	ERC721(token_address).transferFrom(msg.sender, _auction, token_id)
+	VickreyAuctionERC721(_auction).initialize(
+		token_address,
+		msg.sender,
+		start_price,
+		deadline,
+		token_id
+	)
+
+	_index: uint256 = self.live_auction_count
+	self.live_auctions[_index] = _auction
+	self.auction_to_index[_auction] = _index + 1
+	self.live_auction_count = _index + 1
+
+	log AuctionCreated(_auction, msg.sender, token_address, token_id)
+
+	return _auction
+
+
+@external
+def remove_auction():
+	"""
+	@notice Remove `msg.sender` from the live auctions.
+	@dev Called by an auction when it is closed. The last live auction is moved
+		 to the index of the removed auction.
+		 Throws if `msg.sender` is not a live auction.
+	"""
+	_index: uint256 = self.auction_to_index[msg.sender]
+	assert _index != 0, "Not a live auction"
+
+	_last_index: uint256 = self.live_auction_count - 1
+	if _index - 1 != _last_index:
+		_last_auction: address = self.live_auctions[_last_index]
+		self.live_auctions[_index - 1] = _last_auction
+		self.auction_to_index[_last_auction] = _index
+
+	self.live_auctions[_last_index] = empty(address)
+	self.auction_to_index[msg.sender] = 0
+	self.live_auction_count = _last_index
+
+	log AuctionRemoved(msg.sender)
+
+
+@external
+@view
+def is_live(auction: address) -> bool:
+	"""
+	@dev Check whether an auction was created by the factory and has not closed.
+	@return Boolean value of whether the auction is live.
+	"""
+	return self.auction_to_index[auction] != 0
+
+
+@external
+@view
+def live_auctions_by_index_range(start: uint256, count: uint256) -> DynArray[address, MAX_PAGE_SIZE]:
+	"""
+	@notice Enumerate up to `count` live auctions from index `start`.
+	@dev Throws if `count` is larger than MAX_PAGE_SIZE.
+	@param start The index of the first live auction.
+	@param count The maximum number of live auctions.
+	@return The live auctions, which are fewer than `count` at the end.
+	"""
+	assert count <= MAX_PAGE_SIZE
+
+	_auctions: DynArray[address, MAX_PAGE_SIZE] = []
+	for i in range(MAX_PAGE_SIZE):
+		if i >= count or start + i >= self.live_auction_count:
+			break
+		_auctions.append(self.live_auctions[start + i])
+
+	return _auctions
@@ -0,0 +1,187 @@
+# @version ^0.3.2
+
+"""
+@title Sealed-bid Vickrey auction where winning bidder pays the second highest bid price
+@license GPL-3.0
+@author Gary Tse
+@notice You can use this contract for a simple sealed-bid Vickrey auction. Bidders
+		commit to the hash of their bid with a deposit of at least the bid before the
+		commit deadline, and reveal their bid after it, before the reveal deadline.
+@dev This contract does not handle the transfer of the underlying asset.
+	 The commitment of a `bid` with a secret `salt` by `bidder` is
+	 `keccak256(_abi_encode(auction, bidder, bid, salt))`, as returned by
+	 `get_commitment`. The deposit hides the bid only if it is larger than the bid.
+	 Each call reads and writes a fixed number of slots, whatever the number of
+	 bidders.
+"""
+
+event Commit:
+	deposit: uint256
+	bidder: indexed(address)
+
+event Reveal:
+	value: uint256
+	bidder: indexed(address)
+
+event Refund:
+	value: uint256
+	bidder: indexed(address)
+
+owner: address
+
+# @dev Highest and second highest revealed bids, and the bidder of the highest bid
+highest_bid: public(uint256)
+second_highest_bid: public(uint256)
+highest_bidder: public(address)
+
+# @dev Mapping of bidding addresses to the hash of their sealed bid, until revealed
+bidder_to_commitment: public(HashMap[address, bytes32])
+
+# @dev Mapping of bidding addresses to balance held in contract
+bidder_to_balance: public(HashMap[address, uint256])
+
+START_PRICE: immutable(uint256)
+COMMIT_DEADLINE: immutable(uint256)
+REVEAL_DEADLINE: immutable(uint256)
+
+# @dev Boolean for whether owner has claimed the winning bid
+is_claimed: public(bool)
+
+
+@external
+def __init__(
+	start_price: uint256,
+	commit_deadline: uint256,
+	reveal_deadline: uint256
+):
+
+	# Deadlines must be after current block, and bids revealed after they are committed
+	assert commit_deadline > block.timestamp
+	assert reveal_deadline > commit_deadline
+
+	START_PRICE = start_price
+	COMMIT_DEADLINE = commit_deadline
+	REVEAL_DEADLINE = reveal_deadline
+
+	self.owner = msg.sender
+	self.is_claimed = False
+	self.highest_bid = start_price
+	self.second_highest_bid = start_price
+	self.highest_bidder = msg.sender
+
+
+@external
+@payable
+def commit(commitment: bytes32):
+	"""
+	@notice Submit a sealed bid to the contract with a deposit of Ether. If a bid has
+			been committed, it is replaced by `commitment`, and `msg.value` is added
+			to the deposit.
+	@dev Throws if the commit deadline has passed.
+		 Throws if `commitment` is empty.
+	@param commitment The hash of the bid, as returned by `get_commitment`.
+	"""
+	assert block.timestamp <= COMMIT_DEADLINE, "Commit phase has ended"
+	assert commitment != empty(bytes32), "Empty commitment"
+
+	_deposit: uint256 = self.bidder_to_balance[msg.sender] + msg.value
+
+	self.bidder_to_commitment[msg.sender] = commitment
+	self.bidder_to_balance[msg.sender] = _deposit
+
+	log Commit(_deposit, msg.sender)
+
+
+@external
+def reveal(bid: uint256, salt: bytes32):
+	"""
+	@notice Reveal the sealed bid of `msg.sender`. Bids at or below the start price
+			are revealed, but can not win.
+	@dev Throws if the commit deadline has not passed.
+		 Throws if the reveal deadline has passed.
+		 Throws if `bid` and `salt` do not match the commitment of `msg.sender`,
+		 or the bid was already revealed.
+		 Throws if `bid` is more than the deposit of `msg.sender`.
+	@param bid The bid.
+	@param salt The secret that the bid was committed with.
+	"""
+	assert block.timestamp > COMMIT_DEADLINE, "Commit phase has not ended"
+	assert block.timestamp <= REVEAL_DEADLINE, "Reveal phase has ended"
+	assert self.bidder_to_commitment[msg.sender] == keccak256(
+		_abi_encode(self, msg.sender, bid, salt)
+	), "Invalid reveal"
+	assert bid <= self.bidder_to_balance[msg.sender], "Bid is above deposit"
+
+	self.bidder_to_commitment[msg.sender] = empty(bytes32)
+
+	# Equal bids are won by the first to reveal, at the price of the bid
+	if bid > self.highest_bid:
+		self.second_highest_bid = self.highest_bid
+		self.highest_bid = bid
+		self.highest_bidder = msg.sender
+	elif bid > self.second_highest_bid:
+		self.second_highest_bid = bid
+
+	log Reveal(bid, msg.sender)
+
+
+@external
+def close():
+	"""
+	@notice Close the auction and transfer the second highest bid value from the
+			winning bidder's balance to the owner of the contract.
+	@dev Throws if the reveal deadline has not passed.
+		 Throws if the auction has already closed.
+	"""
+	assert block.timestamp > REVEAL_DEADLINE, "Auction has not ended"
+	assert self.is_claimed == False, "Owner has already claimed"
+
+	if self.highest_bid > START_PRICE:
+		self.is_claimed = True
+
+		# Send 2nd highest bid amount to owner
+		send(self.owner, self.second_highest_bid)
+
+
+@external
+def refund():
+	"""
+	@notice Claim the unused deposit after the auction has ended. The deposits of
+			bids that were not revealed are refunded in full.
+	@dev Throws if the reveal deadline has not passed.
+		 Throws if `msg.sender` does not have any funds.
+	"""
+	assert block.timestamp > REVEAL_DEADLINE, "Auction has not closed"
+	assert self.bidder_to_balance[msg.sender] > 0, "No bids from current address"
+
+	_balance: uint256 = self.bidder_to_balance[msg.sender]
+
+	# If msg.sender is the top bidder, subtract the bid price (2nd highest bid)
+	if msg.sender == self.highest_bidder:
+		_balance = _balance - self.second_highest_bid
+
+	self.bidder_to_balance[msg.sender] = 0
+	send(msg.sender, _balance)
+	log Refund(_balance, msg.sender)
+
+
+@external
+@view
+def get_commitment(bidder: address, bid: uint256, salt: bytes32) -> bytes32:
+	"""
+	@notice Get the commitment of a `bid` by `bidder` with the secret `salt`.
+	@dev Compute the commitment off-chain instead, as a call may reveal the bid to the
+		 node that serves it.
+	@return The hash to commit to.
+	"""
+	return keccak256(_abi_encode(self, bidder, bid, salt))
+
+
+@external
+@view
+def has_ended() -> bool:
+	"""
+	@dev Check whether the auction has ended
+	@return Boolean value of whether the reveal deadline has passed.
+	"""
+	return block.timestamp > REVEAL_DEADLINE
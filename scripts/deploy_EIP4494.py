@@ -7,7 +7,10 @@ from ape import (
 
 from eip712.messages import EIP712Message
 
+from utils.compile_cache import install_compile_cache
+
 def main():
+    install_compile_cache()
     print(networks.provider.name)
     deployer = accounts.test_accounts[0]
 
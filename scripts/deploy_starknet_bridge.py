@@ -4,11 +4,14 @@ from ape import (
     project,
 )
 
+from utils.compile_cache import install_compile_cache
+
 STARKNET_CORE_GOERLI_ADDRESS = "0xde29d060D45901Fb19ED6C6e959EB22d8626708e"
 
 # Use Goerli testnet
 
 def main():
+    install_compile_cache()
 
     a1 = accounts.load("deployment_account")
 
@@ -4,7 +4,10 @@ from ape import (
     project,
 )
 
+from utils.compile_cache import install_compile_cache
+
 def main():
+    install_compile_cache()
     deployer = accounts.test_accounts[0]
 
     erc721 = project.timer.deploy(
@@ -0,0 +1,68 @@
+"""
+Chain states that are built once per session and restored by snapshot.
+
+A fixture that deploys or mints can restore its state with `chain_states` instead of
+building it again for every test:
+
+    @pytest.fixture
+    def mint_a1_1(accounts, chain_states, erc721):
+        return chain_states.restore(
+            "mint_a1_1", lambda: erc721.mint(accounts[1], "1.json", sender=accounts[0])
+        )
+
+The first time a state is built on top of a given chain head, a snapshot of the chain is
+taken after it. Every later time, the chain is reverted to that snapshot, and the return
+value of the first build is returned. The fixtures a fixture depends on are restored
+first, so a state is keyed by the head it was built on as well as its name, and the
+same fixture on top of different states is built once for each of them. The name
+identifies the state that is built, so fixtures that build different states on top of
+the same state must use different names.
+
+A state can not end with a block mined by setting `chain.pending_timestamp`, as
+eth-tester does not validate the difficulty of that block when it is mined, and rejects
+it when it is reverted to. Mine another block after it.
+
+ape still runs each test in its own snapshot, which is reverted after the test, so tests
+keep the same isolation as when every state was built for every test.
+"""
+
+import pytest
+
+
+class ChainStates:
+    """
+    Cache of chain states, keyed by the head they were built on and their name.
+    """
+
+    def __init__(self, chain):
+        self.chain = chain
+        self.states = {}
+        self.builds = 0
+        self.restores = 0
+
+    def restore(self, name, build):
+        """
+        Restore the state `name` on top of the current head, building it with `build`
+        if it has not been built on it yet. Returns the return value of `build`.
+        """
+        provider = self.chain.provider
+        key = (provider.snapshot(), name)
+        if key not in self.states:
+            result = build()
+            self.states[key] = (provider.snapshot(), result)
+            self.builds += 1
+            return result
+
+        snapshot_id, result = self.states[key]
+
+        # Reverted through the provider, as `chain.restore` drops the snapshots that
+        # were taken after `snapshot_id`, including the one ape reverts to after the test
+        provider.revert(snapshot_id)
+        self.chain.history.revert_to_block(self.chain.blocks.height)
+        self.restores += 1
+        return result
+
+
+@pytest.fixture(scope="session")
+def chain_states(chain):
+    yield ChainStates(chain)
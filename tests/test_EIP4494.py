@@ -13,6 +13,20 @@ from tests.constants import (
     INVALID_INTERFACE_ID,
     ZERO_ADDRESS,
 )
+from utils.signing import to_compact
+
+
+def encode_rsv(signature):
+    """
+    Encode a signature as r, s and v. Test accounts strip the leading zero bytes of r
+    and s, so they are padded back to 32 bytes.
+    """
+    return (
+        signature.r.rjust(32, b"\0")
+        + signature.s.rjust(32, b"\0")
+        + signature.v.to_bytes(1, "big")
+    )
+
 
 # Tests adapted from official Vyper example
 
@@ -22,21 +36,24 @@ def local_account(accounts):
     yield accounts[5]
 
 
-@pytest.fixture(scope="class", autouse=True)
-def eip4494(accounts, project):
-    c = project.EIP4494.deploy(
-        "Test Token",
-        "TST",
-        "https://www.test.com/",
-        100,
-        accounts[0],
-        accounts[0],
-        sender=accounts[0],
-    )
+@pytest.fixture(autouse=True)
+def eip4494(accounts, chain_states, project):
+    def deploy():
+        c = project.EIP4494.deploy(
+            "Test Token",
+            "TST",
+            "https://www.test.com/",
+            100,
+            accounts[0],
+            accounts[0],
+            sender=accounts[0],
+        )
 
-    # Mint 1 token
-    c.mint(accounts[0], "1.json", sender=accounts[0])
-    yield c
+        # Mint 1 token
+        c.mint(accounts[0], "1.json", sender=accounts[0])
+        return c
+
+    yield chain_states.restore("eip4494", deploy)
 
 
 def test_supportsInterface(eip4494):
@@ -263,87 +280,91 @@ def test_burn(accounts, eip4494):
 
 
 @pytest.fixture
-def test_permit(accounts, chain, local_account, eip4494):
+def test_permit(accounts, chain, chain_states, local_account, eip4494):
+    def build():
+        eip4494.mint(local_account, "2.json", sender=accounts[0])
 
-    eip4494.mint(local_account, "2.json", sender=accounts[0])
+        assert eip4494.ownerOf(2) == local_account.address
 
-    assert eip4494.ownerOf(2) == local_account.address
+        class Permit(EIP712Message):
 
-    class Permit(EIP712Message):
+            # EIP-712 fields
+            _name_: "string" = "Vyper EIP4494"
+            _version_: "string" = "1.0.0"
+            _chainId_: "uint256" = CHAIN_ID
+            _verifyingContract_: "address" = eip4494.address
 
-        # EIP-712 fields
-        _name_: "string" = "Vyper EIP4494"
-        _version_: "string" = "1.0.0"
-        _chainId_: "uint256" = CHAIN_ID
-        _verifyingContract_: "address" = eip4494.address
+            # EIP-4494 fields
+            spender: "address"
+            tokenId: "uint256"
+            nonce: "uint256"
+            deadline: "uint256"
 
-        # EIP-4494 fields
-        spender: "address"
-        tokenId: "uint256"
-        nonce: "uint256"
-        deadline: "uint256"
+        nonce = int(eip4494.nonces(2))
+        deadline = chain.pending_timestamp + 10000
 
-    nonce = int(eip4494.nonces(2))
-    deadline = chain.pending_timestamp + 10000
+        assert nonce == 0
+        assert deadline > chain.pending_timestamp
 
-    assert nonce == 0
-    assert deadline > chain.pending_timestamp
+        permit = Permit(
+            spender=accounts[2].address, tokenId=2, nonce=nonce, deadline=deadline
+        )
 
-    permit = Permit(
-        spender=accounts[2].address, tokenId=2, nonce=nonce, deadline=deadline
-    )
+        signed = local_account.sign_message(permit.signable_message)
 
-    signed = local_account.sign_message(permit.signable_message)
+        eip4494.permit(
+            permit.spender,
+            permit.tokenId,
+            permit.deadline,
+            signed.encode_rsv(),
+            sender=local_account,
+        )
 
-    eip4494.permit(
-        permit.spender,
-        permit.tokenId,
-        permit.deadline,
-        signed.encode_rsv(),
-        sender=local_account,
-    )
+    chain_states.restore("test_permit", build)
 
 
 @pytest.fixture
-def test_permit_two(accounts, chain, local_account, eip4494):
+def test_permit_two(accounts, chain, chain_states, local_account, eip4494):
+    def build():
+        eip4494.mint(local_account, "2.json", sender=accounts[0])
 
-    eip4494.mint(local_account, "2.json", sender=accounts[0])
+        assert eip4494.ownerOf(2) == local_account.address
 
-    assert eip4494.ownerOf(2) == local_account.address
+        class Permit(EIP712Message):
 
-    class Permit(EIP712Message):
+            # EIP-712 fields
+            _name_: "string" = "Vyper EIP4494"
+            _version_: "string" = "1.0.0"
+            _chainId_: "uint256" = CHAIN_ID
+            _verifyingContract_: "address" = eip4494.address
 
-        # EIP-712 fields
-        _name_: "string" = "Vyper EIP4494"
-        _version_: "string" = "1.0.0"
-        _chainId_: "uint256" = CHAIN_ID
-        _verifyingContract_: "address" = eip4494.address
+            # EIP-4494 fields
+            spender: "address"
+            tokenId: "uint256"
+            nonce: "uint256"
+            deadline: "uint256"
 
-        # EIP-4494 fields
-        spender: "address"
-        tokenId: "uint256"
-        nonce: "uint256"
-        deadline: "uint256"
+        nonce = int(eip4494.nonces(2))
+        deadline = chain.pending_timestamp + 10000
 
-    nonce = int(eip4494.nonces(2))
-    deadline = chain.pending_timestamp + 10000
+        assert nonce == 0
+        assert deadline > chain.pending_timestamp
 
-    assert nonce == 0
-    assert deadline > chain.pending_timestamp
+        permit = Permit(
+            spender=accounts[2].address, tokenId=2, nonce=nonce, deadline=deadline
+        )
 
-    permit = Permit(
-        spender=accounts[2].address, tokenId=2, nonce=nonce, deadline=deadline
-    )
+        signed = local_account.sign_message(permit.signable_message)
 
-    signed = local_account.sign_message(permit.signable_message)
+        eip4494.permit(
+            permit.spender,
+            permit.tokenId,
+            permit.deadline,
+            signed.encode_rsv(),
+            sender=accounts[2],
+        )
 
-    eip4494.permit(
-        permit.spender,
-        permit.tokenId,
-        permit.deadline,
-        signed.encode_rsv(),
-        sender=accounts[2],
-    )
+    chain_states.restore("test_permit_two", build)
 
 
 def test_permit_expired(accounts, chain, local_account, eip4494):
@@ -432,6 +453,136 @@ def test_permit_fail_non_owner(accounts, chain, local_account, eip4494):
     assert eip4494.getApproved(1) == ZERO_ADDRESS
 
 
+def test_permitCompact(accounts, chain, local_account, eip4494):
+
+    eip4494.mint(local_account, "2.json", sender=accounts[0])
+
+    class Permit(EIP712Message):
+
+        # EIP-712 fields
+        _name_: "string" = "Vyper EIP4494"
+        _version_: "string" = "1.0.0"
+        _chainId_: "uint256" = CHAIN_ID
+        _verifyingContract_: "address" = eip4494.address
+
+        # EIP-4494 fields
+        spender: "address"
+        tokenId: "uint256"
+        nonce: "uint256"
+        deadline: "uint256"
+
+    deadline = chain.pending_timestamp + 10000
+    permit = Permit(
+        spender=accounts[2].address,
+        tokenId=2,
+        nonce=eip4494.nonces(2),
+        deadline=deadline,
+    )
+    signature = to_compact(
+        encode_rsv(local_account.sign_message(permit.signable_message))
+    )
+    r, vs = signature[:32], signature[32:]
+
+    # Signature of a different spender
+    with reverts("Invalid signature"):
+        eip4494.permitCompact(
+            accounts[3].address, 2, deadline, r, vs, sender=accounts[2]
+        )
+
+    tx = eip4494.permitCompact(
+        permit.spender, permit.tokenId, permit.deadline, r, vs, sender=accounts[2]
+    )
+
+    events = list(tx.decode_logs(eip4494.Approval))
+    assert len(events) == 1
+    assert events[0].event_arguments["owner"] == local_account
+    assert events[0].event_arguments["approved"] == accounts[2]
+    assert events[0].event_arguments["tokenId"] == 2
+
+    assert eip4494.getApproved(2) == accounts[2]
+
+
+def test_permitBatch(accounts, chain, local_account, eip4494):
+
+    for i in range(3):
+        eip4494.mint(local_account, f"{i + 2}.json", sender=accounts[0])
+
+    class Permit(EIP712Message):
+
+        # EIP-712 fields
+        _name_: "string" = "Vyper EIP4494"
+        _version_: "string" = "1.0.0"
+        _chainId_: "uint256" = CHAIN_ID
+        _verifyingContract_: "address" = eip4494.address
+
+        # EIP-4494 fields
+        spender: "address"
+        tokenId: "uint256"
+        nonce: "uint256"
+        deadline: "uint256"
+
+    deadline = chain.pending_timestamp + 10000
+    expired = chain.blocks.head.timestamp - 1
+
+    # Token 1 is owned by accounts[0], so the permit signed by local account is invalid
+    entries = [
+        (accounts[2].address, 2, deadline),
+        (accounts[2].address, 3, expired),
+        (accounts[2].address, 1, deadline),
+        (accounts[3].address, 4, deadline),
+    ]
+    signatures = [
+        encode_rsv(
+            local_account.sign_message(
+                Permit(
+                    spender=spender,
+                    tokenId=token_id,
+                    nonce=eip4494.nonces(token_id),
+                    deadline=permit_deadline,
+                ).signable_message
+            )
+        )
+        for spender, token_id, permit_deadline in entries
+    ]
+
+    # A truncated signature is skipped instead of reverting the batch
+    entries.append((accounts[2].address, 2, deadline))
+    signatures.append(signatures[0][:64])
+
+    spenders, token_ids, deadlines = (list(field) for field in zip(*entries))
+
+    assert eip4494.permitBatch.call(spenders, token_ids, deadlines, signatures) == [
+        1,
+        2,
+        4,
+    ]
+
+    tx = eip4494.permitBatch(
+        spenders, token_ids, deadlines, signatures, sender=accounts[2]
+    )
+
+    events = list(tx.decode_logs(eip4494.Approval))
+    assert len(events) == 2
+    assert events[0].event_arguments["approved"] == accounts[2]
+    assert events[0].event_arguments["tokenId"] == 2
+    assert events[1].event_arguments["approved"] == accounts[3]
+    assert events[1].event_arguments["tokenId"] == 4
+
+    events = list(tx.decode_logs(eip4494.PermitFailed))
+    assert [e.event_arguments["index"] for e in events] == [1, 2, 4]
+    assert [e.event_arguments["tokenId"] for e in events] == [3, 1, 2]
+
+    assert eip4494.getApproved(1) == ZERO_ADDRESS
+    assert eip4494.getApproved(2) == accounts[2]
+    assert eip4494.getApproved(3) == ZERO_ADDRESS
+    assert eip4494.getApproved(4) == accounts[3]
+
+    with reverts("Arguments have different lengths"):
+        eip4494.permitBatch(
+            spenders, token_ids[:-1], deadlines, signatures, sender=accounts[2]
+        )
+
+
 def test_transferFrom_by_permit_approved(accounts, local_account, eip4494, test_permit):
 
     nonce = eip4494.nonces(2)
@@ -10,13 +10,15 @@ from tests.constants import (
     INVALID_INTERFACE_ID,
     ZERO_ADDRESS,
 )
+from utils.enumeration import iter_tokens, iter_tokens_of_owner, owners_of
 
 # Tests adapted from official Vyper example
 
 
-@pytest.fixture(scope="class", autouse=True)
-def erc721(accounts, project):
-    c = project.ERC721.deploy(
+# Run the suite against `ERC721.vy` and its lazy ownership variant `ERC721A.vy`
+@pytest.fixture(scope="class", autouse=True, params=["ERC721", "ERC721A"])
+def erc721(request, accounts, project):
+    c = getattr(project, request.param).deploy(
         "Test Token",
         "TST",
         "https://www.test.com/",
@@ -237,3 +239,151 @@ def test_burn(accounts, erc721):
 
     with reverts():
         assert erc721.ownerOf(1) == ZERO_ADDRESS
+
+
+def test_mintBatch(accounts, erc721):
+
+    tx = erc721.mintBatch(
+        [accounts[1], accounts[1], accounts[2], accounts[1]],
+        ["2.json", "3.json", "4.json", "5.json"],
+        sender=accounts[0],
+    )
+
+    events = list(tx.decode_logs(erc721.Transfer))
+    assert len(events) == 4
+    for i, receiver in enumerate([accounts[1], accounts[1], accounts[2], accounts[1]]):
+        assert events[i].event_arguments["sender"] == ZERO_ADDRESS
+        assert events[i].event_arguments["receiver"] == receiver
+        assert events[i].event_arguments["tokenId"] == i + 2
+
+    assert erc721.totalSupply() == 5
+    assert erc721.balanceOf(accounts[1]) == 3
+    assert erc721.balanceOf(accounts[2]) == 1
+
+    assert erc721.ownerOf(4) == accounts[2]
+    assert erc721.tokenURI(5) == "https://www.test.com/5.json"
+
+    assert erc721.tokenOfOwnerByIndex(accounts[1], 1) == 2
+    assert erc721.tokenOfOwnerByIndex(accounts[1], 2) == 3
+    assert erc721.tokenOfOwnerByIndex(accounts[1], 3) == 5
+    assert erc721.tokenOfOwnerByIndex(accounts[2], 1) == 4
+    assert erc721.tokenByIndex(5) == 5
+
+
+def test_mintBatch_fail(accounts, erc721):
+
+    with reverts():
+        # Not minter
+        erc721.mintBatch([accounts[1]], ["2.json"], sender=accounts[1])
+
+    with reverts():
+        # Mismatched lengths
+        erc721.mintBatch([accounts[1], accounts[2]], ["2.json"], sender=accounts[0])
+
+    with reverts():
+        # Zero address
+        erc721.mintBatch(
+            [accounts[1], ZERO_ADDRESS], ["2.json", "3.json"], sender=accounts[0]
+        )
+
+    with reverts():
+        # Exceeds maximum supply
+        erc721.mintBatch([accounts[1]] * 100, ["2.json"] * 100, sender=accounts[0])
+
+    assert erc721.totalSupply() == 1
+
+
+def test_mintBatch_transfer_and_burn(accounts, erc721):
+
+    erc721.mintBatch([accounts[1]] * 5, [""] * 5, sender=accounts[0])
+
+    # Transfer and burn tokens in the middle of the batch
+    erc721.transferFrom(accounts[1], accounts[2], 3, sender=accounts[1])
+    erc721.burn(4, sender=accounts[1])
+
+    assert erc721.totalSupply() == 5
+    assert erc721.balanceOf(accounts[1]) == 3
+    assert erc721.balanceOf(accounts[2]) == 1
+
+    for token_id in [2, 5, 6]:
+        assert erc721.ownerOf(token_id) == accounts[1]
+    assert erc721.ownerOf(3) == accounts[2]
+
+    with reverts():
+        erc721.ownerOf(4)
+
+    assert erc721.tokenURI(6) == "https://www.test.com/"
+    assert {erc721.tokenOfOwnerByIndex(accounts[1], i) for i in range(1, 4)} == {
+        2,
+        5,
+        6,
+    }
+    assert erc721.tokenOfOwnerByIndex(accounts[2], 1) == 3
+
+
+def test_burn_updates_indexes(accounts, erc721):
+
+    erc721.mintBatch([accounts[1]] * 3, [""] * 3, sender=accounts[0])
+
+    # Burn a token that is neither last in the token list nor in its owner's list
+    erc721.burn(2, sender=accounts[1])
+
+    assert erc721.totalSupply() == 3
+    assert {erc721.tokenByIndex(i) for i in range(1, 4)} == {1, 3, 4}
+    assert {erc721.tokenOfOwnerByIndex(accounts[1], i) for i in range(1, 3)} == {3, 4}
+
+    with reverts():
+        erc721.tokenByIndex(4)
+
+    # Moved tokens keep a consistent index when they are transferred and burned
+    erc721.transferFrom(accounts[1], accounts[2], 4, sender=accounts[1])
+    erc721.burn(4, sender=accounts[2])
+
+    assert erc721.totalSupply() == 2
+    assert {erc721.tokenByIndex(i) for i in range(1, 3)} == {1, 3}
+    assert erc721.balanceOf(accounts[2]) == 0
+    assert erc721.tokenOfOwnerByIndex(accounts[1], 1) == 3
+
+
+def test_bulk_views(accounts, erc721):
+
+    erc721.mintBatch(
+        [accounts[1], accounts[1], accounts[2], accounts[1]],
+        [""] * 4,
+        sender=accounts[0],
+    )
+    erc721.burn(3, sender=accounts[1])
+
+    tokens = [erc721.tokenOfOwnerByIndex(accounts[1], i) for i in range(1, 3)]
+    assert erc721.tokensOfOwner(accounts[1], 1, 10) == tokens
+    assert erc721.tokensOfOwner(accounts[1], 2, 1) == tokens[1:2]
+    assert erc721.tokensOfOwner(accounts[1], 3, 10) == []
+    assert erc721.tokensOfOwner(accounts[3], 1, 10) == []
+
+    all_tokens = [erc721.tokenByIndex(i) for i in range(1, 5)]
+    assert erc721.tokensByIndexRange(1, 10) == all_tokens
+    assert erc721.tokensByIndexRange(3, 1) == all_tokens[2:3]
+    assert erc721.tokensByIndexRange(5, 10) == []
+
+    assert erc721.ownersOf([4, 1, 3, 0]) == [
+        accounts[2],
+        accounts[0],
+        ZERO_ADDRESS,
+        ZERO_ADDRESS,
+    ]
+
+    with reverts():
+        erc721.tokensOfOwner(accounts[1], 0, 10)
+
+    with reverts():
+        erc721.tokensByIndexRange(1, 1001)
+
+    # Page through with the Python helpers
+    assert list(iter_tokens_of_owner(erc721, accounts[1], page_size=2)) == tokens
+    assert list(iter_tokens(erc721, page_size=3)) == all_tokens
+    assert owners_of(erc721, [1, 2, 4, 5], page_size=3) == [
+        accounts[0],
+        accounts[1],
+        accounts[2],
+        accounts[1],
+    ]
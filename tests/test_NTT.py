@@ -9,6 +9,7 @@ from tests.constants import (
     INVALID_INTERFACE_ID,
     ZERO_ADDRESS,
 )
+from utils.enumeration import iter_tokens_of_owner
 
 
 @pytest.fixture(scope="class", autouse="True")
@@ -120,3 +121,34 @@ def test_multiple_mint_a1(accounts, ntt, mint_a1_1, mint_a1_2):
     assert ntt.tokenOfOwnerByIndex(accounts[1], 0) == 1
     assert ntt.tokenOfOwnerByIndex(accounts[1], 1) == 2
     assert ntt.tokenURI(2) == "https://ntt.com/2.json"
+
+
+def test_hasValidToken_multiple_invalidate(accounts, ntt, mint_a1_1, mint_a1_2):
+
+    ntt.invalidate(1, sender=accounts[0])
+    assert ntt.hasValidToken(accounts[1]) is True
+
+    # Invalidating a token twice does not affect the other valid token
+    ntt.invalidate(1, sender=accounts[0])
+    assert ntt.hasValidToken(accounts[1]) is True
+
+    ntt.invalidate(2, sender=accounts[0])
+    assert ntt.hasValidToken(accounts[1]) is False
+
+
+def test_bulk_views(accounts, ntt, mint_a1_1, mint_a1_2):
+
+    ntt.mint(accounts[2], "/3.json", sender=accounts[0])
+
+    assert ntt.tokensOfOwner(accounts[1], 0, 10) == [1, 2]
+    assert ntt.tokensOfOwner(accounts[1], 1, 10) == [2]
+    assert ntt.tokensOfOwner(accounts[3], 0, 10) == []
+    assert ntt.ownersOf([3, 1, 4]) == [accounts[2], accounts[1], ZERO_ADDRESS]
+
+    with reverts("Count exceeds maximum page size"):
+        ntt.tokensOfOwner(accounts[1], 0, 1001)
+
+    assert list(iter_tokens_of_owner(ntt, accounts[1], page_size=1, first_index=0)) == [
+        1,
+        2,
+    ]
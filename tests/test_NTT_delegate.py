@@ -12,72 +12,95 @@ from tests.constants import (
 )
 
 
-@pytest.fixture(scope="class", autouse="True")
-def ntt_delegate(accounts, project):
-    c = project.NTT_delegate.deploy(
-        "Non-Tradable Token", "NTT", "https://ntt.com", 100, sender=accounts[0]
+@pytest.fixture(autouse=True)
+def ntt_delegate(accounts, chain_states, project):
+    c = chain_states.restore(
+        "ntt_delegate",
+        lambda: project.NTT_delegate.deploy(
+            "Non-Tradable Token", "NTT", "https://ntt.com", 100, sender=accounts[0]
+        ),
     )
     yield c
 
 
 @pytest.fixture
-def mint_a1_1(accounts, ntt_delegate):
-    tx = ntt_delegate.mint(
-        accounts[1],
-        # "/1.json",
-        sender=accounts[0],
+def mint_a1_1(accounts, chain_states, ntt_delegate):
+    tx = chain_states.restore(
+        "mint_a1_1",
+        lambda: ntt_delegate.mint(
+            accounts[1],
+            # "/1.json",
+            sender=accounts[0],
+        ),
     )
     yield tx
 
 
 @pytest.fixture
-def mint_a1_2(accounts, ntt_delegate):
-    tx = ntt_delegate.mint(
-        accounts[1],
-        # "/2.json",
-        sender=accounts[0],
+def mint_a1_2(accounts, chain_states, ntt_delegate):
+    tx = chain_states.restore(
+        "mint_a1_2",
+        lambda: ntt_delegate.mint(
+            accounts[1],
+            # "/2.json",
+            sender=accounts[0],
+        ),
     )
     yield tx
 
 
 @pytest.fixture
-def invalidate_a1_1(accounts, ntt_delegate):
-    tx = ntt_delegate.invalidate(1, sender=accounts[0])
+def invalidate_a1_1(accounts, chain_states, ntt_delegate):
+    tx = chain_states.restore(
+        "invalidate_a1_1", lambda: ntt_delegate.invalidate(1, sender=accounts[0])
+    )
     yield tx
 
 
 @pytest.fixture
-def delegate_single(accounts, ntt_delegate):
-    tx = ntt_delegate.delegate(accounts[2], accounts[1], sender=accounts[0])
+def delegate_single(accounts, chain_states, ntt_delegate):
+    tx = chain_states.restore(
+        "delegate_single",
+        lambda: ntt_delegate.delegate(accounts[2], accounts[1], sender=accounts[0]),
+    )
     yield tx
 
 
 @pytest.fixture
-def delegate_single_mint(accounts, ntt_delegate, delegate_single):
-    tx = ntt_delegate.mint(
-        accounts[1],
-        # "/delegate_minting.json",
-        sender=accounts[2],
+def delegate_single_mint(accounts, chain_states, ntt_delegate, delegate_single):
+    tx = chain_states.restore(
+        "delegate_single_mint",
+        lambda: ntt_delegate.mint(
+            accounts[1],
+            # "/delegate_minting.json",
+            sender=accounts[2],
+        ),
     )
     yield tx
 
 
 @pytest.fixture
-def delegate_batch(accounts, ntt_delegate):
-    tx = ntt_delegate.delegateBatch(
-        [accounts[1], accounts[2], accounts[3]],
-        [accounts[2], accounts[3], accounts[4]],
-        sender=accounts[0],
+def delegate_batch(accounts, chain_states, ntt_delegate):
+    tx = chain_states.restore(
+        "delegate_batch",
+        lambda: ntt_delegate.delegateBatch(
+            [accounts[1], accounts[2], accounts[3]],
+            [accounts[2], accounts[3], accounts[4]],
+            sender=accounts[0],
+        ),
     )
     yield tx
 
 
 @pytest.fixture
-def delegate_batch_2(accounts, ntt_delegate):
-    tx = ntt_delegate.delegateBatch(
-        [accounts[1], accounts[1], ZERO_ADDRESS],
-        [accounts[2], accounts[3], accounts[4]],
-        sender=accounts[0],
+def delegate_batch_2(accounts, chain_states, ntt_delegate):
+    tx = chain_states.restore(
+        "delegate_batch_2",
+        lambda: ntt_delegate.delegateBatch(
+            [accounts[1], accounts[1], ZERO_ADDRESS],
+            [accounts[2], accounts[3], accounts[4]],
+            sender=accounts[0],
+        ),
     )
     yield tx
 
@@ -437,3 +460,18 @@ def test_invalid_mint_batch(accounts, ntt_delegate):
             # ['/1.json', '/2.json', '/3.json'],
             sender=accounts[1],
         )
+
+
+def test_hasValidToken_multiple_invalidate(
+    accounts, ntt_delegate, mint_a1_1, mint_a1_2
+):
+
+    ntt_delegate.invalidate(1, sender=accounts[0])
+    assert ntt_delegate.hasValidToken(accounts[1]) is True
+
+    # Invalidating a token twice does not affect the other valid token
+    ntt_delegate.invalidate(1, sender=accounts[0])
+    assert ntt_delegate.hasValidToken(accounts[1]) is True
+
+    ntt_delegate.invalidate(2, sender=accounts[0])
+    assert ntt_delegate.hasValidToken(accounts[1]) is False
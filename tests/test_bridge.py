@@ -0,0 +1,338 @@
+import pytest
+from ape import reverts
+
+from utils.starknet_messaging import (
+    DEPOSIT_BATCH_SELECTOR,
+    DEPOSIT_SELECTOR,
+    MESSAGE_WITHDRAW,
+    L2Bridge,
+    message_to_l1_hash,
+    message_to_l2_hash,
+)
+
+L2_CONTRACT_ADDRESS = 0x1234
+L2_USER_ADDRESS = 0x5678
+
+
+@pytest.fixture(autouse=True)
+def token(accounts, chain_states, project):
+    yield chain_states.restore(
+        "starknet_token",
+        lambda: project.ERC20.deploy(
+            "Starknet Token", "STNT", 18, 1000, sender=accounts[0]
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def core(accounts, chain_states, project, token):
+    yield chain_states.restore(
+        "starknet_core", lambda: project.MockStarknetCore.deploy(sender=accounts[0])
+    )
+
+
+@pytest.fixture(autouse=True)
+def bridge(accounts, chain_states, project, token, core):
+    def deploy():
+        c = project.Bridge.deploy(token.address, core.address, sender=accounts[0])
+        token.approve(c.address, 1000 * 10**18, sender=accounts[0])
+        return c
+
+    yield chain_states.restore("bridge", deploy)
+
+
+@pytest.fixture
+def l2(core, bridge):
+    yield L2Bridge(core, L2_CONTRACT_ADDRESS, bridge)
+
+
+@pytest.fixture
+def deposit(accounts, bridge, l2):
+    tx = bridge.deposit(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 100, sender=accounts[0])
+    l2.poll()
+    l2.update_state(sender=accounts[0])
+    return tx
+
+
+def test_deposit(accounts, token, core, bridge, l2):
+
+    tx = bridge.deposit(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 100, sender=accounts[0])
+
+    events = list(tx.decode_logs(core.LogMessageToL2))
+    assert len(events) == 1
+    assert events[0].event_arguments["from_address"] == bridge
+    assert events[0].event_arguments["to_address"] == L2_CONTRACT_ADDRESS
+    assert events[0].event_arguments["selector"] == DEPOSIT_SELECTOR
+    assert list(events[0].event_arguments["payload"]) == [L2_USER_ADDRESS, 100]
+    assert events[0].event_arguments["nonce"] == 0
+
+    message_hash = message_to_l2_hash(
+        bridge, L2_CONTRACT_ADDRESS, 0, DEPOSIT_SELECTOR, [L2_USER_ADDRESS, 100]
+    )
+    assert core.l1ToL2Messages(message_hash) == 1
+    assert core.l1ToL2MessageNonce() == 1
+
+    assert token.balanceOf(bridge) == 100
+    assert bridge.balanceOf(L2_USER_ADDRESS) == 100
+
+    # Seen on L2, and consumed on L1 with the next state update
+    assert l2.poll() == 1
+    assert l2.balances[L2_USER_ADDRESS] == 100
+
+    l2.update_state(sender=accounts[0])
+    assert core.l1ToL2Messages(message_hash) == 0
+
+
+def test_deposit_batch(accounts, token, core, bridge, l2):
+
+    users = [L2_USER_ADDRESS, L2_USER_ADDRESS + 1, L2_USER_ADDRESS]
+    amounts = [100, 200, 50]
+    balance = token.balanceOf(accounts[0])
+
+    tx = bridge.depositBatch(L2_CONTRACT_ADDRESS, users, amounts, sender=accounts[0])
+
+    # A single message for the batch
+    payload = [3, L2_USER_ADDRESS, 100, L2_USER_ADDRESS + 1, 200, L2_USER_ADDRESS, 50]
+    events = list(tx.decode_logs(core.LogMessageToL2))
+    assert len(events) == 1
+    assert events[0].event_arguments["selector"] == DEPOSIT_BATCH_SELECTOR
+    assert list(events[0].event_arguments["payload"]) == payload
+
+    message_hash = message_to_l2_hash(
+        bridge, L2_CONTRACT_ADDRESS, 0, DEPOSIT_BATCH_SELECTOR, payload
+    )
+    assert core.l1ToL2Messages(message_hash) == 1
+
+    assert token.balanceOf(accounts[0]) == balance - 350
+    assert token.balanceOf(bridge) == 350
+    assert bridge.balanceOf(L2_USER_ADDRESS) == 150
+    assert bridge.balanceOf(L2_USER_ADDRESS + 1) == 200
+
+    assert l2.poll() == 1
+    assert l2.balances[L2_USER_ADDRESS] == 150
+    assert l2.balances[L2_USER_ADDRESS + 1] == 200
+
+    l2.update_state(sender=accounts[0])
+    assert core.l1ToL2Messages(message_hash) == 0
+
+
+def test_illegal_deposit_batch(accounts, token, bridge):
+
+    with reverts("Invalid batch"):
+        bridge.depositBatch(L2_CONTRACT_ADDRESS, [], [], sender=accounts[0])
+
+    with reverts("Invalid batch"):
+        bridge.depositBatch(
+            L2_CONTRACT_ADDRESS, [L2_USER_ADDRESS], [100, 200], sender=accounts[0]
+        )
+
+    with reverts("Invalid amount"):
+        bridge.depositBatch(
+            L2_CONTRACT_ADDRESS,
+            [L2_USER_ADDRESS, L2_USER_ADDRESS + 1],
+            [100, 2**64],
+            sender=accounts[0],
+        )
+
+    # Enforced by the allowance in the token
+    token.approve(bridge.address, 299, sender=accounts[0])
+    with reverts():
+        bridge.depositBatch(
+            L2_CONTRACT_ADDRESS,
+            [L2_USER_ADDRESS, L2_USER_ADDRESS + 1],
+            [100, 200],
+            sender=accounts[0],
+        )
+
+
+def test_withdraw(accounts, token, core, bridge, l2, deposit):
+
+    balance = token.balanceOf(accounts[0])
+
+    message_hash = l2.withdraw(L2_USER_ADDRESS, accounts[0].address, 40)
+    assert l2.balances[L2_USER_ADDRESS] == 60
+
+    l2.update_state(sender=accounts[0])
+    assert core.l2ToL1Messages(message_hash) == 1
+
+    tx = bridge.withdraw(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 40, sender=accounts[0])
+
+    events = list(tx.decode_logs(core.ConsumedMessageToL1))
+    assert len(events) == 1
+    assert events[0].event_arguments["from_address"] == L2_CONTRACT_ADDRESS
+    assert events[0].event_arguments["to_address"] == bridge
+    assert list(events[0].event_arguments["payload"]) == [
+        MESSAGE_WITHDRAW,
+        L2_USER_ADDRESS,
+        int(accounts[0].address, 16),
+        40,
+    ]
+
+    assert core.l2ToL1Messages(message_hash) == 0
+    assert token.balanceOf(accounts[0]) == balance + 40
+    assert bridge.balanceOf(L2_USER_ADDRESS) == 60
+
+
+def test_illegal_withdraw_before_state_update(accounts, bridge, l2, deposit):
+
+    l2.withdraw(L2_USER_ADDRESS, accounts[0].address, 40)
+
+    with reverts("INVALID_MESSAGE_TO_CONSUME"):
+        bridge.withdraw(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 40, sender=accounts[0])
+
+
+def test_illegal_withdraw_twice(accounts, bridge, l2, deposit):
+
+    l2.withdraw(L2_USER_ADDRESS, accounts[0].address, 40)
+    l2.update_state(sender=accounts[0])
+    bridge.withdraw(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 40, sender=accounts[0])
+
+    with reverts("INVALID_MESSAGE_TO_CONSUME"):
+        bridge.withdraw(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 40, sender=accounts[0])
+
+
+def test_illegal_withdraw_other_recipient(accounts, bridge, l2, deposit):
+
+    # The message releases the tokens to the L1 address given on L2 only
+    l2.withdraw(L2_USER_ADDRESS, accounts[0].address, 40)
+    l2.update_state(sender=accounts[0])
+
+    with reverts("INVALID_MESSAGE_TO_CONSUME"):
+        bridge.withdraw(L2_CONTRACT_ADDRESS, L2_USER_ADDRESS, 40, sender=accounts[1])
+
+
+def test_withdraw_batch(accounts, token, core, bridge, l2):
+
+    users = [L2_USER_ADDRESS, L2_USER_ADDRESS + 1, L2_USER_ADDRESS + 2]
+    bridge.depositBatch(L2_CONTRACT_ADDRESS, users, [100, 200, 300], sender=accounts[0])
+    l2.poll()
+
+    recipients = [accounts[1], accounts[2], accounts[1]]
+    amounts = [40, 200, 300]
+    for user, recipient, amount in zip(users, recipients, amounts):
+        l2.withdraw(user, recipient.address, amount)
+    l2.update_state(sender=accounts[0])
+
+    # Made by any account for the recipients named on L2
+    tx = bridge.withdrawBatch(
+        L2_CONTRACT_ADDRESS, users, recipients, amounts, sender=accounts[3]
+    )
+
+    assert len(list(tx.decode_logs(core.ConsumedMessageToL1))) == 3
+    assert len(list(tx.decode_logs(bridge.WithdrawalFailed))) == 0
+
+    assert token.balanceOf(accounts[1]) == 340
+    assert token.balanceOf(accounts[2]) == 200
+    assert token.balanceOf(bridge) == 60
+    assert [bridge.balanceOf(user) for user in users] == [60, 0, 0]
+
+
+def test_withdraw_batch_skips_failures(accounts, token, core, bridge, l2):
+
+    users = [L2_USER_ADDRESS, L2_USER_ADDRESS + 1, L2_USER_ADDRESS + 2]
+    bridge.depositBatch(L2_CONTRACT_ADDRESS, users, [100, 200, 300], sender=accounts[0])
+    l2.poll()
+
+    l2.withdraw(users[0], accounts[1].address, 100)
+    l2.withdraw(users[2], accounts[1].address, 300)
+    l2.update_state(sender=accounts[0])
+
+    # The second withdrawal was not sent from L2, and the last is above the balance
+    # left by the third
+    tx = bridge.withdrawBatch(
+        L2_CONTRACT_ADDRESS,
+        [users[0], users[1], users[2], users[2]],
+        [accounts[1], accounts[1], accounts[1], accounts[1]],
+        [100, 200, 300, 300],
+        sender=accounts[1],
+    )
+
+    events = list(tx.decode_logs(bridge.WithdrawalFailed))
+    assert [e.event_arguments["index"] for e in events] == [1, 3]
+    assert [e.event_arguments["user_l2_address"] for e in events] == [
+        users[1],
+        users[2],
+    ]
+
+    assert token.balanceOf(accounts[1]) == 400
+    assert [bridge.balanceOf(user) for user in users] == [0, 200, 0]
+
+    # Skipped withdrawals can be made once their messages are sent
+    l2.withdraw(users[1], accounts[1].address, 200)
+    l2.update_state(sender=accounts[0])
+    bridge.withdraw(L2_CONTRACT_ADDRESS, users[1], 200, sender=accounts[1])
+
+    assert token.balanceOf(accounts[1]) == 600
+
+
+def test_illegal_withdraw_batch(accounts, bridge):
+
+    with reverts("Invalid batch"):
+        bridge.withdrawBatch(
+            L2_CONTRACT_ADDRESS,
+            [L2_USER_ADDRESS],
+            [accounts[0], accounts[1]],
+            [100],
+            sender=accounts[0],
+        )
+
+    with reverts("Invalid batch"):
+        bridge.withdrawBatch(
+            L2_CONTRACT_ADDRESS,
+            [L2_USER_ADDRESS],
+            [accounts[0]],
+            [100, 200],
+            sender=accounts[0],
+        )
+
+
+def test_illegal_l2_withdraw_above_balance(accounts, l2, deposit):
+
+    with pytest.raises(ValueError, match="Amount exceeds balance"):
+        l2.withdraw(L2_USER_ADDRESS, accounts[0].address, 101)
+
+    assert l2.balances[L2_USER_ADDRESS] == 100
+
+
+def test_deposit_from_unknown_contract(accounts, core, l2):
+
+    # Rejected by the L1 handler, so the message is never consumed
+    tx = core.sendMessageToL2(
+        L2_CONTRACT_ADDRESS,
+        DEPOSIT_SELECTOR,
+        [L2_USER_ADDRESS, 100],
+        sender=accounts[1],
+    )
+    events = list(tx.decode_logs(core.LogMessageToL2))
+    assert events[0].event_arguments["from_address"] == accounts[1]
+
+    assert l2.poll() == 0
+    assert l2.balances[L2_USER_ADDRESS] == 0
+
+    l2.update_state(sender=accounts[0])
+    message_hash = message_to_l2_hash(
+        accounts[1], L2_CONTRACT_ADDRESS, 0, DEPOSIT_SELECTOR, [L2_USER_ADDRESS, 100]
+    )
+    assert core.l1ToL2Messages(message_hash) == 1
+
+
+def test_message_to_l1_hash(accounts, core, l2, deposit):
+
+    # Hashes of messages to L1 computed off-chain match those consumed on-chain
+    payload = [MESSAGE_WITHDRAW, L2_USER_ADDRESS, int(accounts[0].address, 16), 40]
+    message_hash = message_to_l1_hash(L2_CONTRACT_ADDRESS, accounts[0], payload)
+    core.mockUpdateState([], [message_hash], sender=accounts[0])
+
+    tx = core.consumeMessageFromL2(L2_CONTRACT_ADDRESS, payload, sender=accounts[0])
+
+    assert core.l2ToL1Messages(message_hash) == 0
+    assert len(list(tx.decode_logs(core.ConsumedMessageToL1))) == 1
+
+
+def test_illegal_update_state(accounts, core):
+
+    with reverts("Caller is not the operator"):
+        core.mockUpdateState([], [], sender=accounts[1])
+
+    with reverts("INVALID_MESSAGE_TO_CONSUME"):
+        core.mockUpdateState([b"\x01" * 32], [], sender=accounts[0])
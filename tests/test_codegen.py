@@ -0,0 +1,23 @@
+import pytest
+
+from codegen import render, stale_paths
+
+
+def test_contracts_up_to_date():
+
+    # Run `python -m codegen` to re-render the contracts
+    assert stale_paths() == []
+
+
+def test_render_hooks():
+
+    template = "def f():\n    {{ on_transfer }}\n    return{{ interface_ids }}\n"
+
+    assert render({}, template) == "def f():\n    return\n"
+    assert (
+        render({"on_transfer": "x = 1\n\ny = 2\n", "interface_ids": " True"}, template)
+        == "def f():\n    x = 1\n\n    y = 2\n    return True\n"
+    )
+
+    with pytest.raises(ValueError):
+        render({"unknown": ""}, template)
@@ -0,0 +1,40 @@
+from utils.compile_cache import CachedVyperCompiler, CompileCache, cache_key
+
+
+def test_cache_key():
+    source = "# @version 0.3.7"
+    settings = {"evm_version": None}
+    key = cache_key(source, "A.vy", "0.3.7", settings)
+
+    assert key == cache_key(source, "A.vy", "0.3.7", settings)
+    assert key != cache_key(source + "\n", "A.vy", "0.3.7", settings)
+    assert key != cache_key(source, "B.vy", "0.3.7", settings)
+    assert key != cache_key(source, "A.vy", "0.3.8", settings)
+    assert key != cache_key(source, "A.vy", "0.3.7", {"evm_version": "paris"})
+
+
+def test_get_put(tmp_path, project):
+    cache = CompileCache(tmp_path)
+    contract_type = project.Multicall.contract_type
+
+    assert cache.get("key") is None
+
+    cache.put("key", contract_type)
+    assert cache.get("key") == contract_type
+
+
+def test_compile(monkeypatch, tmp_path, project):
+    monkeypatch.setenv("VYPER_CONTRACTS_COMPILE_CACHE", str(tmp_path))
+    path = project.contracts_folder / "Multicall.vy"
+    compiler = CachedVyperCompiler()
+
+    compiled = compiler.compile([path])
+    assert [c.name for c in compiled] == ["Multicall"]
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Loaded from the cache, without compiling
+    def fail(*args, **kwargs):
+        raise AssertionError("compiled")
+
+    monkeypatch.setattr("ape_vyper.compiler.vvm.compile_source", fail)
+    assert compiler.compile([path]) == compiled
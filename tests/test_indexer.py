@@ -0,0 +1,161 @@
+import pytest
+from eth_utils import to_wei
+
+from tests.constants import ZERO_ADDRESS
+from utils.indexer import EventIndexer
+
+
+@pytest.fixture
+def erc721(accounts, project):
+    c = project.ERC721.deploy(
+        "Vyper ERC721",
+        "VERC721",
+        "https://www.test.com/",
+        100,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    yield c
+
+
+@pytest.fixture
+def ntt(accounts, project):
+    c = project.NTT.deploy(
+        "Non-Tradable Token", "NTT", "https://ntt.com", 100, sender=accounts[0]
+    )
+    yield c
+
+
+@pytest.fixture
+def auction(accounts, chain, project):
+    c = project.vickrey_auction.deploy(
+        to_wei(1, "ether"), chain.pending_timestamp + 100, sender=accounts[0]
+    )
+    yield c
+
+
+@pytest.fixture
+def activity(accounts, chain, erc721, ntt, auction):
+    """
+    Emit events of every kind that is indexed, one transaction per block.
+    """
+    start_block = chain.blocks.height
+    erc721.mintBatch(
+        [accounts[1], accounts[1], accounts[2], accounts[3]],
+        ["1.json", "2.json", "3.json", "4.json"],
+        sender=accounts[0],
+    )
+    erc721.approve(accounts[4], 1, sender=accounts[1])
+    erc721.approve(accounts[4], 2, sender=accounts[1])
+    erc721.setApprovalForAll(accounts[5], True, sender=accounts[2])
+    erc721.setApprovalForAll(accounts[6], True, sender=accounts[2])
+    erc721.setApprovalForAll(accounts[6], False, sender=accounts[2])
+    erc721.transferFrom(accounts[1], accounts[3], 1, sender=accounts[4])
+    erc721.burn(4, sender=accounts[3])
+
+    ntt.mint(accounts[1], "/1.json", sender=accounts[0])
+    ntt.mint(accounts[2], "/2.json", sender=accounts[0])
+    ntt.invalidate(1, sender=accounts[0])
+
+    auction.bid(sender=accounts[1], value=to_wei(1.5, "ether"))
+    auction.bid(sender=accounts[1], value=to_wei(0.5, "ether"))
+    auction.bid(sender=accounts[2], value=to_wei(3, "ether"))
+    chain.pending_timestamp += 200
+    auction.close(sender=accounts[0])
+    auction.refund(sender=accounts[1])
+
+    yield start_block
+
+
+def assert_indexed(indexer, accounts, erc721, ntt, auction):
+    for token_id in range(1, 4):
+        assert indexer.owner_of(erc721, token_id) == erc721.ownerOf(token_id)
+        assert indexer.approved_of(erc721, token_id) == (
+            erc721.getApproved(token_id) if token_id == 2 else None
+        )
+
+    assert indexer.owner_of(erc721, 4) is None
+    assert indexer.tokens_of(erc721, accounts[3]) == [1]
+    assert indexer.is_operator(erc721, accounts[2], accounts[5])
+    assert not indexer.is_operator(erc721, accounts[2], accounts[6])
+
+    assert indexer.owner_of(ntt, 1) == accounts[1]
+    assert indexer.owner_of(ntt, 2) == accounts[2]
+
+    assert indexer.bid_of(auction, accounts[1]) == (0, to_wei(2, "ether"))
+    assert indexer.bid_of(auction, accounts[2]) == (
+        auction.bidder_to_balance(accounts[2]),
+        0,
+    )
+    assert indexer.bid_of(auction, accounts[3]) is None
+
+
+def test_index(accounts, chain, erc721, ntt, auction, activity, tmp_path):
+    indexer = EventIndexer(tmp_path / "events.db", [erc721, ntt, auction], batch_size=3)
+    count, _ = indexer.run()
+
+    # 4 mints, 2 approvals, 3 approvals for all, a transfer and a burn, 2 mints and an
+    # invalidation, 3 bids and a refund
+    assert count == 18
+    assert_indexed(indexer, accounts, erc721, ntt, auction)
+
+    events = indexer.db.execute(
+        "SELECT event, args FROM events ORDER BY block_number, log_index"
+    ).fetchall()
+    assert [event for event, _ in events].count("Transfer") == 6
+    assert events[-1][0] == "Refund"
+
+    # Nothing is indexed twice
+    assert indexer.run()[0] == 0
+    assert indexer.db.execute("SELECT COUNT(*) FROM events").fetchone()[0] == count
+
+
+def test_resume(accounts, chain, erc721, ntt, auction, activity, tmp_path):
+    db_path = tmp_path / "events.db"
+    contracts = [erc721, ntt, auction]
+    midpoint = (activity + chain.blocks.height) // 2
+
+    indexer = EventIndexer(db_path, contracts, batch_size=2)
+    first, _ = indexer.run(stop_block=midpoint)
+    indexer.close()
+
+    # A crash while applying a batch rolls the whole batch back
+    indexer = EventIndexer(db_path, contracts, batch_size=2)
+
+    def crash(address, block_number, args):
+        raise RuntimeError("crash")
+
+    indexer.handlers["Bid"] = crash
+    with pytest.raises(RuntimeError):
+        indexer.run()
+
+    committed = dict(indexer.db.execute("SELECT * FROM checkpoints"))
+    assert indexer.db.execute(
+        "SELECT COUNT(*) FROM events WHERE block_number > ?", (max(committed.values()),)
+    ).fetchone() == (0,)
+    indexer.close()
+
+    indexer = EventIndexer(db_path, contracts, batch_size=2)
+    indexer.run()
+    assert_indexed(indexer, accounts, erc721, ntt, auction)
+    assert indexer.db.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 18
+    assert 0 < first < 18
+
+
+def test_erc20_events(accounts, project, erc721, tmp_path):
+    erc20 = project.ERC20_mintable.deploy(
+        "Mineable Token", "MNT", 18, 0, accounts[0], sender=accounts[0]
+    )
+    erc20.mint(accounts[1], 100, sender=accounts[0])
+    erc721.mint(accounts[1], "1.json", sender=accounts[0])
+
+    indexer = EventIndexer(tmp_path / "events.db", [erc20, erc721])
+    count, _ = indexer.run()
+
+    # The deployment and the mint of the ERC20, and the mint of the ERC721
+    assert count == 3
+    assert indexer.owner_of(erc721, 1) == accounts[1]
+    assert indexer.db.execute(
+        "SELECT COUNT(*) FROM ownership WHERE owner = ?", (ZERO_ADDRESS,)
+    ).fetchone() == (0,)
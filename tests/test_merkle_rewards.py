@@ -0,0 +1,131 @@
+import pytest
+from ape import reverts
+
+from tests.constants import ZERO_ADDRESS
+from utils.merkle_rewards import MerkleTree, RewardLedger, iter_transfers, write_claims
+
+
+@pytest.fixture
+def timer(accounts, project):
+    c = project.timer.deploy(
+        "Time Token",
+        "TT",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    yield c
+
+
+@pytest.fixture
+def distributor(accounts, project):
+    yield project.reward_distributor.deploy(sender=accounts[0])
+
+
+@pytest.fixture
+def erc20(accounts, project, distributor):
+    c = project.ERC20_mintable.deploy(
+        "Mineable Token", "MNT", 18, 0, distributor.address, sender=accounts[0]
+    )
+    distributor.set_token_address(c.address, sender=accounts[0])
+    yield c
+
+
+def build_tree(timer, chain, start_block=0):
+    ledger = RewardLedger()
+    for timestamp, sender, receiver in iter_transfers(
+        timer, start_block, chain.blocks.height, chunk_size=3
+    ):
+        ledger.apply(timestamp, sender, receiver)
+
+    epoch_end = chain.blocks.head.timestamp
+    return MerkleTree(sorted(ledger.amounts(epoch_end)))
+
+
+def test_ledger_matches_timer(accounts, chain, timer):
+    start_block = chain.blocks.height
+    timer.mintBatch(
+        [accounts[1], accounts[1], accounts[2]],
+        ["1.json", "2.json", "3.json"],
+        sender=accounts[0],
+    )
+    chain.pending_timestamp += 100
+    timer.transferFrom(accounts[1], accounts[3], 1, sender=accounts[1])
+    chain.pending_timestamp += 100
+    timer.burn(3, sender=accounts[2])
+    chain.pending_timestamp += 100
+    chain.mine()
+
+    tree = build_tree(timer, chain, start_block)
+    amounts = dict(tree.claims)
+    for account in accounts[1:4]:
+        assert amounts[account.address] == timer.pending_rewards(account)
+
+
+def test_claim(accounts, chain, timer, distributor, erc20, tmp_path):
+    start_block = chain.blocks.height
+    timer.mintBatch(
+        [accounts[i] for i in range(1, 6)],
+        [f"{i}.json" for i in range(1, 6)],
+        sender=accounts[0],
+    )
+    chain.pending_timestamp += 100
+    chain.mine()
+
+    tree = build_tree(timer, chain, start_block)
+    assert len(tree.levels) == 3
+    distributor.set_merkle_root(tree.root, sender=accounts[0])
+
+    holder = accounts[2].address
+    amount = dict(tree.claims)[holder]
+    proof = tree.proof(holder)
+
+    with reverts("Invalid proof"):
+        distributor.claim(holder, amount + 1, proof, sender=accounts[9])
+
+    # Anyone can claim on behalf of a holder
+    distributor.claim(holder, amount, proof, sender=accounts[9])
+    assert erc20.balanceOf(holder) == amount
+
+    with reverts("Nothing to claim"):
+        distributor.claim(holder, amount, proof, sender=accounts[9])
+
+    # Amounts are cumulative, so the next epoch pays the difference
+    chain.pending_timestamp += 100
+    timer.transferFrom(holder, accounts[6], 2, sender=accounts[2])
+    chain.mine()
+
+    tree = build_tree(timer, chain, start_block)
+    distributor.set_merkle_root(tree.root, sender=accounts[0])
+    assert distributor.epoch() == 2
+
+    path = tmp_path / "claims.jsonl"
+    assert write_claims(path, tree, chunk_size=2) == 6
+
+    new_amount = dict(tree.claims)[holder]
+    distributor.claim(holder, new_amount, tree.proof(holder), sender=accounts[9])
+    assert erc20.balanceOf(holder) == new_amount
+
+    for holder, amount, proof in tree.iter_proofs(chunk_size=4):
+        if holder != accounts[2].address:
+            distributor.claim(holder, amount, proof, sender=accounts[9])
+            assert erc20.balanceOf(holder) == amount
+
+
+def test_single_claim(accounts, chain, timer, distributor, erc20):
+    tree = MerkleTree([(accounts[1].address, 10**18)])
+    assert tree.proof(accounts[1].address) == []
+
+    distributor.set_merkle_root(tree.root, sender=accounts[0])
+    distributor.claim(accounts[1], 10**18, [], sender=accounts[1])
+    assert erc20.balanceOf(accounts[1]) == 10**18
+
+
+def test_only_owner(accounts, distributor):
+    with reverts("Caller is not owner"):
+        distributor.set_merkle_root(bytes(32), sender=accounts[1])
+
+    with reverts("Caller is not owner"):
+        distributor.set_token_address(ZERO_ADDRESS, sender=accounts[1])
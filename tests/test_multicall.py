@@ -0,0 +1,83 @@
+import pytest
+
+from tests.constants import ZERO_ADDRESS
+from utils.multicall import Multicall, MulticallError
+
+
+@pytest.fixture(scope="module")
+def erc721(accounts, project):
+    c = project.ERC721.deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        100,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    c.mintBatch(
+        [accounts[0], accounts[1], accounts[1]],
+        ["1.json", "2.json", "3.json"],
+        sender=accounts[0],
+    )
+    c.approve(accounts[2], 1, sender=accounts[0])
+    yield c
+
+
+@pytest.fixture(scope="module")
+def ntt(accounts, project):
+    c = project.NTT.deploy(
+        "Non-Tradable Token", "NTT", "https://ntt.com", 100, sender=accounts[0]
+    )
+    c.mint(accounts[1], "/1.json", sender=accounts[0])
+    yield c
+
+
+@pytest.fixture(scope="module")
+def multicall(accounts, project):
+    yield project.Multicall.deploy(sender=accounts[0])
+
+
+def test_aggregate(accounts, chain, erc721, ntt, multicall):
+
+    calls = Multicall(multicall)
+    calls.add(erc721, "balanceOf", accounts[1])
+    calls.add(erc721, "ownerOf", 3)
+    calls.add(erc721, "getApproved", 1)
+    calls.add(erc721, "tokenURI", 2)
+    calls.add(ntt, "isValid", 1)
+    calls.add(ntt, "issuerOf", 1)
+
+    assert len(calls) == 6
+    assert calls() == [
+        2,
+        accounts[1],
+        accounts[2],
+        "https://www.test.com/2.json",
+        True,
+        accounts[0],
+    ]
+    assert calls.block_number == chain.blocks.head.number
+
+
+def test_aggregate_batches(accounts, erc721, multicall):
+
+    calls = Multicall(multicall, batch_size=2)
+    for token_id in [1, 2, 3]:
+        calls.add(erc721, "ownerOf", token_id)
+
+    assert calls() == [accounts[0], accounts[1], accounts[1]]
+
+
+def test_aggregate_failure(accounts, erc721, multicall):
+
+    calls = Multicall(multicall)
+    calls.add(erc721, "ownerOf", 1)
+    # Reverts for a token that does not exist
+    calls.add(erc721, "ownerOf", 4)
+    calls.add(erc721, "getApproved", 2)
+
+    with pytest.raises(MulticallError):
+        calls()
+
+    assert calls(allow_failure=True) == [accounts[0], None, ZERO_ADDRESS]
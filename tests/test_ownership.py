@@ -0,0 +1,155 @@
+import random
+
+import pytest
+
+from tests.constants import ZERO_ADDRESS
+from utils.ownership import OwnershipSnapshot, ReorgTooDeep
+
+
+@pytest.fixture(params=["ERC721", "timed_ERC721", "timer"])
+def erc721(request, accounts, project):
+    c = getattr(project, request.param).deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    yield c
+
+
+def owners(erc721, token_ids):
+    return dict(zip(token_ids, erc721.ownersOf(list(token_ids))))
+
+
+def test_sync(accounts, erc721):
+    erc721.mintBatch(
+        [accounts[1], accounts[1], accounts[2]],
+        ["1.json", "2.json", "3.json"],
+        sender=accounts[0],
+    )
+    expected = {}
+    expected[erc721.chain_manager.blocks.height] = owners(erc721, range(1, 4))
+
+    erc721.transferFrom(accounts[1], accounts[3], 1, sender=accounts[1])
+    expected[erc721.chain_manager.blocks.height] = owners(erc721, range(1, 4))
+
+    erc721.burn(3, sender=accounts[2])
+    erc721.mint(accounts[2], "4.json", sender=accounts[0])
+    expected[erc721.chain_manager.blocks.height] = owners(erc721, range(1, 5))
+
+    snapshot = OwnershipSnapshot(snapshot_interval=2)
+    assert snapshot.sync(erc721, chunk_size=2) == 6
+
+    for block_number, block_owners in expected.items():
+        for token_id, owner in block_owners.items():
+            assert snapshot.owner_of(token_id, block_number) == owner
+
+    block_number = min(expected)
+    assert snapshot.balances_at(block_number) == {
+        accounts[1].address: 2,
+        accounts[2].address: 1,
+    }
+    assert snapshot.balances_at(snapshot.block_number) == {
+        accounts[1].address: 1,
+        accounts[2].address: 1,
+        accounts[3].address: 1,
+    }
+
+    # Nothing is applied twice
+    assert snapshot.sync(erc721) == 0
+
+
+def test_reorg(accounts, chain, erc721):
+    erc721.mintBatch(
+        [accounts[1], accounts[1], accounts[2]],
+        ["1.json", "2.json", "3.json"],
+        sender=accounts[0],
+    )
+    snapshot = OwnershipSnapshot()
+    snapshot.sync(erc721)
+    fork = snapshot.block_number
+
+    snapshot_id = chain.snapshot()
+    erc721.transferFrom(accounts[1], accounts[3], 1, sender=accounts[1])
+    erc721.transferFrom(accounts[2], accounts[3], 3, sender=accounts[2])
+    snapshot.sync(erc721)
+    assert snapshot.balances_at(snapshot.block_number) == {
+        accounts[1].address: 1,
+        accounts[3].address: 2,
+    }
+
+    # The blocks after the fork are replaced by different ones
+    chain.restore(snapshot_id)
+    erc721.transferFrom(accounts[1], accounts[4], 2, sender=accounts[1])
+    assert snapshot.sync(erc721) == 1
+
+    assert snapshot.block_number == chain.blocks.height
+    assert snapshot.owner_of(1, snapshot.block_number) == accounts[1]
+    assert snapshot.owner_of(2, snapshot.block_number) == accounts[4]
+    assert snapshot.owner_of(3, snapshot.block_number) == accounts[2]
+    assert snapshot.owner_of(2, fork) == accounts[1]
+
+
+def test_reorg_too_deep(accounts, chain, erc721):
+    snapshot_id = chain.snapshot()
+    erc721.mint(accounts[1], "1.json", sender=accounts[0])
+    chain.mine(3)
+
+    snapshot = OwnershipSnapshot(max_reorg_depth=1)
+    snapshot.sync(erc721)
+
+    chain.restore(snapshot_id)
+    chain.mine(5)
+    with pytest.raises(ReorgTooDeep):
+        snapshot.sync(erc721)
+
+
+def test_rollback_matches_replay():
+    """
+    Ownership at every block, after rollbacks and reapplies, matches a naive replay.
+    """
+    rng = random.Random(0)
+    holders = [f"0x{i:040x}" for i in range(1, 9)]
+    blocks = []
+    owners = {}
+    for block_number in range(100):
+        transfers = []
+        for _ in range(rng.randrange(4)):
+            token_id = rng.randrange(1, 30)
+            receiver = rng.choice(holders + [ZERO_ADDRESS])
+            transfers.append((owners.get(token_id, ZERO_ADDRESS), receiver, token_id))
+            owners[token_id] = receiver
+
+        blocks.append((block_number, bytes([block_number]) * 32, transfers))
+
+    def replay(until):
+        state = {}
+        for block_number, _, transfers in blocks[: until + 1]:
+            for _, receiver, token_id in transfers:
+                state[token_id] = receiver
+
+        return state
+
+    snapshot = OwnershipSnapshot(snapshot_interval=7)
+    for block in blocks[:60]:
+        snapshot.apply_block(*block)
+
+    snapshot.rollback(40)
+    for block in blocks[41:]:
+        snapshot.apply_block(*block)
+
+    for block_number in range(0, 100, 3):
+        state = replay(block_number)
+        for token_id in range(30):
+            expected = state.get(token_id, ZERO_ADDRESS)
+            assert snapshot.owner_of(token_id, block_number) == expected
+
+        balances = {}
+        for owner in state.values():
+            if owner != ZERO_ADDRESS:
+                balances[owner] = balances.get(owner, 0) + 1
+
+        assert snapshot.balances_at(block_number) == balances
@@ -0,0 +1,169 @@
+import json
+
+import pytest
+
+from utils.signing import read_rows, sign_file, to_compact
+
+
+@pytest.fixture
+def eip4494(accounts, project):
+    c = project.EIP4494.deploy(
+        "Test Token",
+        "TST",
+        "https://www.test.com/",
+        100,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    c.mintBatch([accounts[1]] * 5, ["1.json"] * 5, sender=accounts[0])
+    yield c
+
+
+@pytest.fixture
+def plain_eip712(accounts, project):
+    yield project.plain_EIP712.deploy(sender=accounts[0])
+
+
+def test_sign_permits(accounts, chain, eip4494, tmp_path):
+    deadline = chain.pending_timestamp + 10000
+    input_path = tmp_path / "permits.csv"
+    input_path.write_text(
+        "spender,tokenId,nonce,deadline\n"
+        + "".join(
+            f"{accounts[2].address},{token_id},0,{deadline}\n"
+            for token_id in range(1, 6)
+        )
+    )
+    output_path = tmp_path / "signatures.csv"
+
+    count, _ = sign_file(
+        input_path,
+        output_path,
+        accounts[1].private_key,
+        "EIP4494",
+        chain.chain_id,
+        eip4494.address,
+        processes=2,
+        chunk_size=2,
+    )
+    assert count == 5
+
+    rows = list(read_rows(output_path))
+    assert [int(row["tokenId"]) for row in rows] == [1, 2, 3, 4, 5]
+
+    tx = eip4494.permitBatch(
+        [row["spender"] for row in rows],
+        [int(row["tokenId"]) for row in rows],
+        [int(row["deadline"]) for row in rows],
+        [bytes.fromhex(row["signature"][2:]) for row in rows],
+        sender=accounts[2],
+    )
+    assert not list(tx.decode_logs(eip4494.PermitFailed))
+
+    for token_id in range(1, 6):
+        assert eip4494.getApproved(token_id) == accounts[2]
+
+
+def test_sign_messages(accounts, chain, plain_eip712, tmp_path):
+    input_path = tmp_path / "messages.jsonl"
+    input_path.write_text("".join(json.dumps({"sms": sms}) + "\n" for sms in (1, 12)))
+    output_path = tmp_path / "signatures.jsonl"
+
+    sign_file(
+        input_path,
+        output_path,
+        accounts[1].private_key,
+        "plain_EIP712",
+        chain.chain_id,
+        plain_eip712.address,
+    )
+
+    for row in read_rows(output_path):
+        signature = bytes.fromhex(row["signature"][2:])
+        tx = plain_eip712.message(row["sms"], signature, sender=accounts[1])
+        assert tx.events[0].sms == row["sms"]
+
+
+def test_sign_compact(accounts, chain, eip4494, plain_eip712, tmp_path):
+    deadline = chain.pending_timestamp + 10000
+    input_path = tmp_path / "permits.jsonl"
+    input_path.write_text(
+        json.dumps(
+            {
+                "spender": accounts[3].address,
+                "tokenId": 1,
+                "nonce": eip4494.nonces(1),
+                "deadline": deadline,
+            }
+        )
+        + "\n"
+    )
+    output_path = tmp_path / "signatures.jsonl"
+
+    sign_file(
+        input_path,
+        output_path,
+        accounts[1].private_key,
+        "EIP4494",
+        chain.chain_id,
+        eip4494.address,
+        compact=True,
+    )
+
+    (row,) = read_rows(output_path)
+    signature = bytes.fromhex(row["signature"][2:])
+    assert len(signature) == 64
+
+    eip4494.permitCompact(
+        row["spender"],
+        row["tokenId"],
+        row["deadline"],
+        signature[:32],
+        signature[32:],
+        sender=accounts[3],
+    )
+    assert eip4494.getApproved(1) == accounts[3]
+
+    input_path = tmp_path / "messages.csv"
+    input_path.write_text("sms\n12\n")
+    output_path = tmp_path / "signatures.csv"
+
+    sign_file(
+        input_path,
+        output_path,
+        accounts[1].private_key,
+        "plain_EIP712",
+        chain.chain_id,
+        plain_eip712.address,
+        compact=True,
+    )
+
+    (row,) = read_rows(output_path)
+    signature = bytes.fromhex(row["signature"][2:])
+    plain_eip712.messageCompact(
+        int(row["sms"]), signature[:32], signature[32:], sender=accounts[1]
+    )
+
+
+def test_to_compact():
+    # Test vectors from EIP-2098
+    signature = bytes.fromhex(
+        "68a020a209d3d56c46f38cc50a33f704f4a9a10a59377f8dd762ac66910e9b90"
+        "7e865ad05c4035ab5792787d4a0297a43617ae897930a6fe4d822b8faea52064"
+        "1b"
+    )
+    assert to_compact(signature) == bytes.fromhex(
+        "68a020a209d3d56c46f38cc50a33f704f4a9a10a59377f8dd762ac66910e9b90"
+        "7e865ad05c4035ab5792787d4a0297a43617ae897930a6fe4d822b8faea52064"
+    )
+
+    signature = bytes.fromhex(
+        "9328da16089fcba9bececa81663203989f2df5fe1faa6291a45381c81bd17f76"
+        "139c6d6b623b42da56557e5e734a43dc83345ddfadec52cbe24d0cc64f550793"
+        "1c"
+    )
+    assert to_compact(signature) == bytes.fromhex(
+        "9328da16089fcba9bececa81663203989f2df5fe1faa6291a45381c81bd17f76"
+        "939c6d6b623b42da56557e5e734a43dc83345ddfadec52cbe24d0cc64f550793"
+    )
@@ -47,7 +47,8 @@ def test_invalid_mint(accounts, erc721, tcs):
 
 def test_valid_mint(accounts, chain, erc721, tcs):
 
-    chain.mine(1001)
+    # A single block past the minimum holding time
+    chain.pending_timestamp += 1001
 
     tx = tcs.mint(accounts[0], "/1.json", sender=accounts[0])
 
@@ -61,3 +62,23 @@ def test_valid_mint(accounts, chain, erc721, tcs):
     assert tcs.balanceOf(accounts[0]) == 1
     assert tcs.tokenOfOwnerByIndex(accounts[0], 0) == 1
     assert tcs.tokenURI(1) == "https://tcs.com/1.json"
+
+
+def test_mintBatch_earliest_timestamp(accounts, chain, erc721):
+
+    tx = erc721.mintBatch(
+        [accounts[0], accounts[1], accounts[1]],
+        ["2.json", "3.json", "4.json"],
+        sender=accounts[0],
+    )
+    timestamp = chain.provider.get_block(tx.block_number).timestamp
+
+    # Timestamp of an existing holder is unchanged
+    assert erc721.addressToEarliestTimestamp(accounts[0]) < timestamp
+    assert erc721.addressToEarliestTimestamp(accounts[1]) == timestamp
+    assert erc721.balanceOf(accounts[1]) == 2
+
+    erc721.transferFrom(accounts[1], accounts[2], 3, sender=accounts[1])
+    erc721.burn(4, sender=accounts[1])
+
+    assert erc721.addressToEarliestTimestamp(accounts[1]) == 0
@@ -0,0 +1,130 @@
+import pytest
+from ape import reverts
+
+ETHER = 10**18
+
+
+@pytest.fixture
+def timer(accounts, project):
+    c = project.timer.deploy(
+        "Time Token",
+        "TT",
+        "https://www.test.com/",
+        1000,
+        accounts[0],
+        accounts[0],
+        sender=accounts[0],
+    )
+    yield c
+
+
+@pytest.fixture
+def erc20(accounts, project, timer):
+    c = project.ERC20_mintable.deploy(
+        "Mineable Token", "MNT", 18, 0, timer.address, sender=accounts[0]
+    )
+    timer.set_token_address(c.address, sender=accounts[0])
+    yield c
+
+
+def timestamp(chain, tx):
+    return chain.blocks[tx.block_number].timestamp
+
+
+def test_claim_rewards(accounts, chain, timer, erc20):
+    minted = timer.mint(accounts[1], "1.json", sender=accounts[0])
+    chain.pending_timestamp += 100
+
+    claimed = timer.claim_rewards(sender=accounts[1])
+    expected = (timestamp(chain, claimed) - timestamp(chain, minted)) * ETHER
+    assert erc20.balanceOf(accounts[1]) == expected
+
+    # Rewards accrue from the last claim
+    chain.pending_timestamp += 50
+    chain.mine()
+    assert (
+        timer.pending_rewards(accounts[1])
+        == (chain.blocks.head.timestamp - timestamp(chain, claimed)) * ETHER
+    )
+
+    with reverts("Nothing to claim"):
+        timer.claim_rewards(sender=accounts[2])
+
+
+def test_rewards_accrue_by_balance(accounts, chain, timer, erc20):
+    minted = timer.mintBatch(
+        [accounts[1], accounts[1]], ["1.json", "2.json"], sender=accounts[0]
+    )
+    chain.pending_timestamp += 100
+
+    transferred = timer.transferFrom(accounts[1], accounts[2], 1, sender=accounts[1])
+    chain.pending_timestamp += 100
+
+    # Rewards do not accrue to accounts[1] while accounts[3] holds token 2
+    held_by_a3 = 0
+    for _ in range(5):
+        sent = timer.transferFrom(accounts[1], accounts[3], 2, sender=accounts[1])
+        returned = timer.transferFrom(accounts[3], accounts[1], 2, sender=accounts[3])
+        held_by_a3 += timestamp(chain, returned) - timestamp(chain, sent)
+
+    claimed = timer.claim_rewards(sender=accounts[1])
+    held_two = timestamp(chain, transferred) - timestamp(chain, minted)
+    held_one = timestamp(chain, claimed) - timestamp(chain, transferred) - held_by_a3
+    assert erc20.balanceOf(accounts[1]) == (2 * held_two + held_one) * ETHER
+
+    claimed = timer.claim_rewards(sender=accounts[2])
+    assert (
+        erc20.balanceOf(accounts[2])
+        == (timestamp(chain, claimed) - timestamp(chain, transferred)) * ETHER
+    )
+
+
+def test_rewards_after_transferring_all(accounts, chain, timer, erc20):
+    minted = timer.mint(accounts[1], "1.json", sender=accounts[0])
+    chain.pending_timestamp += 100
+    transferred = timer.transferFrom(accounts[1], accounts[2], 1, sender=accounts[1])
+    chain.pending_timestamp += 100
+
+    # Rewards accrued while holding a token can still be claimed
+    timer.claim_rewards(sender=accounts[1])
+    assert (
+        erc20.balanceOf(accounts[1])
+        == (timestamp(chain, transferred) - timestamp(chain, minted)) * ETHER
+    )
+
+    chain.pending_timestamp += 100
+    with reverts("Nothing to claim"):
+        timer.claim_rewards(sender=accounts[1])
+
+
+def test_claim_rewards_for(accounts, chain, timer, erc20):
+    minted = timer.mintBatch(
+        [accounts[1], accounts[2], accounts[2]],
+        ["1.json", "2.json", "3.json"],
+        sender=accounts[0],
+    )
+    chain.pending_timestamp += 100
+
+    # accounts[3] has nothing to claim, and accounts[1] is only claimed for once
+    claimed = timer.claim_rewards_for(
+        [accounts[1], accounts[2], accounts[3], accounts[1]], sender=accounts[4]
+    )
+    elapsed = timestamp(chain, claimed) - timestamp(chain, minted)
+
+    assert erc20.balanceOf(accounts[1]) == elapsed * ETHER
+    assert erc20.balanceOf(accounts[2]) == 2 * elapsed * ETHER
+    assert erc20.balanceOf(accounts[3]) == 0
+    assert erc20.totalSupply() == 3 * elapsed * ETHER
+    assert timer.pending_rewards(accounts[1]) == 0
+
+    events = list(claimed.decode_logs(erc20.Transfer))
+    assert [e.event_arguments["receiver"] for e in events] == [accounts[1], accounts[2]]
+
+    # Nothing to mint
+    tx = timer.claim_rewards_for([accounts[3]], sender=accounts[4])
+    assert not list(tx.decode_logs(erc20.Transfer))
+
+
+def test_mintBatch_only_minter(accounts, erc20):
+    with reverts():
+        erc20.mintBatch([accounts[1]], [1], sender=accounts[1])
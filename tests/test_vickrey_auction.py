@@ -3,45 +3,51 @@ from ape import reverts
 from eth_utils import to_wei
 
 
-@pytest.fixture(scope="class", autouse=True)
-def auction(accounts, chain, project):
-    c = project.vickrey_auction.deploy(
-        to_wei(1, "ether"), chain.pending_timestamp + 100, sender=accounts[0]
+@pytest.fixture(autouse=True)
+def auction(accounts, chain, chain_states, project):
+    c = chain_states.restore(
+        "vickrey_auction",
+        lambda: project.vickrey_auction.deploy(
+            to_wei(1, "ether"), chain.pending_timestamp + 100, sender=accounts[0]
+        ),
     )
     yield c
 
 
 @pytest.fixture
-def a1_first_bid(accounts, auction):
-
-    tx = auction.bid(sender=accounts[1], value=to_wei(1.5, "ether"))
+def a1_first_bid(accounts, auction, chain_states):
+    tx = chain_states.restore(
+        "a1_first_bid",
+        lambda: auction.bid(sender=accounts[1], value=to_wei(1.5, "ether")),
+    )
     return tx
 
 
 @pytest.fixture
-def a1_second_bid(accounts, auction, a1_first_bid):
-
-    tx = auction.bid(sender=accounts[1], value=to_wei(0.5, "ether"))
-
+def a1_second_bid(accounts, auction, chain_states, a1_first_bid):
+    tx = chain_states.restore(
+        "a1_second_bid",
+        lambda: auction.bid(sender=accounts[1], value=to_wei(0.5, "ether")),
+    )
     return tx
 
 
 @pytest.fixture
-def a2_first_bid(accounts, auction, a1_second_bid):
-
-    tx = auction.bid(sender=accounts[2], value=to_wei(3, "ether"))
-
+def a2_first_bid(accounts, auction, chain_states, a1_second_bid):
+    tx = chain_states.restore(
+        "a2_first_bid",
+        lambda: auction.bid(sender=accounts[2], value=to_wei(3, "ether")),
+    )
     return tx
 
 
 @pytest.fixture
-def close_auction(accounts, chain, auction, a2_first_bid):
-
-    chain.mine(100)
+def close_auction(accounts, chain, auction, chain_states, a2_first_bid):
+    def close():
+        chain.mine(100)
+        return auction.close(sender=accounts[0])
 
-    tx = auction.close(sender=accounts[0])
-
-    return tx
+    return chain_states.restore("close_auction", close)
 
 
 def test_start_state(auction):
@@ -3,71 +3,82 @@ from ape import reverts
 from eth_utils import to_wei
 
 
-@pytest.fixture(scope="class", autouse=True)
-def erc721(accounts, project):
-    c = project.ERC721.deploy(
-        "Test Token",
-        "TST",
-        "https://www.test.com/",
-        100,
-        accounts[0],
-        accounts[0],
-        sender=accounts[0],
+@pytest.fixture(autouse=True)
+def erc721(accounts, chain_states, project):
+    def deploy():
+        c = project.ERC721.deploy(
+            "Test Token",
+            "TST",
+            "https://www.test.com/",
+            100,
+            accounts[0],
+            accounts[0],
+            sender=accounts[0],
+        )
+
+        # Mint 1 token
+        c.mint(accounts[0], "1.json", sender=accounts[0])
+        return c
+
+    yield chain_states.restore("erc721", deploy)
+
+
+@pytest.fixture(autouse=True)
+def auction(accounts, chain_states, project, erc721):
+    c = chain_states.restore(
+        "vickrey_auction_ERC721",
+        lambda: project.vickrey_auction_ERC721.deploy(
+            erc721.address, sender=accounts[0]
+        ),
     )
-
-    # Mint 1 token
-    c.mint(accounts[0], "1.json", sender=accounts[0])
-    yield c
-
-
-@pytest.fixture(scope="class", autouse=True)
-def auction(accounts, project, erc721):
-    c = project.vickrey_auction_ERC721.deploy(erc721.address, sender=accounts[0])
     yield c
 
 
 @pytest.fixture
-def initialise(accounts, chain, erc721, auction):
-    erc721.approve(auction.address, 1, sender=accounts[0])
-
-    start = auction.start_auction(
-        to_wei(1, "ether"), chain.pending_timestamp + 100, 1, sender=accounts[0]
-    )
+def initialise(accounts, chain, chain_states, erc721, auction):
+    def start_auction():
+        erc721.approve(auction.address, 1, sender=accounts[0])
+        return auction.start_auction(
+            to_wei(1, "ether"), chain.pending_timestamp + 100, 1, sender=accounts[0]
+        )
 
-    yield start
+    yield chain_states.restore("initialise", start_auction)
 
 
 @pytest.fixture
-def a1_first_bid(accounts, auction):
-
-    tx = auction.bid(sender=accounts[1], value=to_wei(1.5, "ether"))
+def a1_first_bid(accounts, auction, chain_states):
+    tx = chain_states.restore(
+        "a1_first_bid",
+        lambda: auction.bid(sender=accounts[1], value=to_wei(1.5, "ether")),
+    )
     return tx
 
 
 @pytest.fixture
-def a1_second_bid(accounts, auction, a1_first_bid):
-
-    tx = auction.bid(sender=accounts[1], value=to_wei(0.5, "ether"))
-
+def a1_second_bid(accounts, auction, chain_states, a1_first_bid):
+    tx = chain_states.restore(
+        "a1_second_bid",
+        lambda: auction.bid(sender=accounts[1], value=to_wei(0.5, "ether")),
+    )
     return tx
 
 
 @pytest.fixture
-def a2_first_bid(accounts, auction, a1_second_bid):
-
-    tx = auction.bid(sender=accounts[2], value=to_wei(3, "ether"))
-
+def a2_first_bid(accounts, auction, chain_states, a1_second_bid):
+    tx = chain_states.restore(
+        "a2_first_bid",
+        lambda: auction.bid(sender=accounts[2], value=to_wei(3, "ether")),
+    )
     return tx
 
 
 @pytest.fixture
-def close_auction(accounts, chain, auction, a2_first_bid):
+def close_auction(accounts, chain, auction, chain_states, a2_first_bid):
+    def close():
+        chain.mine(100)
+        return auction.close(sender=accounts[0])
 
-    chain.mine(100)
-
-    tx = auction.close(sender=accounts[0])
-
-    return tx
+    return chain_states.restore("close_auction", close)
 
 
 def test_start_state(auction):
@@ -0,0 +1,206 @@
+import pytest
+from ape import reverts
+from eth_utils import to_wei
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def created_auction(project, factory, tx):
+    # The return value of a transaction is not available from the test provider
+    events = list(tx.decode_logs(factory.AuctionCreated))
+    return project.vickrey_auction_ERC721.at(events[0].event_arguments["auction"])
+
+
+@pytest.fixture(autouse=True)
+def erc721(accounts, chain_states, project):
+    def deploy():
+        c = project.ERC721.deploy(
+            "Test Token",
+            "TST",
+            "https://www.test.com/",
+            100,
+            accounts[0],
+            accounts[0],
+            sender=accounts[0],
+        )
+
+        # Mint 3 tokens
+        for i in range(1, 4):
+            c.mint(accounts[0], f"{i}.json", sender=accounts[0])
+        return c
+
+    yield chain_states.restore("erc721", deploy)
+
+
+@pytest.fixture(autouse=True)
+def factory(accounts, chain_states, project, erc721):
+    def deploy():
+        implementation = project.vickrey_auction_ERC721.deploy(
+            erc721.address, sender=accounts[0]
+        )
+        c = project.vickrey_auction_ERC721_factory.deploy(
+            implementation.address, sender=accounts[0]
+        )
+        erc721.setApprovalForAll(c.address, True, sender=accounts[0])
+        return c
+
+    yield chain_states.restore("vickrey_auction_ERC721_factory", deploy)
+
+
+def create_auction(accounts, chain, project, erc721, factory, token_id):
+    tx = factory.create_auction(
+        erc721.address,
+        token_id,
+        to_wei(1, "ether"),
+        chain.pending_timestamp + 100,
+        sender=accounts[0],
+    )
+    return created_auction(project, factory, tx)
+
+
+@pytest.fixture
+def auctions(accounts, chain, chain_states, project, erc721, factory):
+    def create():
+        return [
+            create_auction(accounts, chain, project, erc721, factory, i)
+            for i in range(1, 4)
+        ]
+
+    return chain_states.restore("auctions", create)
+
+
+def test_create_auction(accounts, chain, project, erc721, factory):
+
+    deadline = chain.pending_timestamp + 100
+    tx = factory.create_auction(
+        erc721.address, 1, to_wei(1, "ether"), deadline, sender=accounts[0]
+    )
+    auction = created_auction(project, factory, tx)
+
+    events = list(tx.decode_logs(factory.AuctionCreated))
+    assert len(events) == 1
+    assert events[0].event_arguments["auction"] == auction
+    assert events[0].event_arguments["owner"] == accounts[0]
+    assert events[0].event_arguments["token_address"] == erc721
+    assert events[0].event_arguments["token_id"] == 1
+
+    # The token is escrowed and the auction is started in the same call
+    assert erc721.ownerOf(1) == auction
+    assert auction.is_started() is True
+    assert auction.factory() == factory
+    assert auction.erc721_contract() == erc721
+    assert auction.token_id() == 1
+    assert auction.deadline() == deadline
+    assert auction.get_highest_bid() == to_wei(1, "ether")
+    assert auction.bids_to_bidder(to_wei(1, "ether")) == accounts[0]
+
+    assert factory.is_live(auction) is True
+    assert factory.live_auction_count() == 1
+    assert factory.live_auctions(0) == auction
+
+
+def test_auctions_by_index_range(factory, auctions):
+
+    assert factory.live_auction_count() == 3
+    assert factory.live_auctions_by_index_range(0, 3) == auctions
+    assert factory.live_auctions_by_index_range(1, 1) == auctions[1:2]
+    assert factory.live_auctions_by_index_range(2, 10) == auctions[2:]
+    assert factory.live_auctions_by_index_range(3, 10) == []
+
+
+def test_bid_and_close(accounts, chain, erc721, factory, auctions):
+
+    auction = auctions[1]
+    auction.bid(sender=accounts[1], value=to_wei(1.5, "ether"))
+    auction.bid(sender=accounts[2], value=to_wei(3, "ether"))
+
+    a0_balance = accounts[0].balance
+
+    chain.mine(100)
+
+    tx = auction.close(sender=accounts[3])
+
+    events = list(tx.decode_logs(factory.AuctionRemoved))
+    assert len(events) == 1
+    assert events[0].event_arguments["auction"] == auction
+
+    assert accounts[0].balance == a0_balance + to_wei(1.5, "ether")
+    assert erc721.ownerOf(2) == accounts[2]
+
+    # The last live auction takes the index of the closed auction
+    assert factory.is_live(auction) is False
+    assert factory.live_auction_count() == 2
+    assert factory.live_auctions_by_index_range(0, 3) == [auctions[0], auctions[2]]
+
+
+def test_close_without_bids(accounts, chain, erc721, factory, auctions):
+
+    chain.mine(100)
+
+    for auction in auctions:
+        auction.close(sender=accounts[0])
+
+    assert [erc721.ownerOf(i) for i in range(1, 4)] == [accounts[0]] * 3
+    assert factory.live_auction_count() == 0
+    assert factory.live_auctions(0) == ZERO_ADDRESS
+    assert factory.live_auctions_by_index_range(0, 3) == []
+
+
+def test_illegal_create_auction_not_owner(accounts, chain, erc721, factory):
+
+    with reverts():
+        factory.create_auction(
+            erc721.address,
+            1,
+            to_wei(1, "ether"),
+            chain.pending_timestamp + 100,
+            sender=accounts[1],
+        )
+
+
+def test_illegal_create_auction_not_approved(accounts, chain, erc721, factory):
+
+    erc721.setApprovalForAll(factory.address, False, sender=accounts[0])
+
+    with reverts():
+        factory.create_auction(
+            erc721.address,
+            1,
+            to_wei(1, "ether"),
+            chain.pending_timestamp + 100,
+            sender=accounts[0],
+        )
+
+
+def test_illegal_create_auction_deadline(accounts, chain, erc721, factory):
+
+    with reverts("Deadline for auction must be in the future"):
+        factory.create_auction(
+            erc721.address,
+            1,
+            to_wei(1, "ether"),
+            chain.pending_timestamp - 1,
+            sender=accounts[0],
+        )
+
+
+def test_illegal_initialize(accounts, chain, project, erc721, factory, auctions):
+
+    implementation = project.vickrey_auction_ERC721.at(factory.IMPLEMENTATION())
+
+    for auction in [implementation, auctions[0]]:
+        with reverts("Auction is already initialised"):
+            auction.initialize(
+                erc721.address,
+                accounts[1],
+                0,
+                chain.pending_timestamp + 100,
+                1,
+                sender=accounts[1],
+            )
+
+
+def test_illegal_remove_auction(accounts, factory, auctions):
+
+    with reverts("Not a live auction"):
+        factory.remove_auction(sender=accounts[0])
@@ -0,0 +1,321 @@
+import pytest
+from ape import reverts
+from eth_abi import encode
+from eth_utils import keccak, to_wei
+
+PHASE_DURATION = 1000
+
+A1_BID = to_wei(1.5, "ether")
+A1_DEPOSIT = to_wei(2, "ether")
+A1_SALT = keccak(text="a1")
+
+A2_BID = to_wei(3, "ether")
+A2_DEPOSIT = to_wei(4, "ether")
+A2_SALT = keccak(text="a2")
+
+
+def commitment(auction, bidder, bid, salt):
+    return keccak(
+        encode(
+            ["address", "address", "uint256", "bytes32"],
+            [auction.address, bidder.address, bid, salt],
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def auction(accounts, chain, chain_states, project):
+    def deploy():
+        commit_deadline = chain.pending_timestamp + PHASE_DURATION
+        return project.vickrey_auction_sealed.deploy(
+            to_wei(1, "ether"),
+            commit_deadline,
+            commit_deadline + PHASE_DURATION,
+            sender=accounts[0],
+        )
+
+    yield chain_states.restore("vickrey_auction_sealed", deploy)
+
+
+@pytest.fixture
+def a1_commit(accounts, auction, chain_states):
+    tx = chain_states.restore(
+        "a1_commit",
+        lambda: auction.commit(
+            commitment(auction, accounts[1], A1_BID, A1_SALT),
+            sender=accounts[1],
+            value=A1_DEPOSIT,
+        ),
+    )
+    return tx
+
+
+@pytest.fixture
+def a2_commit(accounts, auction, chain_states, a1_commit):
+    tx = chain_states.restore(
+        "a2_commit",
+        lambda: auction.commit(
+            commitment(auction, accounts[2], A2_BID, A2_SALT),
+            sender=accounts[2],
+            value=A2_DEPOSIT,
+        ),
+    )
+    return tx
+
+
+@pytest.fixture
+def reveal_phase(chain, chain_states, a2_commit):
+    def end_commit_phase():
+        chain.pending_timestamp += PHASE_DURATION
+
+        # The block mined by the time travel can not be reverted to
+        chain.mine()
+
+    chain_states.restore("reveal_phase", end_commit_phase)
+
+
+@pytest.fixture
+def a1_reveal(accounts, auction, chain_states, reveal_phase):
+    tx = chain_states.restore(
+        "a1_reveal", lambda: auction.reveal(A1_BID, A1_SALT, sender=accounts[1])
+    )
+    return tx
+
+
+@pytest.fixture
+def a2_reveal(accounts, auction, chain_states, a1_reveal):
+    tx = chain_states.restore(
+        "a2_reveal", lambda: auction.reveal(A2_BID, A2_SALT, sender=accounts[2])
+    )
+    return tx
+
+
+@pytest.fixture
+def close_auction(accounts, chain, auction, chain_states, a2_reveal):
+    def close():
+        chain.pending_timestamp += PHASE_DURATION
+        return auction.close(sender=accounts[0])
+
+    return chain_states.restore("close_auction", close)
+
+
+def test_start_state(accounts, auction):
+
+    assert auction.highest_bid() == to_wei(1, "ether")
+    assert auction.second_highest_bid() == to_wei(1, "ether")
+    assert auction.highest_bidder() == accounts[0]
+    assert auction.has_ended() is False
+
+
+def test_get_commitment(accounts, auction):
+
+    assert auction.get_commitment(accounts[1], A1_BID, A1_SALT) == commitment(
+        auction, accounts[1], A1_BID, A1_SALT
+    )
+
+
+def test_commit(accounts, auction, a1_commit):
+
+    events = list(a1_commit.decode_logs(auction.Commit))
+    assert len(events) == 1
+    assert events[0].event_arguments["deposit"] == A1_DEPOSIT
+    assert events[0].event_arguments["bidder"] == accounts[1]
+
+    assert auction.bidder_to_commitment(accounts[1]) == commitment(
+        auction, accounts[1], A1_BID, A1_SALT
+    )
+    assert auction.bidder_to_balance(accounts[1]) == A1_DEPOSIT
+
+    # The bid is sealed until it is revealed
+    assert auction.highest_bid() == to_wei(1, "ether")
+
+
+def test_recommit(accounts, auction, a1_commit):
+
+    new_commitment = commitment(auction, accounts[1], A2_BID, A1_SALT)
+    tx = auction.commit(new_commitment, sender=accounts[1], value=to_wei(1, "ether"))
+
+    events = list(tx.decode_logs(auction.Commit))
+    assert len(events) == 1
+    assert events[0].event_arguments["deposit"] == A1_DEPOSIT + to_wei(1, "ether")
+
+    assert auction.bidder_to_commitment(accounts[1]) == new_commitment
+    assert auction.bidder_to_balance(accounts[1]) == A1_DEPOSIT + to_wei(1, "ether")
+
+
+def test_illegal_commit_empty(accounts, auction):
+
+    with reverts("Empty commitment"):
+        auction.commit(b"\x00" * 32, sender=accounts[1], value=A1_DEPOSIT)
+
+
+def test_illegal_commit_after_deadline(accounts, auction, reveal_phase):
+
+    with reverts("Commit phase has ended"):
+        auction.commit(
+            commitment(auction, accounts[3], A1_BID, A1_SALT),
+            sender=accounts[3],
+            value=A1_DEPOSIT,
+        )
+
+
+def test_illegal_reveal_before_deadline(accounts, auction, a1_commit):
+
+    with reverts("Commit phase has not ended"):
+        auction.reveal(A1_BID, A1_SALT, sender=accounts[1])
+
+
+def test_reveal(accounts, auction, a1_reveal):
+
+    events = list(a1_reveal.decode_logs(auction.Reveal))
+    assert len(events) == 1
+    assert events[0].event_arguments["value"] == A1_BID
+    assert events[0].event_arguments["bidder"] == accounts[1]
+
+    assert auction.highest_bid() == A1_BID
+    assert auction.second_highest_bid() == to_wei(1, "ether")
+    assert auction.highest_bidder() == accounts[1]
+    assert auction.bidder_to_commitment(accounts[1]) == b"\x00" * 32
+
+
+def test_competing_reveal(accounts, auction, a2_reveal):
+
+    assert auction.highest_bid() == A2_BID
+    assert auction.second_highest_bid() == A1_BID
+    assert auction.highest_bidder() == accounts[2]
+
+
+def test_lower_reveal(accounts, auction, reveal_phase):
+
+    # A lower bid revealed after a higher one is the second highest bid
+    auction.reveal(A2_BID, A2_SALT, sender=accounts[2])
+    auction.reveal(A1_BID, A1_SALT, sender=accounts[1])
+
+    assert auction.highest_bid() == A2_BID
+    assert auction.second_highest_bid() == A1_BID
+    assert auction.highest_bidder() == accounts[2]
+
+
+def test_equal_bids(accounts, chain, auction, a1_commit):
+
+    # The first bidder to reveal wins at the price of the bid
+    salt = keccak(text="a3")
+    auction.commit(
+        commitment(auction, accounts[3], A1_BID, salt),
+        sender=accounts[3],
+        value=A1_DEPOSIT,
+    )
+    chain.pending_timestamp += PHASE_DURATION
+    auction.reveal(A1_BID, A1_SALT, sender=accounts[1])
+    auction.reveal(A1_BID, salt, sender=accounts[3])
+
+    assert auction.highest_bid() == A1_BID
+    assert auction.second_highest_bid() == A1_BID
+    assert auction.highest_bidder() == accounts[1]
+
+
+def test_illegal_reveal_invalid(accounts, auction, reveal_phase):
+
+    with reverts("Invalid reveal"):
+        auction.reveal(A1_BID, A2_SALT, sender=accounts[1])
+
+    with reverts("Invalid reveal"):
+        auction.reveal(A2_BID, A1_SALT, sender=accounts[1])
+
+    # Another bidder can not reveal a copied commitment
+    with reverts("Invalid reveal"):
+        auction.reveal(A1_BID, A1_SALT, sender=accounts[3])
+
+
+def test_illegal_reveal_twice(accounts, auction, a1_reveal):
+
+    with reverts("Invalid reveal"):
+        auction.reveal(A1_BID, A1_SALT, sender=accounts[1])
+
+
+def test_illegal_reveal_above_deposit(accounts, chain, auction):
+
+    salt = keccak(text="a3")
+    auction.commit(
+        commitment(auction, accounts[3], A2_BID, salt),
+        sender=accounts[3],
+        value=A1_DEPOSIT,
+    )
+    chain.pending_timestamp += PHASE_DURATION
+
+    with reverts("Bid is above deposit"):
+        auction.reveal(A2_BID, salt, sender=accounts[3])
+
+
+def test_illegal_reveal_after_deadline(accounts, chain, auction, reveal_phase):
+
+    chain.pending_timestamp += PHASE_DURATION
+
+    with reverts("Reveal phase has ended"):
+        auction.reveal(A1_BID, A1_SALT, sender=accounts[1])
+
+
+def test_close(accounts, chain, auction, a2_reveal):
+
+    a0_balance = accounts[0].balance
+
+    chain.pending_timestamp += PHASE_DURATION
+
+    tx = auction.close(sender=accounts[0])
+
+    assert accounts[0].balance == a0_balance + A1_BID - tx.total_fees_paid
+    assert auction.is_claimed() is True
+    assert auction.has_ended() is True
+
+    with reverts("Owner has already claimed"):
+        auction.close(sender=accounts[0])
+
+
+def test_illegal_close_auction(accounts, auction, a2_reveal):
+
+    with reverts("Auction has not ended"):
+        auction.close(sender=accounts[0])
+
+
+def test_refund_winner(accounts, auction, close_auction):
+
+    a2_balance = accounts[2].balance
+
+    tx = auction.refund(sender=accounts[2])
+
+    events = list(tx.decode_logs(auction.Refund))
+    assert len(events) == 1
+    assert events[0].event_arguments["value"] == A2_DEPOSIT - A1_BID
+    assert events[0].event_arguments["bidder"] == accounts[2]
+
+    assert accounts[2].balance == a2_balance + A2_DEPOSIT - A1_BID - tx.total_fees_paid
+    assert auction.bidder_to_balance(accounts[2]) == 0
+
+
+def test_refund_loser(accounts, auction, close_auction):
+
+    a1_balance = accounts[1].balance
+
+    tx = auction.refund(sender=accounts[1])
+
+    events = list(tx.decode_logs(auction.Refund))
+    assert len(events) == 1
+    assert events[0].event_arguments["value"] == A1_DEPOSIT
+    assert events[0].event_arguments["bidder"] == accounts[1]
+
+    assert accounts[1].balance == a1_balance + A1_DEPOSIT - tx.total_fees_paid
+
+    with reverts("No bids from current address"):
+        auction.refund(sender=accounts[1])
+
+
+def test_refund_unrevealed(accounts, chain, auction, a1_reveal):
+
+    chain.pending_timestamp += PHASE_DURATION
+    auction.close(sender=accounts[0])
+
+    a2_balance = accounts[2].balance
+
+    tx = auction.refund(sender=accounts[2])
+
+    assert accounts[2].balance == a2_balance + A2_DEPOSIT - tx.total_fees_paid
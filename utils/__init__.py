@@ -0,0 +1,3 @@
+"""
+Off-chain helpers for the contracts in this repository.
+"""
@@ -0,0 +1,207 @@
+"""
+Cache the compiled contract types of the Vyper contracts across runs and checkouts.
+
+ape keeps the contract types of the project in `.build/__local__.json`, and recompiles
+a source only when its content changes. That cache is lost on a fresh checkout or a
+clean build, is rebuilt for every source that differs after switching branches, and is
+not invalidated when the version of Vyper or the compiler settings change.
+
+This module wraps the Vyper compiler of ape with a content-addressed cache, with one
+file per contract type, keyed by the SHA-256 of the source, its path, the version of
+Vyper it compiles with, the EVM version and the version of `ape-vyper`. A source is
+only compiled if no contract type is cached for its key, and a contract type is
+reused by every checkout that has the same source, so only edited contracts are
+compiled. `.build/__local__.json` is discarded if the key of any source changes, so that
+ape reloads every source through the cache.
+
+Run `python -m utils.compile_cache` to compile the project through the cache and write
+the manifest of ape, so that `ape test` loads the contract types from it without
+compiling. Scripts install the cache before their first use of `project`:
+
+    from utils.compile_cache import install_compile_cache
+
+    def main():
+        install_compile_cache()
+
+The cache is kept in `~/.cache/vyper-contracts/compile`, or the directory in the
+`VYPER_CONTRACTS_COMPILE_CACHE` environment variable.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from importlib.metadata import version
+from pathlib import Path
+
+from ape import project
+from ape.logging import logger
+from ape.types import ContractType
+from ape.utils import get_relative_path
+from ape_vyper.compiler import VyperCompiler
+
+CACHE_DIR_ENV = "VYPER_CONTRACTS_COMPILE_CACHE"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "vyper-contracts" / "compile"
+
+# @dev Keys of the sources of the project when it was last loaded, next to the manifest
+KEYS_FILE_NAME = "compile_cache_keys.json"
+
+
+def get_cache_dir():
+    return Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def cache_key(source, source_id, vyper_version, settings):
+    """
+    Returns the key of the contract type compiled from `source` at `source_id` with
+    `vyper_version` and the compiler `settings`.
+    """
+    data = {
+        "ape_vyper": version("ape-vyper"),
+        "settings": settings,
+        "source": source,
+        "source_id": source_id,
+        "vyper": str(vyper_version),
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+class CompileCache:
+    """
+    Directory of contract types, in a file named after the key of each.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else get_cache_dir()
+
+    def get(self, key):
+        """
+        Returns the contract type cached for `key`, or None if there is none.
+        """
+        try:
+            return ContractType.parse_file(self.path / f"{key}.json")
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, contract_type):
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # Written to a temporary file first, as the tests of each xdist worker compile
+        # the project in parallel
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(contract_type.json())
+
+        os.replace(tmp, self.path / f"{key}.json")
+
+
+class CachedVyperCompiler(VyperCompiler):
+    """
+    Vyper compiler that loads the contract types of sources that are cached, and
+    compiles and caches the others.
+    """
+
+    def get_cache_keys(self, contract_filepaths, base_path=None):
+        """
+        Returns a dict of the key of each source that is compiled to a contract type.
+        """
+        base_path = base_path or self.config_manager.contracts_folder
+        version_map = self.get_version_map(
+            [p for p in contract_filepaths if p.parent.name != "interfaces"]
+        )
+        arguments_map = self._get_compiler_arguments(version_map, base_path)
+
+        keys = {}
+        for vyper_version, source_paths in version_map.items():
+            settings = {"evm_version": arguments_map[vyper_version]["evm_version"]}
+            for path in source_paths:
+                source_id = str(get_relative_path(path.absolute(), base_path))
+                keys[path] = cache_key(
+                    path.read_text(), source_id, vyper_version, settings
+                )
+
+        return keys
+
+    def compile(self, contract_filepaths, base_path=None):
+        cache = CompileCache()
+        keys = self.get_cache_keys(contract_filepaths, base_path=base_path)
+
+        contract_types = []
+        missing = []
+        for path, key in keys.items():
+            contract_type = cache.get(key)
+            if contract_type is None:
+                missing.append(path)
+            else:
+                contract_types.append(contract_type)
+
+        if missing:
+            base_path = base_path or self.config_manager.contracts_folder
+            missing_keys = {
+                str(get_relative_path(path.absolute(), base_path)): keys[path]
+                for path in missing
+            }
+            compiled = super().compile(missing, base_path=base_path)
+            for contract_type in compiled:
+                cache.put(missing_keys[contract_type.source_id], contract_type)
+
+            contract_types.extend(compiled)
+
+        logger.info(
+            f"Loaded {len(keys) - len(missing)} contracts from the compile cache, "
+            f"compiled {len(missing)}."
+        )
+        return contract_types
+
+
+def install_compile_cache():
+    """
+    Replace the Vyper compiler of the project with `CachedVyperCompiler`, and discard
+    the manifest of ape if the key of any source changed since the last time.
+    """
+    compilers = project.compiler_manager.registered_compilers
+    if isinstance(compilers.get(".vy"), CachedVyperCompiler):
+        return
+
+    compiler = CachedVyperCompiler()
+    compilers[".vy"] = compiler
+
+    local_project = project.local_project
+    source_paths = [p for p in local_project.source_paths if p.suffix == ".vy"]
+    keys = {
+        str(get_relative_path(path.absolute(), project.contracts_folder)): key
+        for path, key in compiler.get_cache_keys(source_paths).items()
+    }
+
+    keys_file = local_project.manifest_cachefile.parent / KEYS_FILE_NAME
+    try:
+        previous_keys = json.loads(keys_file.read_text())
+    except (OSError, ValueError):
+        previous_keys = None
+
+    if keys != previous_keys:
+        local_project.manifest_cachefile.unlink(missing_ok=True)
+        keys_file.parent.mkdir(parents=True, exist_ok=True)
+        keys_file.write_text(json.dumps(keys, indent=2, sort_keys=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.compile_cache",
+        description="Compile the contracts through the compile cache, and write the "
+        "manifest of ape.",
+    )
+    parser.parse_args()
+
+    start = time.perf_counter()
+    install_compile_cache()
+    contract_types = project.load_contracts()
+    elapsed = time.perf_counter() - start
+    print(f"Loaded {len(contract_types)} contract types in {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
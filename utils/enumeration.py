@@ -0,0 +1,68 @@
+"""
+Page through the enumeration of a token contract with its bulk view functions.
+
+`tokensOfOwner`, `tokensByIndexRange` and `ownersOf` return up to `MAX_PAGE_SIZE`
+entries per call, so the tokens of an owner holding fewer than `page_size` tokens are
+read in a single call. Indexes count from 1 for the ERC721 contracts and from 0 for
+the EIP-4671 contracts, as in their `tokenOfOwnerByIndex`. Pass `first_index=0` for
+the latter.
+"""
+
+# @dev Matches `MAX_PAGE_SIZE` in the contracts
+MAX_PAGE_SIZE = 1000
+
+
+def _check_page_size(page_size):
+    if not 0 < page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+
+
+def _iter_pages(fetch, first_index, page_size):
+    """
+    Yield the entries of `fetch(start, count)` page by page, until a page is not full.
+    """
+    _check_page_size(page_size)
+
+    start = first_index
+    while True:
+        page = fetch(start, page_size)
+        yield from page
+
+        if len(page) < page_size:
+            return
+
+        start += page_size
+
+
+def iter_tokens_of_owner(contract, owner, page_size=MAX_PAGE_SIZE, first_index=1):
+    """
+    Yield the token IDs held by `owner`, in the order of its token list.
+    """
+    return _iter_pages(
+        lambda start, count: contract.tokensOfOwner(owner, start, count),
+        first_index,
+        page_size,
+    )
+
+
+def iter_tokens(contract, page_size=MAX_PAGE_SIZE, first_index=1):
+    """
+    Yield the token IDs of all tokens, in the order of `tokenByIndex`.
+    """
+    return _iter_pages(contract.tokensByIndexRange, first_index, page_size)
+
+
+def owners_of(contract, token_ids, page_size=MAX_PAGE_SIZE):
+    """
+    Returns the owners of `token_ids` in the same order, with the zero address for
+    token IDs that are not valid.
+    """
+    _check_page_size(page_size)
+
+    token_ids = list(token_ids)
+    owners = []
+    for start in range(0, len(token_ids), page_size):
+        end = start + page_size
+        owners.extend(contract.ownersOf(token_ids[start:end]))
+
+    return owners
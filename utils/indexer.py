@@ -0,0 +1,352 @@
+"""
+Index the events of deployed contracts into a local SQLite database.
+
+    indexer = EventIndexer("events.db", [erc721, ntt, auction])
+    indexer.run()
+
+    indexer.owner_of(erc721, 1)
+    indexer.bid_of(auction, bidder)
+
+Logs of all contracts are pulled from the configured ape provider with one `eth_getLogs`
+per range of `batch_size` blocks, and decoded against the ABI of the contract that
+emitted them, as `Transfer` of an ERC721 and of an ERC20 share a selector. Every event is
+stored in `events`, and the state it implies is upserted into:
+
+- `ownership`, from the `Transfer` of an ERC721 and the `Mint` of an NTT. Burnt tokens
+  are deleted.
+- `approvals` and `operators`, from `Approval` of an ERC721 and `ApprovalForAll`. The
+  approval of a token is cleared when it is transferred, as the contracts do.
+- `bids`, from `Bid` and `Refund` of `vickrey_auction.vy`, mirroring `bidder_to_balance`.
+
+The rows of a batch are written in a single transaction together with the last block of
+the batch for each contract, so a run that is interrupted resumes from the end of the
+last committed batch and never applies an event twice. Amounts and token IDs are stored
+as decimal strings, as they may not fit in an SQLite integer.
+"""
+
+import json
+import sqlite3
+import time
+
+from eth_utils import to_checksum_address
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+DEFAULT_BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    address TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    event TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE TABLE IF NOT EXISTS ownership (
+    address TEXT NOT NULL,
+    token_id TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (address, token_id)
+);
+CREATE INDEX IF NOT EXISTS ownership_owner ON ownership (address, owner);
+CREATE TABLE IF NOT EXISTS approvals (
+    address TEXT NOT NULL,
+    token_id TEXT NOT NULL,
+    approved TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (address, token_id)
+);
+CREATE TABLE IF NOT EXISTS operators (
+    address TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    operator TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (address, owner, operator)
+);
+CREATE TABLE IF NOT EXISTS bids (
+    address TEXT NOT NULL,
+    bidder TEXT NOT NULL,
+    bid TEXT NOT NULL,
+    refunded TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (address, bidder)
+);
+"""
+
+
+def _to_json(value):
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+
+    return value
+
+
+def _address(account):
+    """
+    Returns the checksummed address of a contract, an account or an address.
+    """
+    return to_checksum_address(getattr(account, "address", account))
+
+
+class EventIndexer:
+    """
+    Indexes the events of `contracts` into the SQLite database at `db_path`, starting
+    from `start_block` for contracts that have not been indexed before.
+    """
+
+    def __init__(
+        self, db_path, contracts, batch_size=DEFAULT_BATCH_SIZE, start_block=0
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.contracts = {_address(c): c for c in contracts}
+        if not self.contracts:
+            raise ValueError("No contracts")
+
+        self.provider = next(iter(self.contracts.values())).provider
+        self.batch_size = batch_size
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+
+        # Last block indexed for each contract
+        committed = dict(
+            self.db.execute("SELECT address, block_number FROM checkpoints")
+        )
+        self.checkpoints = {
+            address: committed.get(address, start_block - 1)
+            for address in self.contracts
+        }
+
+        self.handlers = {
+            "Transfer": self._on_transfer,
+            "Mint": self._on_mint,
+            "Approval": self._on_approval,
+            "ApprovalForAll": self._on_approval_for_all,
+            "Bid": self._on_bid,
+            "Refund": self._on_refund,
+        }
+
+    def close(self):
+        self.db.close()
+
+    def _get_logs(self, start, stop, addresses):
+        """
+        Returns the decoded logs of `addresses` from `start` to `stop` inclusive, in the
+        order they were emitted.
+        """
+        raw_logs = self.provider.web3.eth.get_logs(
+            {"fromBlock": start, "toBlock": stop, "address": addresses}
+        )
+
+        by_address = {}
+        for log in raw_logs:
+            # Already checksummed by web3
+            address = log["address"]
+            if log["blockNumber"] > self.checkpoints[address]:
+                by_address.setdefault(address, []).append(log)
+
+        ecosystem = self.provider.network.ecosystem
+        logs = []
+        for address, contract_logs in by_address.items():
+            events = self.contracts[address].contract_type.events
+            logs.extend(ecosystem.decode_logs(contract_logs, *events))
+
+        return sorted(logs, key=lambda log: (log.block_number, log.log_index))
+
+    def _apply(self, log):
+        args = log.event_arguments
+        self.db.execute(
+            "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                log.block_number,
+                log.log_index,
+                log.contract_address,
+                _to_json(log.transaction_hash),
+                log.event_name,
+                json.dumps({name: _to_json(value) for name, value in args.items()}),
+            ),
+        )
+
+        handler = self.handlers.get(log.event_name)
+        if handler is not None:
+            handler(log.contract_address, log.block_number, args)
+
+    def _set_owner(self, address, block_number, token_id, owner):
+        if owner == ZERO_ADDRESS:
+            self.db.execute(
+                "DELETE FROM ownership WHERE address = ? AND token_id = ?",
+                (address, str(token_id)),
+            )
+        else:
+            self.db.execute(
+                "INSERT OR REPLACE INTO ownership VALUES (?, ?, ?, ?)",
+                (address, str(token_id), owner, block_number),
+            )
+
+    def _on_transfer(self, address, block_number, args):
+        # `Transfer` of an ERC20 has a `value` instead
+        if "tokenId" not in args:
+            return
+
+        self._set_owner(address, block_number, args["tokenId"], args["receiver"])
+        self.db.execute(
+            "DELETE FROM approvals WHERE address = ? AND token_id = ?",
+            (address, str(args["tokenId"])),
+        )
+
+    def _on_mint(self, address, block_number, args):
+        self._set_owner(address, block_number, args["tokenId"], args["owner"])
+
+    def _on_approval(self, address, block_number, args):
+        # `Approval` of an ERC20 has a `value` instead
+        if "tokenId" not in args:
+            return
+
+        if args["approved"] == ZERO_ADDRESS:
+            self.db.execute(
+                "DELETE FROM approvals WHERE address = ? AND token_id = ?",
+                (address, str(args["tokenId"])),
+            )
+        else:
+            self.db.execute(
+                "INSERT OR REPLACE INTO approvals VALUES (?, ?, ?, ?)",
+                (address, str(args["tokenId"]), args["approved"], block_number),
+            )
+
+    def _on_approval_for_all(self, address, block_number, args):
+        if args["approved"]:
+            self.db.execute(
+                "INSERT OR REPLACE INTO operators VALUES (?, ?, ?, ?)",
+                (address, args["owner"], args["operator"], block_number),
+            )
+        else:
+            self.db.execute(
+                "DELETE FROM operators WHERE address = ? AND owner = ? AND operator = ?",
+                (address, args["owner"], args["operator"]),
+            )
+
+    def _on_bid(self, address, block_number, args):
+        # `value` is the cumulative bid of the bidder
+        self.db.execute(
+            "INSERT INTO bids VALUES (?, ?, ?, '0', ?) "
+            "ON CONFLICT (address, bidder) DO UPDATE "
+            "SET bid = excluded.bid, block_number = excluded.block_number",
+            (address, args["bidder"], str(args["value"]), block_number),
+        )
+
+    def _on_refund(self, address, block_number, args):
+        self.db.execute(
+            "UPDATE bids SET bid = '0', refunded = ?, block_number = ? "
+            "WHERE address = ? AND bidder = ?",
+            (str(args["value"]), block_number, address, args["bidder"]),
+        )
+
+    def index_range(self, start, stop):
+        """
+        Index the events from `start` to `stop` inclusive in a single transaction, for
+        the contracts that have not been indexed up to `stop`. Returns the number of
+        events indexed.
+        """
+        addresses = [a for a, block in self.checkpoints.items() if block < stop]
+        if not addresses:
+            return 0
+
+        logs = self._get_logs(start, stop, addresses)
+        with self.db:
+            for log in logs:
+                self._apply(log)
+
+            self.db.executemany(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+                [(address, stop) for address in addresses],
+            )
+
+        for address in addresses:
+            self.checkpoints[address] = stop
+
+        return len(logs)
+
+    def run(self, stop_block=None, report_every=None, out=None):
+        """
+        Index the events of every contract up to `stop_block` inclusive (the head of the
+        chain by default), `batch_size` blocks at a time, resuming from the last
+        committed batch. Returns the number of events indexed and the elapsed time in
+        seconds. The ingestion rate is printed to `out` every `report_every` batches.
+        """
+        start_time = time.perf_counter()
+        if stop_block is None:
+            stop_block = self.provider.chain_manager.blocks.height
+
+        count = 0
+        start = min(self.checkpoints.values()) + 1
+        for batch, block in enumerate(range(start, stop_block + 1, self.batch_size), 1):
+            count += self.index_range(
+                block, min(block + self.batch_size - 1, stop_block)
+            )
+            if report_every and batch % report_every == 0:
+                elapsed = time.perf_counter() - start_time
+                print(
+                    f"Block {block}: {count} events, {count / elapsed:.0f} events/s",
+                    file=out,
+                )
+
+        return count, time.perf_counter() - start_time
+
+    def owner_of(self, contract, token_id):
+        """
+        Returns the indexed owner of `token_id` of `contract`, or None if it has no owner.
+        """
+        row = self.db.execute(
+            "SELECT owner FROM ownership WHERE address = ? AND token_id = ?",
+            (_address(contract), str(token_id)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def tokens_of(self, contract, owner):
+        """
+        Returns the indexed token IDs of `contract` owned by `owner`, in ascending order.
+        """
+        rows = self.db.execute(
+            "SELECT token_id FROM ownership WHERE address = ? AND owner = ?",
+            (_address(contract), _address(owner)),
+        )
+        return sorted(int(token_id) for token_id, in rows)
+
+    def approved_of(self, contract, token_id):
+        """
+        Returns the indexed approved address of `token_id` of `contract`, or None.
+        """
+        row = self.db.execute(
+            "SELECT approved FROM approvals WHERE address = ? AND token_id = ?",
+            (_address(contract), str(token_id)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_operator(self, contract, owner, operator):
+        row = self.db.execute(
+            "SELECT 1 FROM operators WHERE address = ? AND owner = ? AND operator = ?",
+            (_address(contract), _address(owner), _address(operator)),
+        ).fetchone()
+        return row is not None
+
+    def bid_of(self, contract, bidder):
+        """
+        Returns the indexed `(bid, refunded)` of `bidder` in `contract`, or None if it
+        has not bid.
+        """
+        row = self.db.execute(
+            "SELECT bid, refunded FROM bids WHERE address = ? AND bidder = ?",
+            (_address(contract), _address(bidder)),
+        ).fetchone()
+        return (int(row[0]), int(row[1])) if row else None
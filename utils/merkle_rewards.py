@@ -0,0 +1,199 @@
+"""
+Build Merkle trees of time-mining rewards for `time_mining_erc721/reward_distributor.vy`.
+
+    ledger = RewardLedger()
+    for timestamp, sender, receiver in iter_transfers(timer, 0, chain.blocks.height):
+        ledger.apply(timestamp, sender, receiver)
+
+    tree = MerkleTree(sorted(ledger.amounts(epoch_end)))
+    distributor.set_merkle_root(tree.root, sender=owner)
+    write_claims("claims.jsonl", tree)
+
+`Transfer` events of `timer.vy` are replayed in block order into a `RewardLedger`, which
+accrues one token per second for each NFT held, as `timer.vy` does, in memory that grows
+with the number of holders and not the number of events. Amounts are cumulative since
+the first event, so a holder who claims rarely claims everything owed in one proof.
+
+Leaves are the double keccak256 of the ABI encoded `(holder, amount)`, and pairs are
+hashed in sorted order. The tree is padded with zero leaves to a power of two, so every
+proof has the same length, and the proofs of a chunk of leaves are gathered at once
+with numpy instead of walking the tree once per leaf.
+"""
+
+import json
+
+import numpy as np
+from eth_abi import encode
+from eth_utils import keccak
+
+# @dev Rewards accrued per second for each NFT held, as in `timer.vy`
+REWARD_PER_SECOND = 10**18
+
+# @dev Matches `MAX_PROOF_LENGTH` in `reward_distributor.vy`
+MAX_PROOF_LENGTH = 32
+
+EMPTY_LEAF = bytes(32)
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+DEFAULT_BLOCK_CHUNK_SIZE = 10000
+
+DEFAULT_PROOF_CHUNK_SIZE = 10000
+
+
+class RewardLedger:
+    """
+    Accrues the rewards of every holder from a stream of transfers.
+    """
+
+    def __init__(self):
+        # Holder to [balance, timestamp of last transfer, accrued token-seconds]
+        self.holders = {}
+        self.last_timestamp = 0
+
+    def _checkpoint(self, holder, timestamp):
+        entry = self.holders.setdefault(holder, [0, timestamp, 0])
+        entry[2] += entry[0] * (timestamp - entry[1])
+        entry[1] = timestamp
+        return entry
+
+    def apply(self, timestamp, sender, receiver):
+        """
+        Apply a transfer of one NFT from `sender` to `receiver` at `timestamp`. Mints
+        are sent from, and burns are sent to, the zero address.
+        """
+        if timestamp < self.last_timestamp:
+            raise ValueError("Transfers must be applied in block order")
+
+        self.last_timestamp = timestamp
+        if sender != ZERO_ADDRESS:
+            self._checkpoint(sender, timestamp)[0] -= 1
+
+        if receiver != ZERO_ADDRESS:
+            self._checkpoint(receiver, timestamp)[0] += 1
+
+    def amounts(self, timestamp):
+        """
+        Yield `(holder, amount)` for every holder with rewards accrued up to `timestamp`,
+        in wei of the reward token.
+        """
+        if timestamp < self.last_timestamp:
+            raise ValueError("Timestamp is before the last transfer")
+
+        for holder, (balance, last_update, accrued) in self.holders.items():
+            amount = (accrued + balance * (timestamp - last_update)) * REWARD_PER_SECOND
+            if amount != 0:
+                yield holder, amount
+
+
+def iter_transfers(
+    contract, start_block, stop_block, chunk_size=DEFAULT_BLOCK_CHUNK_SIZE
+):
+    """
+    Yield `(timestamp, sender, receiver)` for each `Transfer` event of `contract` from
+    `start_block` up to and including `stop_block`, querying `chunk_size` blocks at a time.
+    """
+    blocks = contract.chain_manager.blocks
+    for start in range(start_block, stop_block + 1, chunk_size):
+        stop = min(start + chunk_size, stop_block + 1)
+
+        # Timestamps are cached for the blocks of a chunk only
+        timestamps = {}
+        for log in contract.Transfer.range(start, stop):
+            if log.block_number not in timestamps:
+                timestamps[log.block_number] = blocks[log.block_number].timestamp
+
+            args = log.event_arguments
+            yield timestamps[log.block_number], args["sender"], args["receiver"]
+
+
+def leaf(holder, amount):
+    """
+    Returns the leaf of `(holder, amount)`, as computed by `reward_distributor.vy`.
+    """
+    return keccak(keccak(encode(["address", "uint256"], [holder, amount])))
+
+
+def hash_pair(a, b):
+    return keccak(a + b) if a <= b else keccak(b + a)
+
+
+class MerkleTree:
+    """
+    Merkle tree of `(holder, amount)` claims.
+    """
+
+    def __init__(self, claims):
+        self.claims = list(claims)
+        if not self.claims:
+            raise ValueError("No claims")
+
+        self.index = {holder: i for i, (holder, _) in enumerate(self.claims)}
+
+        size = 1 << (len(self.claims) - 1).bit_length()
+        if size.bit_length() - 1 > MAX_PROOF_LENGTH:
+            raise ValueError("Too many claims")
+
+        level = [leaf(holder, amount) for holder, amount in self.claims]
+        level += [EMPTY_LEAF] * (size - len(level))
+
+        # Each level as an array of shape (nodes, 32), from the leaves up to the root
+        self.levels = []
+        while len(level) > 1:
+            self.levels.append(_to_array(level))
+            level = [hash_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+
+        self.root = level[0]
+
+    def proofs(self, indexes):
+        """
+        Returns the proofs of the leaves at `indexes`, as an array of shape
+        (len(indexes), depth, 32).
+        """
+        indexes = np.asarray(indexes, dtype=np.int64)
+        proofs = np.empty((len(indexes), len(self.levels), 32), dtype=np.uint8)
+        for depth, nodes in enumerate(self.levels):
+            proofs[:, depth] = nodes[(indexes >> depth) ^ 1]
+
+        return proofs
+
+    def proof(self, holder):
+        """
+        Returns the proof of the claim of `holder`, as a list of 32-byte nodes.
+        """
+        return [bytes(node) for node in self.proofs([self.index[holder]])[0]]
+
+    def iter_proofs(self, chunk_size=DEFAULT_PROOF_CHUNK_SIZE):
+        """
+        Yield `(holder, amount, proof)` for every claim, gathering the proofs of
+        `chunk_size` claims at a time.
+        """
+        for start in range(0, len(self.claims), chunk_size):
+            end = min(start + chunk_size, len(self.claims))
+            proofs = self.proofs(range(start, end))
+            for (holder, amount), proof in zip(self.claims[start:end], proofs):
+                yield holder, amount, [bytes(node) for node in proof]
+
+
+def _to_array(nodes):
+    return np.frombuffer(b"".join(nodes), dtype=np.uint8).reshape(-1, 32)
+
+
+def write_claims(path, tree, chunk_size=DEFAULT_PROOF_CHUNK_SIZE):
+    """
+    Write the root of `tree`, then a line per claim with its holder, amount and proof,
+    as JSONL. Returns the number of claims written.
+    """
+    count = 0
+    with open(path, "w") as f:
+        f.write(json.dumps({"root": "0x" + tree.root.hex()}) + "\n")
+        for holder, amount, proof in tree.iter_proofs(chunk_size):
+            row = {
+                "holder": holder,
+                "amount": str(amount),
+                "proof": ["0x" + node.hex() for node in proof],
+            }
+            f.write(json.dumps(row) + "\n")
+            count += 1
+
+    return count
@@ -0,0 +1,115 @@
+"""
+Batch view calls into a single `eth_call` through `contracts/Multicall.vy`.
+
+    multicall = Multicall(project.Multicall.at(address))
+    multicall.add(erc721, "ownerOf", 1)
+    multicall.add(erc721, "tokenURI", 1)
+    multicall.add(ntt, "isValid", 1)
+    owner, uri, is_valid = multicall()
+
+Calls are sent in batches of up to `MAX_CALLS`, so a list of any length is read in
+`ceil(len / MAX_CALLS)` calls. The return data of each call is decoded with the ABI of
+the method that was added. Return data is truncated to 256 bytes by the contract, so
+methods with larger outputs, such as the bulk view functions, should be called directly.
+"""
+
+from eth_abi import decode
+
+# @dev Matches `MAX_CALLS` in `Multicall.vy`
+MAX_CALLS = 256
+
+# @dev Output types of `Multicall.aggregate`
+AGGREGATE_OUTPUT_TYPES = ["uint256", "(bool,bytes)[]"]
+
+
+class MulticallError(Exception):
+    """
+    Raised when a call in a batch fails and failures are not allowed.
+    """
+
+
+def _select_abi(handler, args):
+    abis = [abi for abi in handler.abis if len(abi.inputs) == len(args)]
+    if len(abis) != 1:
+        raise ValueError(
+            f"Unable to select a method ABI of {handler} for {len(args)} arguments"
+        )
+
+    return abis[0]
+
+
+class Multicall:
+    """
+    Collects view calls against any contracts and reads them in a single `eth_call`.
+    """
+
+    def __init__(self, multicall, batch_size=MAX_CALLS):
+        if not 0 < batch_size <= MAX_CALLS:
+            raise ValueError(f"batch_size must be between 1 and {MAX_CALLS}")
+
+        self.multicall = multicall
+        self.batch_size = batch_size
+        self.calls = []
+        self.block_number = None
+
+    def __len__(self):
+        return len(self.calls)
+
+    def add(self, contract, method, *args):
+        """
+        Add a call of `method` on `contract` with `args`. Returns the index of its result.
+        """
+        handler = getattr(contract, method)
+        abi = _select_abi(handler, args)
+        self.calls.append((contract.address, handler.encode_input(*args), abi))
+        return len(self.calls) - 1
+
+    def _aggregate(self, batch):
+        """
+        Returns the block number and the `(success, return data)` of each call in `batch`.
+        """
+        calldata = self.multicall.aggregate.encode_input(
+            [(target, calldata) for target, calldata, _ in batch]
+        )
+        provider = self.multicall.provider
+        txn = provider.network.ecosystem.create_transaction(
+            receiver=self.multicall.address, data=calldata, chain_id=provider.chain_id
+        )
+
+        # Decoded with eth_abi, as ape does not decode an array of structs in a tuple
+        return decode(AGGREGATE_OUTPUT_TYPES, provider.send_call(txn))
+
+    def _decode(self, abi, return_data):
+        output = self.multicall.provider.network.ecosystem.decode_returndata(
+            abi, return_data
+        )
+        if isinstance(output, (list, tuple)) and len(output) == 1:
+            return output[0]
+
+        return output
+
+    def __call__(self, allow_failure=False):
+        """
+        Make all added calls and returns their decoded results, in the order they were
+        added. The block number of the last batch is stored in `block_number`.
+
+        A failed call raises a MulticallError, unless `allow_failure` is set, in which
+        case its result is None.
+        """
+        results = []
+        for start in range(0, len(self.calls), self.batch_size):
+            end = start + self.batch_size
+            batch = self.calls[start:end]
+            self.block_number, responses = self._aggregate(batch)
+
+            for (target, calldata, abi), (success, return_data) in zip(
+                batch, responses
+            ):
+                if success:
+                    results.append(self._decode(abi, return_data))
+                elif allow_failure:
+                    results.append(None)
+                else:
+                    raise MulticallError(f"Call of {abi.name} on {target} failed")
+
+        return results
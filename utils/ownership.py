@@ -0,0 +1,305 @@
+"""
+Materialize point-in-time ownership of an ERC721 from its `Transfer` events.
+
+    snapshot = OwnershipSnapshot()
+    snapshot.sync(erc721)
+
+    snapshot.owner_of(1, block_number)
+    snapshot.balances_at(block_number)
+
+Works with any contract that emits `Transfer(sender, receiver, tokenId)` for mints,
+transfers and burns, such as `ERC721.vy`, `timed_ERC721.vy` and `timer.vy`.
+
+The current owner of every token is kept in an array indexed by token ID, with holders
+interned to integer IDs. Each transfer appends a delta of its block number, token ID,
+and previous and new holder to four flat arrays, instead of keeping the state of every
+block, and a copy of the owners array is kept every `snapshot_interval` deltas. The
+owners at block N are rebuilt from the nearest copy before N by applying at most
+`snapshot_interval` deltas, so a query costs time in the number of tokens and holders
+and not in the length of the history.
+
+`sync` checks the hashes of the most recent blocks it has seen against the chain before
+indexing new blocks. On a reorg, it rolls back the deltas of the blocks after the last
+common block and indexes the new blocks from there.
+"""
+
+from array import array
+from collections import deque
+
+import numpy as np
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+DEFAULT_SNAPSHOT_INTERVAL = 65536
+
+DEFAULT_MAX_REORG_DEPTH = 64
+
+DEFAULT_BLOCK_CHUNK_SIZE = 10000
+
+
+def _to_hash(block_hash):
+    if isinstance(block_hash, str):
+        return bytes.fromhex(block_hash.removeprefix("0x"))
+
+    return bytes(block_hash)
+
+
+class ReorgTooDeep(Exception):
+    """
+    Raised when none of the recent blocks that were seen are on the chain anymore.
+    """
+
+
+class OwnershipSnapshot:
+    """
+    Ownership of the tokens of one contract at every block that has been applied.
+    """
+
+    def __init__(
+        self,
+        snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL,
+        max_reorg_depth=DEFAULT_MAX_REORG_DEPTH,
+    ):
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
+
+        self.snapshot_interval = snapshot_interval
+
+        # Holder 0 is the zero address, the owner of tokens that are not minted or burnt
+        self.holders = [ZERO_ADDRESS]
+        self.holder_ids = {ZERO_ADDRESS: 0}
+
+        # Current holder of each token ID
+        self.owners = np.zeros(1024, dtype=np.uint32)
+        self.token_count = 0
+
+        # Deltas, in the order they were applied
+        self.delta_blocks = array("q")
+        self.delta_tokens = array("I")
+        self.delta_previous = array("I")
+        self.delta_new = array("I")
+
+        # Copy of the owners before delta `i * snapshot_interval`, at index `i`
+        self.snapshots = [np.zeros(0, dtype=np.uint32)]
+
+        # Last block applied, and `(block number, hash)` of the most recent blocks seen
+        self.block_number = -1
+        self.recent_blocks = deque(maxlen=max_reorg_depth)
+
+    def __len__(self):
+        return len(self.delta_blocks)
+
+    @property
+    def nbytes(self):
+        """
+        Returns the memory used by the owners, the deltas and the snapshots, in bytes,
+        excluding the interned holder addresses.
+        """
+        deltas = (
+            self.delta_blocks,
+            self.delta_tokens,
+            self.delta_previous,
+            self.delta_new,
+        )
+        return (
+            self.owners.nbytes
+            + sum(len(a) * a.itemsize for a in deltas)
+            + sum(s.nbytes for s in self.snapshots)
+        )
+
+    def _holder_id(self, address):
+        holder_id = self.holder_ids.get(address)
+        if holder_id is None:
+            holder_id = len(self.holders)
+            self.holder_ids[address] = holder_id
+            self.holders.append(address)
+
+        return holder_id
+
+    def apply_block(self, block_number, block_hash, transfers):
+        """
+        Apply the `(sender, receiver, token_id)` transfers of a block, in the order they
+        were emitted. Blocks must be applied in order, and each block at most once.
+        """
+        if block_number <= self.block_number:
+            raise ValueError(f"Block {block_number} is already applied")
+
+        for _, receiver, token_id in transfers:
+            if token_id >= len(self.owners):
+                size = max(2 * len(self.owners), token_id + 1)
+                self.owners = np.concatenate(
+                    (self.owners, np.zeros(size - len(self.owners), dtype=np.uint32))
+                )
+
+            if len(self.delta_blocks) == len(self.snapshots) * self.snapshot_interval:
+                self.snapshots.append(self.owners[: self.token_count].copy())
+
+            holder_id = self._holder_id(receiver)
+            self.delta_blocks.append(block_number)
+            self.delta_tokens.append(token_id)
+            self.delta_previous.append(int(self.owners[token_id]))
+            self.delta_new.append(holder_id)
+            self.owners[token_id] = holder_id
+            self.token_count = max(self.token_count, token_id + 1)
+
+        self.block_number = block_number
+        self.recent_blocks.append((block_number, _to_hash(block_hash)))
+
+    def _delta_count(self, block_number):
+        """
+        Returns the number of deltas of the blocks up to and including `block_number`.
+        """
+        blocks = np.frombuffer(self.delta_blocks, dtype=np.int64)
+        return int(np.searchsorted(blocks, block_number, side="right"))
+
+    def rollback(self, block_number):
+        """
+        Undo the deltas of the blocks after `block_number`.
+        """
+        end = self._delta_count(block_number)
+        if end < len(self.delta_blocks):
+            tokens = np.frombuffer(self.delta_tokens, dtype=np.uint32)[end:]
+            previous = np.frombuffer(self.delta_previous, dtype=np.uint32)[end:]
+
+            # The previous holder of the first delta of a token is its owner at the block
+            token_ids, first = np.unique(tokens, return_index=True)
+            self.owners[token_ids] = previous[first]
+
+            # The arrays can not be resized while they are viewed
+            del tokens, previous
+            for deltas in (
+                self.delta_blocks,
+                self.delta_tokens,
+                self.delta_previous,
+                self.delta_new,
+            ):
+                del deltas[end:]
+
+            kept = end // self.snapshot_interval + 1
+            del self.snapshots[kept:]
+
+        self.block_number = min(self.block_number, block_number)
+        while self.recent_blocks and self.recent_blocks[-1][0] > block_number:
+            self.recent_blocks.pop()
+
+    def owners_at(self, block_number):
+        """
+        Returns an array of the holder ID of the owner of each token ID at
+        `block_number`, with 0 for tokens that are not minted or burnt.
+        """
+        if block_number > self.block_number:
+            raise ValueError(f"Block {block_number} is not applied yet")
+
+        end = self._delta_count(block_number)
+        if end == len(self.delta_blocks):
+            return self.owners[: self.token_count].copy()
+
+        index = end // self.snapshot_interval
+        start = index * self.snapshot_interval
+        base = self.snapshots[index]
+        owners = np.zeros(self.token_count, dtype=np.uint32)
+        owners[: len(base)] = base
+
+        # The new holder of the last delta of a token is its owner at the block
+        tokens = np.frombuffer(self.delta_tokens, dtype=np.uint32)[start:end][::-1]
+        new = np.frombuffer(self.delta_new, dtype=np.uint32)[start:end][::-1]
+        token_ids, last = np.unique(tokens, return_index=True)
+        owners[token_ids] = new[last]
+        return owners
+
+    def owner_of(self, token_id, block_number):
+        """
+        Returns the owner of `token_id` at `block_number`, or the zero address if it was
+        not minted or was burnt.
+        """
+        if block_number > self.block_number:
+            raise ValueError(f"Block {block_number} is not applied yet")
+
+        if token_id >= self.token_count:
+            return ZERO_ADDRESS
+
+        end = self._delta_count(block_number)
+        if end == len(self.delta_blocks):
+            return self.holders[self.owners[token_id]]
+
+        index = end // self.snapshot_interval
+        start = index * self.snapshot_interval
+        base = self.snapshots[index]
+        holder_id = base[token_id] if token_id < len(base) else 0
+
+        # The new holder of the last delta of the token since the snapshot
+        tokens = np.frombuffer(self.delta_tokens, dtype=np.uint32)[start:end]
+        matches = np.flatnonzero(tokens == token_id)
+        if len(matches) != 0:
+            holder_id = self.delta_new[start + matches[-1]]
+
+        return self.holders[holder_id]
+
+    def balances_at(self, block_number):
+        """
+        Returns a dict of the number of tokens of each holder at `block_number`.
+        """
+        owners = self.owners_at(block_number)
+        counts = np.bincount(owners, minlength=len(self.holders))
+        holder_ids = np.flatnonzero(counts[1:]) + 1
+        return {self.holders[i]: int(counts[i]) for i in holder_ids}
+
+    def _find_fork(self, blocks):
+        """
+        Returns the most recent block seen that is still on the chain, or None if the
+        last block seen is on the chain.
+        """
+        height = blocks.height
+        for i, (block_number, block_hash) in enumerate(reversed(self.recent_blocks)):
+            if (
+                block_number <= height
+                and _to_hash(blocks[block_number].hash) == block_hash
+            ):
+                return None if i == 0 else block_number
+
+        if self.recent_blocks:
+            raise ReorgTooDeep(
+                f"No block seen since block {self.recent_blocks[0][0]} is on the chain"
+            )
+
+        return None
+
+    def sync(self, contract, stop_block=None, chunk_size=DEFAULT_BLOCK_CHUNK_SIZE):
+        """
+        Apply the `Transfer` events of `contract` from the block after the last block
+        applied up to `stop_block` (the head of the chain by default), rolling back any
+        blocks that were reorged out first. Returns the number of transfers applied.
+        """
+        blocks = contract.chain_manager.blocks
+        fork = self._find_fork(blocks)
+        if fork is not None:
+            self.rollback(fork)
+
+        if stop_block is None:
+            stop_block = blocks.height
+
+        count = 0
+        for start in range(self.block_number + 1, stop_block + 1, chunk_size):
+            stop = min(start + chunk_size, stop_block + 1)
+
+            block_number, block_hash, transfers = None, None, []
+            for log in contract.Transfer.range(start, stop):
+                if log.block_number != block_number and transfers:
+                    self.apply_block(block_number, block_hash, transfers)
+                    count += len(transfers)
+                    transfers = []
+
+                block_number, block_hash = log.block_number, log.block_hash
+                args = log.event_arguments
+                transfers.append((args["sender"], args["receiver"], args["tokenId"]))
+
+            if transfers:
+                self.apply_block(block_number, block_hash, transfers)
+                count += len(transfers)
+
+        # Record the last block, so that a reorg of blocks without transfers is detected
+        if stop_block > self.block_number:
+            self.block_number = stop_block
+            self.recent_blocks.append((stop_block, _to_hash(blocks[stop_block].hash)))
+
+        return count
@@ -0,0 +1,331 @@
+"""
+Sign EIP-712 messages for `EIP4494.vy` and `plain_EIP712.vy` offline, in parallel.
+
+    SIGNER_PRIVATE_KEY=0x... python -m utils.signing EIP4494 permits.csv signatures.csv \
+        --contract 0x... --chain-id 1
+
+The domain separator and type hash are computed once, and each message is signed by
+hashing its fields directly, without building an `EIP712Message` per message. Input rows
+are read from a CSV or JSONL file (by extension) with a column per message field:
+`spender`, `tokenId`, `nonce` and `deadline` for a Permit, and `sms` for a Message.
+
+Rows are signed in chunks across a process pool, with a bounded number of chunks in
+flight, and written out in input order as they are signed, so memory stays flat
+regardless of the size of the input. The output has the message fields and the
+`signature`, encoded as r, s and v, or with `--compact` as the 64-byte r and vs of an
+EIP-2098 compact signature, for `permitCompact` and `messageCompact`.
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from itertools import islice
+from pathlib import Path
+
+from eth_abi import encode
+from eth_keys import keys
+from eth_utils import decode_hex, keccak
+
+DOMAIN_TYPE_HASH = keccak(
+    text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+
+# @dev EIP-712 domain name and version, type string and fields of each message,
+#      matching the contracts
+MESSAGE_TYPES = {
+    "EIP4494": {
+        "name": "Vyper EIP4494",
+        "version": "1.0.0",
+        "type": "Permit(address spender,uint256 tokenId,uint256 nonce,uint256 deadline)",
+        "fields": (
+            ("spender", "address"),
+            ("tokenId", "uint256"),
+            ("nonce", "uint256"),
+            ("deadline", "uint256"),
+        ),
+    },
+    "plain_EIP712": {
+        "name": "Plain",
+        "version": "1.0.0",
+        "type": "Message(uint256 sms)",
+        "fields": (("sms", "uint256"),),
+    },
+}
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# @dev Signing state of a worker process, set once by `_init_worker`
+_worker = {}
+
+
+def domain_separator(kind, chain_id, verifying_contract):
+    """
+    Returns the EIP-712 domain separator of the contract for `kind` of message.
+    """
+    message_type = MESSAGE_TYPES[kind]
+    return keccak(
+        encode(
+            ["bytes32", "bytes32", "bytes32", "uint256", "address"],
+            [
+                DOMAIN_TYPE_HASH,
+                keccak(text=message_type["name"]),
+                keccak(text=message_type["version"]),
+                chain_id,
+                verifying_contract,
+            ],
+        )
+    )
+
+
+def _parse_field(abi_type, value):
+    if abi_type == "uint256" and isinstance(value, str):
+        return int(value, 0)
+
+    return value
+
+
+def digest(kind, separator, row, type_hash=None):
+    """
+    Returns the EIP-712 digest of a message of `kind` with the fields in `row`.
+    """
+    message_type = MESSAGE_TYPES[kind]
+    if type_hash is None:
+        type_hash = keccak(text=message_type["type"])
+
+    types = [abi_type for _, abi_type in message_type["fields"]]
+    values = [
+        _parse_field(abi_type, row[name]) for name, abi_type in message_type["fields"]
+    ]
+    struct_hash = keccak(type_hash + encode(types, values))
+    return keccak(b"\x19\x01" + separator + struct_hash)
+
+
+def to_compact(signature):
+    """
+    Returns the 64-byte EIP-2098 compact form of a 65-byte signature encoded as r, s and
+    v, which is r followed by s with the parity of v in its highest bit.
+    """
+    v = signature[64]
+    vs = int.from_bytes(signature[32:64], "big") | (v - 27 if v >= 27 else v) << 255
+    return signature[:32] + vs.to_bytes(32, "big")
+
+
+def sign_digest(private_key, message_digest, compact=False):
+    """
+    Returns the 65-byte signature of a digest, encoded as r, s and v, or its 64-byte
+    compact form if `compact` is set.
+    """
+    signature = private_key.sign_msg_hash(message_digest)
+    encoded = (
+        signature.r.to_bytes(32, "big")
+        + signature.s.to_bytes(32, "big")
+        + (signature.v + 27).to_bytes(1, "big")
+    )
+    return to_compact(encoded) if compact else encoded
+
+
+def _init_worker(private_key, kind, separator, compact):
+    if isinstance(private_key, str):
+        private_key = decode_hex(private_key)
+
+    _worker["private_key"] = keys.PrivateKey(private_key)
+    _worker["kind"] = kind
+    _worker["separator"] = separator
+    _worker["compact"] = compact
+    _worker["type_hash"] = keccak(text=MESSAGE_TYPES[kind]["type"])
+
+
+def _sign_chunk(rows):
+    fields = [name for name, _ in MESSAGE_TYPES[_worker["kind"]]["fields"]]
+    signed = []
+    for row in rows:
+        message_digest = digest(
+            _worker["kind"], _worker["separator"], row, _worker["type_hash"]
+        )
+        signature = sign_digest(
+            _worker["private_key"], message_digest, _worker["compact"]
+        )
+        signed.append({**{name: row[name] for name in fields}, "signature": signature})
+
+    return signed
+
+
+def _chunks(rows, chunk_size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def sign_rows(
+    private_key,
+    kind,
+    separator,
+    rows,
+    processes=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    compact=False,
+):
+    """
+    Yield the signed rows of `rows`, in order. `private_key` is the key of the signer,
+    as bytes or a hex string. Signatures are in compact form if `compact` is set.
+
+    Rows are signed in chunks of `chunk_size` across `processes` workers (all CPUs by
+    default), with at most two chunks per worker in flight.
+    """
+    if kind not in MESSAGE_TYPES:
+        raise ValueError(f"Unknown message type: {kind}")
+
+    processes = processes or os.cpu_count()
+    with multiprocessing.Pool(
+        processes,
+        initializer=_init_worker,
+        initargs=(private_key, kind, separator, compact),
+    ) as pool:
+        pending = deque()
+        for chunk in _chunks(rows, chunk_size):
+            pending.append(pool.apply_async(_sign_chunk, (chunk,)))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().get()
+
+        while pending:
+            yield from pending.popleft().get()
+
+
+def read_rows(path):
+    """
+    Yield the rows of a CSV or JSONL file as dicts.
+    """
+    path = Path(path)
+    with open(path, newline="") as f:
+        if path.suffix == ".csv":
+            yield from csv.DictReader(f)
+        elif path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            raise ValueError(f"Unsupported input format: {path.suffix}")
+
+
+def write_rows(path, rows):
+    """
+    Write rows to a CSV or JSONL file as they are yielded, with signatures as hex
+    strings. Returns the number of rows written.
+    """
+    path = Path(path)
+    if path.suffix not in (".csv", ".jsonl"):
+        raise ValueError(f"Unsupported output format: {path.suffix}")
+
+    count = 0
+    with open(path, "w", newline="") as f:
+        writer = None
+        for row in rows:
+            row = {**row, "signature": "0x" + row["signature"].hex()}
+            if path.suffix == ".jsonl":
+                f.write(json.dumps(row) + "\n")
+            else:
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+
+            count += 1
+
+    return count
+
+
+def _report(rows, every, start, out):
+    """
+    Pass rows through, printing the signing rate to `out` every `every` rows.
+    """
+    for count, row in enumerate(rows, start=1):
+        yield row
+        if count % every == 0:
+            elapsed = time.perf_counter() - start
+            print(f"{count} signed, {count / elapsed:.0f} signatures/s", file=out)
+
+
+def sign_file(
+    input_path,
+    output_path,
+    private_key,
+    kind,
+    chain_id,
+    verifying_contract,
+    processes=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    report_every=None,
+    compact=False,
+    out=sys.stderr,
+):
+    """
+    Sign every row of `input_path` and write the signed rows to `output_path`.
+    Returns the number of rows signed and the elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    separator = domain_separator(kind, chain_id, verifying_contract)
+    rows = sign_rows(
+        private_key,
+        kind,
+        separator,
+        read_rows(input_path),
+        processes=processes,
+        chunk_size=chunk_size,
+        compact=compact,
+    )
+    if report_every:
+        rows = _report(rows, report_every, start, out)
+
+    count = write_rows(output_path, rows)
+    return count, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.signing",
+        description="Sign EIP-712 messages offline. The private key of the signer is "
+        "read from SIGNER_PRIVATE_KEY.",
+    )
+    parser.add_argument("kind", choices=sorted(MESSAGE_TYPES))
+    parser.add_argument("input", help="CSV or JSONL file of messages")
+    parser.add_argument("output", help="CSV or JSONL file to write signatures to")
+    parser.add_argument("--contract", required=True, help="Verifying contract")
+    parser.add_argument("--chain-id", type=int, required=True)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--report-every", type=int, default=100000)
+    parser.add_argument(
+        "--compact", action="store_true", help="Write EIP-2098 compact signatures"
+    )
+    args = parser.parse_args(argv)
+
+    private_key = os.environ.get("SIGNER_PRIVATE_KEY")
+    if not private_key:
+        parser.error("SIGNER_PRIVATE_KEY is not set")
+
+    count, elapsed = sign_file(
+        args.input,
+        args.output,
+        private_key,
+        args.kind,
+        args.chain_id,
+        args.contract,
+        processes=args.processes,
+        chunk_size=args.chunk_size,
+        report_every=args.report_every,
+        compact=args.compact,
+    )
+    rate = count / elapsed if elapsed else 0
+    print(
+        f"Signed {count} messages in {elapsed:.1f}s ({rate:.0f} signatures/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
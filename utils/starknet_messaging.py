@@ -0,0 +1,205 @@
+"""
+Simulate the Starknet side of `Bridge.vy` on the local chain, with `MockStarknetCore.vy`
+in place of the Starknet core contract.
+
+    core = project.MockStarknetCore.deploy(sender=operator)
+    bridge = project.Bridge.deploy(token, core, sender=operator)
+    l2 = L2Bridge(core, L2_CONTRACT_ADDRESS, bridge)
+
+    bridge.deposit(L2_CONTRACT_ADDRESS, user, amount, sender=account)
+    l2.poll()
+    l2.withdraw(user, account.address, amount)
+    l2.update_state(sender=operator)
+    bridge.withdraw(L2_CONTRACT_ADDRESS, user, amount, sender=account)
+
+`L2Bridge` keeps the balances of `l1l2.cairo` in memory. `poll` handles the messages sent
+to it through `sendMessageToL2` since the last poll, as the `deposit` and `deposit_batch`
+L1 handlers do, and `withdraw` sends a withdrawal message to L1, as the `withdraw`
+function does. Like Starknet, neither is seen on L1 until a state update: `update_state`
+consumes the handled messages to L2 and sends the messages to L1 with `mockUpdateState`,
+after which the withdrawals can be made on L1 with `consumeMessageFromL2`.
+
+A message that an L1 handler rejects is left pending, as on Starknet.
+"""
+
+from collections import defaultdict
+
+from eth_utils import keccak, to_checksum_address
+
+# @dev Selectors of the `deposit` and `deposit_batch` L1 handlers of `l1l2.cairo`, as in
+# `Bridge.vy`
+DEPOSIT_SELECTOR = (
+    352040181584456735608515580760888541466059565068553383579463728554843487745
+)
+DEPOSIT_BATCH_SELECTOR = (
+    1389472725367045055775894311058896868291301291094778976937293337825976292778
+)
+
+MESSAGE_WITHDRAW = 0
+
+# Number of message hashes of each kind in a call to `mockUpdateState`
+MAX_MESSAGES = 256
+
+# Largest value of a field element of Starknet
+FIELD_PRIME = 2**251 + 17 * 2**192 + 1
+
+
+def _address(account):
+    """
+    Returns the checksummed address of a contract, an account or an address.
+    """
+    return to_checksum_address(getattr(account, "address", account))
+
+
+def _pack(*words):
+    return b"".join(word.to_bytes(32, "big") for word in words)
+
+
+def message_to_l2_hash(from_address, to_address, nonce, selector, payload):
+    """
+    Returns the hash of a message sent by the L1 contract at `from_address`, as computed
+    by `sendMessageToL2`.
+    """
+    from_address = int(_address(from_address), 16)
+    return keccak(
+        _pack(from_address, to_address, nonce, selector, len(payload), *payload)
+    )
+
+
+def message_to_l1_hash(from_address, to_address, payload):
+    """
+    Returns the hash of a message sent to the L1 contract at `to_address`, as computed
+    by `consumeMessageFromL2`.
+    """
+    to_address = int(_address(to_address), 16)
+    return keccak(_pack(from_address, to_address, len(payload), *payload))
+
+
+class L2Bridge:
+    """
+    Simulated `l1l2.cairo` at `l2_address`, which accepts deposits from the L1 bridge at
+    `l1_address` through the core contract `core`. Messages are polled from the block
+    after the current head, or from `start_block`.
+    """
+
+    def __init__(self, core, l2_address, l1_address, start_block=None):
+        self.core = core
+        self.l2_address = l2_address
+        self.l1_address = _address(l1_address)
+        self.balances = defaultdict(int)
+
+        if start_block is None:
+            start_block = core.chain_manager.blocks.height + 1
+        self.next_block = start_block
+
+        # Hashes of the messages to L2 handled, and of the messages to L1 sent, since
+        # the last state update
+        self.consumed_messages = []
+        self.sent_messages = []
+
+        self.handlers = {
+            DEPOSIT_SELECTOR: self._on_deposit,
+            DEPOSIT_BATCH_SELECTOR: self._on_deposit_batch,
+        }
+
+    def _deposit_all(self, from_address, deposits):
+        if from_address != self.l1_address:
+            raise ValueError(f"Deposit from unknown L1 contract {from_address}")
+
+        # Checked before any balance changes, as a failed L1 handler changes nothing
+        new_balances = {}
+        for user, amount in deposits:
+            new_balances[user] = (
+                new_balances.get(user, self.balances.get(user, 0)) + amount
+            )
+            if new_balances[user] >= FIELD_PRIME:
+                raise ValueError("Balance overflows a field element")
+
+        self.balances.update(new_balances)
+
+    def _on_deposit(self, from_address, payload):
+        user, amount = payload
+        self._deposit_all(from_address, [(user, amount)])
+
+    def _on_deposit_batch(self, from_address, payload):
+        count, *deposits = payload
+        if len(deposits) != 2 * count:
+            raise ValueError("Invalid batch payload")
+
+        self._deposit_all(from_address, zip(deposits[::2], deposits[1::2]))
+
+    def poll(self, stop_block=None):
+        """
+        Handle the messages to the contract up to `stop_block` inclusive (the head of
+        the chain by default). Returns the number of messages handled.
+        """
+        if stop_block is None:
+            stop_block = self.core.chain_manager.blocks.height
+        if stop_block < self.next_block:
+            return 0
+
+        logs = self.core.LogMessageToL2.range(
+            self.next_block,
+            stop_block + 1,
+            search_topics={"to_address": self.l2_address},
+        )
+
+        count = 0
+        for log in logs:
+            args = log.event_arguments
+            handler = self.handlers.get(args["selector"])
+            if handler is None:
+                continue
+
+            try:
+                handler(args["from_address"], args["payload"])
+            except ValueError:
+                continue
+
+            self.consumed_messages.append(
+                message_to_l2_hash(
+                    args["from_address"],
+                    self.l2_address,
+                    args["nonce"],
+                    args["selector"],
+                    args["payload"],
+                )
+            )
+            count += 1
+
+        self.next_block = stop_block + 1
+        return count
+
+    def withdraw(self, user, user_l1_address, amount):
+        """
+        Withdraw `amount` from the balance of `user`, and send a message to the L1
+        bridge to release it to `user_l1_address`. Returns the hash of the message.
+        """
+        if amount < 0:
+            raise ValueError("Amount is negative")
+        if self.balances[user] < amount:
+            raise ValueError("Amount exceeds balance")
+
+        self.balances[user] -= amount
+
+        payload = [MESSAGE_WITHDRAW, user, int(_address(user_l1_address), 16), amount]
+        message_hash = message_to_l1_hash(self.l2_address, self.l1_address, payload)
+        self.sent_messages.append(message_hash)
+        return message_hash
+
+    def update_state(self, sender):
+        """
+        Submit the messages handled and sent since the last state update to the core
+        contract, in calls of up to `MAX_MESSAGES` hashes of each kind. Returns the
+        receipts.
+        """
+        receipts = []
+        while self.consumed_messages or self.sent_messages:
+            consumed = self.consumed_messages[:MAX_MESSAGES]
+            sent = self.sent_messages[:MAX_MESSAGES]
+            receipts.append(self.core.mockUpdateState(consumed, sent, sender=sender))
+
+            del self.consumed_messages[:MAX_MESSAGES]
+            del self.sent_messages[:MAX_MESSAGES]
+
+        return receipts